@@ -1,3 +1,5 @@
+from .hz import HzApp
 from .inspect import InspectApp
+from .qos_check import QoSCheckApp
 
-__all__ = ["InspectApp"]
+__all__ = ["HzApp", "InspectApp", "QoSCheckApp"]
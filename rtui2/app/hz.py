@@ -0,0 +1,251 @@
+from __future__ import annotations
+
+import asyncio
+import math
+from contextlib import suppress
+from dataclasses import dataclass
+from fnmatch import fnmatchcase
+from threading import Lock
+from typing import Callable
+
+from rich.text import Text
+from textual.app import App, ComposeResult
+from textual.binding import Binding
+from textual.widgets import DataTable, Footer
+from textual.worker import Worker, get_current_worker
+
+from ..event import RosGraphChanged
+from ..ros import RosClient
+from ..utility.rate import RateTable, format_bytes
+
+TABLE_UPDATE_INTERVAL = 1.0
+
+COLUMNS = [
+    ("topic", "Topic"),
+    ("type", "Type"),
+    ("hz", "Rate (Hz)"),
+    ("max_period", "Max period (s)"),
+    ("bandwidth", "Bandwidth"),
+    ("status", "Status"),
+]
+
+
+@dataclass(frozen=True, order=True)
+class SortableCell:
+    """Cell rendered from markup but sorted by ``value``."""
+
+    value: float
+    markup: str
+
+    def __rich__(self) -> Text:
+        return Text.from_markup(self.markup)
+
+
+def _number_cell(value: float, format: Callable[[float], str]) -> SortableCell:
+    if math.isnan(value):
+        return SortableCell(-1.0, "[dim]-[/]")
+    return SortableCell(value, format(value))
+
+
+def _status_cell(hz: float, min_hz: float | None) -> SortableCell:
+    if math.isnan(hz):
+        return SortableCell(0, "[b][red]NO DATA[/][/]")
+    elif min_hz is not None and hz < min_hz:
+        return SortableCell(1, "[b][yellow]SLOW[/][/]")
+    else:
+        return SortableCell(2, "[green]OK[/]")
+
+
+class HzApp(App[None]):
+    """
+    Receive rate of every topic matching the given patterns. All topics are
+    subscribed raw, so no message is ever deserialized, and their receive
+    times share one RateTable.
+    """
+
+    _ros: RosClient
+    _patterns: tuple[str, ...]
+    _min_hz: float | None
+    _table: DataTable[SortableCell | str]
+    _rates: RateTable
+    _rows: dict[str, int]
+    _cells: dict[tuple[str, str], SortableCell]
+    _unsubscribers: list[Callable[[], None]]
+    _sync_lock: Lock
+    _unmounted: bool = False
+    _sort_column: str = "topic"
+    _sort_reverse: bool = False
+    _event_loop: asyncio.AbstractEventLoop | None = None
+
+    TITLE = "ROS Topic Rates"
+    BINDINGS = [
+        Binding("s", "sort", "Sort", key_display="s"),
+        Binding("r", "reload", "Reload", key_display="r"),
+        Binding("q", "quit", "Quit", key_display="q"),
+    ]
+
+    def __init__(
+        self,
+        ros: RosClient,
+        patterns: tuple[str, ...] = ("*",),
+        min_hz: float | None = None,
+    ) -> None:
+        super().__init__()
+
+        self._ros = ros
+        self._patterns = patterns
+        self._min_hz = min_hz
+        self._table = DataTable(cursor_type="row", zebra_stripes=True)
+        self._rates = RateTable()
+        self._rows = {}
+        self._cells = {}
+        self._unsubscribers = []
+        self._sync_lock = Lock()
+
+    def compose(self) -> ComposeResult:
+        yield self._table
+        yield Footer()
+
+    def on_mount(self) -> None:
+        self._event_loop = asyncio.get_running_loop()
+        for key, label in COLUMNS:
+            self._table.add_column(label, key=key)
+
+        self._ros.watch_graph(self._post_graph_changed)
+        self.sync_topics()
+        self.set_interval(TABLE_UPDATE_INTERVAL, self._update_table)
+
+    def on_unmount(self) -> None:
+        self.workers.cancel_group(self, "sync_topics")
+        # wait for a running sync, which subscribes no more afterwards
+        with self._sync_lock:
+            self._unmounted = True
+            for unsubscribe in self._unsubscribers:
+                unsubscribe()
+            self._unsubscribers = []
+
+    def _post_graph_changed(self) -> None:
+        # called from the ROS executor thread
+        self._call_soon(self.post_message, RosGraphChanged())
+
+    def _call_soon(self, callback: Callable[..., object], *args: object) -> None:
+        # unlike call_from_thread, never waits for the app, which may be
+        # waiting for the calling thread
+        if self._event_loop is None:
+            return
+
+        with suppress(RuntimeError):
+            self._event_loop.call_soon_threadsafe(callback, *args)
+
+    def on_ros_graph_changed(self, _: RosGraphChanged) -> None:
+        self.sync_topics()
+
+    def sync_topics(self) -> None:
+        self.run_worker(
+            self._sync_topics, group="sync_topics", exclusive=True, thread=True
+        )
+
+    def _sync_topics(self) -> None:
+        """Subscribe to matching topics that are not monitored yet."""
+        worker = get_current_worker()
+        # a cancelled sync may still be running; never subscribe twice
+        with self._sync_lock:
+            for topic_name in self._ros.graph.list_topics():
+                if not self._sync_topic(worker, topic_name):
+                    return
+
+    def _sync_topic(self, worker: Worker[None], topic_name: str) -> bool:
+        """Subscribe to the topic if it matches, False once cancelled."""
+        if topic_name in self._rows or not any(
+            fnmatchcase(topic_name, pattern) for pattern in self._patterns
+        ):
+            return True
+
+        types = self._ros.graph.get_topic_types(topic_name)
+        if worker.is_cancelled or self._unmounted:
+            return False
+        if not types:
+            return True
+
+        row = self._rates.add_row()
+        rates = self._rates
+        unsubscribe = self._ros.subscribe_raw(
+            topic_name, types[0], lambda data: rates.record(row, len(data))
+        )
+        if worker.is_cancelled or self._unmounted:
+            unsubscribe()
+            return False
+
+        self._unsubscribers.append(unsubscribe)
+        self._rows[topic_name] = row
+        self._call_soon(self._add_row, topic_name, types[0])
+        return True
+
+    def _add_row(self, topic_name: str, topic_type: str) -> None:
+        self._table.add_row(
+            topic_name,
+            topic_type,
+            *(self._cell(topic_name, key, math.nan) for key, _ in COLUMNS[2:]),
+            key=topic_name,
+        )
+        self._sort()
+
+    def _cell(self, topic_name: str, key: str, value: float) -> SortableCell:
+        if key == "hz":
+            cell = _number_cell(value, lambda v: f"{v:.2f}")
+        elif key == "max_period":
+            cell = _number_cell(value, lambda v: f"{v:.3f}")
+        elif key == "bandwidth":
+            cell = _number_cell(value, lambda v: f"{format_bytes(v)}/s")
+        else:
+            cell = _status_cell(value, self._min_hz)
+
+        self._cells[topic_name, key] = cell
+        return cell
+
+    def _update_table(self) -> None:
+        stats = self._rates.stats()
+        changed = False
+        for topic_name, row in list(self._rows.items()):
+            if topic_name not in self._table.rows:
+                # subscribed but not added to the table yet
+                continue
+
+            values = {
+                "hz": stats.hz[row],
+                "max_period": stats.max_period[row],
+                "bandwidth": stats.bytes_per_sec[row],
+                "status": stats.hz[row],
+            }
+            for key, value in values.items():
+                previous = self._cells.get((topic_name, key))
+                cell = self._cell(topic_name, key, float(value))
+                # only touch cells whose text changed
+                if previous is None or cell.markup != previous.markup:
+                    self._table.update_cell(topic_name, key, cell)
+                    changed = True
+
+        if changed:
+            self._sort()
+
+    def _sort(self) -> None:
+        self._table.sort(self._sort_column, "topic", reverse=self._sort_reverse)
+
+    def on_data_table_header_selected(self, e: DataTable.HeaderSelected) -> None:
+        column = str(e.column_key.value)
+        if column == self._sort_column:
+            self._sort_reverse = not self._sort_reverse
+        else:
+            self._sort_column = column
+            self._sort_reverse = False
+        self._sort()
+
+    def action_sort(self) -> None:
+        keys = [key for key, _ in COLUMNS]
+        self._sort_column = keys[(keys.index(self._sort_column) + 1) % len(keys)]
+        self._sort_reverse = False
+        self._sort()
+
+    def action_reload(self) -> None:
+        self._ros.graph.invalidate()
+        self.sync_topics()
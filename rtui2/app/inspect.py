@@ -1,21 +1,33 @@
 from __future__ import annotations
 
+import asyncio
 import warnings
+from contextlib import suppress
+from functools import partial
+from threading import Thread
 
 from textual.app import App
 from textual.binding import Binding
 
-from ..event import RosEntitySelected
-from ..ros import RosClient, RosEntity, RosEntityType
-from ..screens import RosEntityInspection
+from ..event import RosEntitySelected, RosGraphChanged
+from ..ros import AsyncRosClient, RosClient, RosEntity, RosEntityType
+from ..ros.dependency_graph import DEFAULT_MAX_DEPTH
+from ..screens import ProfileScreen, RosEntityInspection
 from ..utility import History
+from ..utility.profiler import active_profiler
 
 warnings.simplefilter("ignore", ResourceWarning)
 
 
 class InspectApp(App):
     _ros: RosClient
+    _ros_async: AsyncRosClient
     _init_target: RosEntityType
+    _screens: dict[RosEntityType, RosEntityInspection]
+    _watching_graph: bool
+    _graph_depth: int
+    _list_refresh: float | None
+    _event_loop: asyncio.AbstractEventLoop | None = None
     _history: History[RosEntity] = History(20)
 
     TITLE = "ROS Inspect"
@@ -24,21 +36,51 @@ class InspectApp(App):
         Binding("f", "forward", "Next Page", key_display="f"),
         Binding("r", "reload", "Reload", key_display="r"),
         Binding("q", "quit", "Quit", key_display="q"),
+        Binding("f12", "profile", "Profile", show=False),
     ]
 
     def __init__(
         self,
         ros: RosClient,
         init_target: RosEntityType,
+        graph_depth: int = DEFAULT_MAX_DEPTH,
+        list_refresh: float | None = None,
     ) -> None:
         super().__init__()
 
         self._ros = ros
+        self._ros_async = AsyncRosClient(ros)
         self._init_target = init_target
+        self._screens = {}
+        self._graph_depth = graph_depth
+        self._list_refresh = list_refresh
+        # add_mode() registers into App.MODES, which is shared by all instances
+        self.MODES = {}  # type: ignore[misc]
 
+        self._watching_graph = self._ros.watch_graph(self._post_graph_changed)
         for t in RosEntityType:
             if self._ros.available(t):
-                self.add_mode(t.name, RosEntityInspection(ros, t))
+                # screens are built on the first switch_mode() to their mode
+                self.add_mode(t.name, partial(self._create_screen, t))
+
+    def _create_screen(self, entity_type: RosEntityType) -> RosEntityInspection:
+        screen = RosEntityInspection(
+            self._ros_async,
+            entity_type,
+            self._watching_graph,
+            self._graph_depth,
+            self._list_refresh,
+        )
+        self._screens[entity_type] = screen
+        return screen
+
+    def _post_graph_changed(self) -> None:
+        # called from the ROS executor thread
+        if self._event_loop is None:
+            return
+
+        with suppress(RuntimeError):
+            self._event_loop.call_soon_threadsafe(self.post_message, RosGraphChanged())
 
     def show_ros_entity(self, entity: RosEntity, append_history: bool = True) -> None:
         self.switch_mode(entity.type.name)
@@ -49,7 +91,24 @@ class InspectApp(App):
             self._history.append(entity)
 
     def on_mount(self) -> None:
+        self._event_loop = asyncio.get_running_loop()
         self.switch_mode(self._init_target.name)
+        # the list is shown right away and fills in as discovery goes on; a
+        # daemon thread so that quitting never waits for discovery to settle
+        Thread(target=self._wait_for_discovery, daemon=True).start()
+
+    def _wait_for_discovery(self) -> None:
+        result = self._ros.wait_for_discovery(on_progress=self._post_graph_changed)
+        if self._event_loop is None:
+            return
+
+        with suppress(RuntimeError):
+            self._event_loop.call_soon_threadsafe(
+                partial(self.notify, str(result).capitalize())
+            )
+
+    def on_unmount(self) -> None:
+        self._ros_async.shutdown()
 
     def action_forward(self) -> None:
         if entity := self._history.forward():
@@ -60,10 +119,25 @@ class InspectApp(App):
             self.show_ros_entity(entity, append_history=False)
 
     def action_reload(self) -> None:
+        self._ros.graph.invalidate()
         self.screen.force_update()
 
+    def action_profile(self) -> None:
+        profiler = active_profiler()
+        if profiler is None:
+            self.notify(
+                "Profiling is off; start rtui2 with --profile", severity="warning"
+            )
+            return
+
+        self.push_screen(ProfileScreen(profiler))
+
     async def action_quit(self) -> None:
         await super().action_quit()
 
     def on_ros_entity_selected(self, e: RosEntitySelected) -> None:
         self.show_ros_entity(e.entity)
+
+    def on_ros_graph_changed(self, _: RosGraphChanged) -> None:
+        for screen in self._screens.values():
+            screen.on_graph_changed()
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+from time import monotonic
+
+from textual.app import App, ComposeResult
+from textual.binding import Binding
+from textual.widgets import DataTable, Footer
+from textual.worker import get_current_worker
+
+from ..qos_check import TopicIncompatibility, match_topics, sweep_incompatibilities
+from ..ros import RosClient
+
+# rows added to the table at once while sweeping
+ROW_CHUNK_SIZE = 50
+
+COLUMNS = [
+    ("topic", "Topic"),
+    ("publisher", "Publisher"),
+    ("subscriber", "Subscriber"),
+    ("reasons", "Incompatibility"),
+]
+
+
+class QoSCheckApp(App[None]):
+    """
+    Every publisher and subscription pair in the graph whose QoS profiles do
+    not match, found by one sweep over all topics.
+    """
+
+    _ros: RosClient
+    _patterns: tuple[str, ...]
+    _table: DataTable[str]
+
+    TITLE = "ROS QoS Check"
+    BINDINGS = [
+        Binding("r", "reload", "Reload", key_display="r"),
+        Binding("q", "quit", "Quit", key_display="q"),
+    ]
+
+    def __init__(self, ros: RosClient, patterns: tuple[str, ...] = ("*",)) -> None:
+        super().__init__()
+
+        self._ros = ros
+        self._patterns = patterns
+        self._table = DataTable(cursor_type="row", zebra_stripes=True)
+
+    def compose(self) -> ComposeResult:
+        yield self._table
+        yield Footer()
+
+    def on_mount(self) -> None:
+        for key, label in COLUMNS:
+            self._table.add_column(label, key=key)
+        self.check()
+
+    def check(self) -> None:
+        self._table.clear()
+        self.run_worker(self._check, group="check", exclusive=True, thread=True)
+
+    def _check(self) -> None:
+        worker = get_current_worker()
+        started = monotonic()
+        self._ros.wait_for_discovery()
+        topic_names = match_topics(self._ros, self._patterns)
+
+        found: list[TopicIncompatibility] = []
+        count = 0
+        for pair in sweep_incompatibilities(self._ros, topic_names):
+            if worker.is_cancelled:
+                return
+            found.append(pair)
+            if len(found) == ROW_CHUNK_SIZE:
+                self.call_from_thread(self._add_rows, found)
+                count += len(found)
+                found = []
+
+        self.call_from_thread(self._add_rows, found)
+        count += len(found)
+        self.call_from_thread(
+            self.notify,
+            f"Checked {len(topic_names)} topics in {monotonic() - started:.2f} s: "
+            f"{count} incompatible pairs",
+            severity="warning" if count else "information",
+        )
+
+    def _add_rows(self, found: list[TopicIncompatibility]) -> None:
+        for pair in found:
+            self._table.add_row(
+                pair.topic,
+                pair.publisher,
+                pair.subscriber,
+                "; ".join(pair.reasons),
+            )
+
+    def action_reload(self) -> None:
+        self._ros.graph.invalidate()
+        self.check()
@@ -1,62 +1,160 @@
+import os
+import sys
+import time
 from os import environ
+from typing import Callable
 
 import click
 
-from .app import InspectApp
+from .dump import FORMATS
+from .qos_check import FORMATS as QOS_CHECK_FORMATS
 from .ros import RosClient, RosEntityType
+from .ros.client import default_interface
+from .ros.dependency_graph import DEFAULT_MAX_DEPTH
+
+DAEMON_START_TIMEOUT = 10.0
 
 
 def is_ros2() -> bool:
-    return environ.get("ROS_VERSION") == "2"
+    # the synthetic graph of ROS_VERSION=fake behaves as ROS2
+    return environ.get("ROS_VERSION") in ("2", "fake")
+
+
+def create_client() -> RosClient:
+    """The client of the selected ROS version, instrumented if profiling."""
+    params = click.get_current_context().find_root().params
+    fan_out_workers = params["fan_out"]
+    if not params["profile"] and params["profile_out"] is None:
+        return RosClient(fan_out_workers=fan_out_workers)
+
+    from .ros.interface.instrumented import instrument
+    from .utility.profiler import enable_profiling
+
+    return RosClient(
+        instrument(default_interface(), enable_profiling()),
+        fan_out_workers=fan_out_workers,
+    )
+
+
+def close_client(ros: RosClient) -> None:
+    ros.terminate()
+
+    profile_out = click.get_current_context().find_root().params["profile_out"]
+    if profile_out is not None:
+        from .utility.profiler import active_profiler
+
+        profiler = active_profiler()
+        if profiler is not None:
+            profiler.write(profile_out)
+
+
+def dump_options(f: Callable[..., None]) -> Callable[..., None]:
+    f = click.option(
+        "--format",
+        "output_format",
+        type=click.Choice(FORMATS),
+        default="json",
+        show_default=True,
+        help="Output format of --dump (JSON Lines or a YAML document stream)",
+    )(f)
+    f = click.option(
+        "--dump",
+        is_flag=True,
+        help="Print the information of every entity and exit, without the TUI",
+    )(f)
+    return f
 
 
-def inspect_common(target: RosEntityType) -> None:
-    ros = RosClient()
+def dump_common(ros: RosClient, target: RosEntityType, output_format: str) -> None:
+    from .dump import dump_entities, yaml_available
+
+    if output_format == "yaml" and not yaml_available():
+        raise click.ClickException(
+            "--format yaml requires PyYAML; install it with: pip install 'rtui2[yaml]'"
+        )
+
+    try:
+        dump_entities(ros, target, output_format)
+    except BrokenPipeError:
+        # the reader went away (e.g. `| head`); silence the flush at exit
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+
+
+def inspect_common(
+    target: RosEntityType, dump: bool = False, output_format: str = "json"
+) -> None:
+    params = click.get_current_context().find_root().params
+
+    ros = create_client()
     try:
-        app = InspectApp(ros=ros, init_target=target)
+        if dump:
+            if not target.has_definition():
+                # a partial graph would silently be dumped as the whole
+                click.echo(str(ros.wait_for_discovery()).capitalize(), err=True)
+            dump_common(ros, target, output_format)
+            return
+
+        # Textual is only imported when the TUI actually starts
+        from .app import InspectApp
+
+        app = InspectApp(
+            ros=ros,
+            init_target=target,
+            graph_depth=params["graph_depth"],
+            list_refresh=params["list_refresh"],
+        )
         app.run()
     finally:
-        ros.terminate()
+        close_client(ros)
 
 
 @click.command(help="Inspect ROS nodes (default)")
-def node() -> None:
-    inspect_common(RosEntityType.Node)
+@dump_options
+def node(dump: bool, output_format: str) -> None:
+    inspect_common(RosEntityType.Node, dump, output_format)
 
 
 @click.command(hidden=True)
-def nodes() -> None:
-    inspect_common(RosEntityType.Node)
+@dump_options
+def nodes(dump: bool, output_format: str) -> None:
+    inspect_common(RosEntityType.Node, dump, output_format)
 
 
 @click.command(help="Inspect ROS topics")
-def topic() -> None:
-    inspect_common(RosEntityType.Topic)
+@dump_options
+def topic(dump: bool, output_format: str) -> None:
+    inspect_common(RosEntityType.Topic, dump, output_format)
 
 
 @click.command(hidden=True)
-def topics() -> None:
-    inspect_common(RosEntityType.Topic)
+@dump_options
+def topics(dump: bool, output_format: str) -> None:
+    inspect_common(RosEntityType.Topic, dump, output_format)
 
 
 @click.command(help="Inspect ROS services")
-def service() -> None:
-    inspect_common(RosEntityType.Service)
+@dump_options
+def service(dump: bool, output_format: str) -> None:
+    inspect_common(RosEntityType.Service, dump, output_format)
 
 
 @click.command(hidden=True)
-def services() -> None:
-    inspect_common(RosEntityType.Service)
+@dump_options
+def services(dump: bool, output_format: str) -> None:
+    inspect_common(RosEntityType.Service, dump, output_format)
 
 
 @click.command(help="Inspect ROS actions")
-def action() -> None:
-    inspect_common(RosEntityType.Action)
+@dump_options
+def action(dump: bool, output_format: str) -> None:
+    inspect_common(RosEntityType.Action, dump, output_format)
 
 
 @click.command(hidden=True)
-def actions() -> None:
-    inspect_common(RosEntityType.Action)
+@dump_options
+def actions(dump: bool, output_format: str) -> None:
+    inspect_common(RosEntityType.Action, dump, output_format)
 
 
 @click.group(help="Inspect ROS types")
@@ -65,23 +163,209 @@ def type() -> None:
 
 
 @click.command(name="msg", help="Inspect ROS message types")
-def type_msg() -> None:
-    inspect_common(RosEntityType.MsgType)
+@dump_options
+def type_msg(dump: bool, output_format: str) -> None:
+    inspect_common(RosEntityType.MsgType, dump, output_format)
 
 
 @click.command(name="srv", help="Inspect ROS service types")
-def type_srv() -> None:
-    inspect_common(RosEntityType.SrvType)
+@dump_options
+def type_srv(dump: bool, output_format: str) -> None:
+    inspect_common(RosEntityType.SrvType, dump, output_format)
 
 
 @click.command(name="action", help="Inspect ROS action types")
-def type_action() -> None:
-    inspect_common(RosEntityType.ActionType)
+@dump_options
+def type_action(dump: bool, output_format: str) -> None:
+    inspect_common(RosEntityType.ActionType, dump, output_format)
+
+
+@click.command(
+    short_help="Monitor the receive rate of many topics",
+    help="Monitor the receive rate of topics matching PATTERNs (globs, e.g. '/sensors/*')",
+)
+@click.argument("patterns", nargs=-1, metavar="[PATTERN]...")
+@click.option(
+    "--min-hz",
+    type=click.FloatRange(min=0),
+    default=None,
+    help="Flag topics received below this rate",
+)
+def hz(patterns: tuple[str, ...], min_hz: float | None) -> None:
+    from .app import HzApp
+
+    ros = create_client()
+    try:
+        HzApp(ros=ros, patterns=patterns or ("*",), min_hz=min_hz).run()
+    finally:
+        close_client(ros)
+
+
+@click.command(
+    name="qos-check",
+    short_help="Report QoS incompatibilities across the graph",
+    help="Report every publisher and subscription pair whose QoS profiles do not "
+    "match, on topics matching PATTERNs (globs, default: all). Exits with status 1 "
+    "if any is found.",
+)
+@click.argument("patterns", nargs=-1, metavar="[PATTERN]...")
+@click.option("--tui", is_flag=True, help="Show the result in a table")
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice(QOS_CHECK_FORMATS),
+    default="text",
+    show_default=True,
+    help="Output format without --tui (text or JSON Lines)",
+)
+def qos_check(patterns: tuple[str, ...], tui: bool, output_format: str) -> None:
+    ros = create_client()
+    try:
+        if tui:
+            from .app import QoSCheckApp
+
+            QoSCheckApp(ros=ros, patterns=patterns or ("*",)).run()
+            return
+
+        from .qos_check import report_incompatibilities
+
+        click.echo(str(ros.wait_for_discovery()).capitalize(), err=True)
+        started = time.monotonic()
+        topics, found = report_incompatibilities(ros, patterns or ("*",), output_format)
+        click.echo(
+            f"Checked {topics} topics in {time.monotonic() - started:.2f} s: "
+            f"{found} incompatible pairs",
+            err=True,
+        )
+    finally:
+        close_client(ros)
+
+    if found:
+        sys.exit(1)
+
+
+@click.group(
+    short_help="Keep the ROS graph discovered across runs",
+    help="Keep an rclpy node and its discovered graph alive in the background. "
+    "While it runs, other rtui2 commands use it instead of their own node "
+    "(set RTUI2_DAEMON=0 to opt out).",
+)
+def daemon() -> None:
+    ...
+
+
+@click.command(name="start", help="Start the daemon of this ROS domain")
+@click.option("--foreground", is_flag=True, help="Run in this process")
+def daemon_start(foreground: bool) -> None:
+    from .ros.interface.remote import RemoteRosInterface
+
+    if RemoteRosInterface.connect() is not None:
+        click.echo("rtui2 daemon is already running")
+        return
+
+    if foreground:
+        from .daemon import main as daemon_main
+
+        daemon_main()
+        return
+
+    import subprocess
+
+    subprocess.Popen(
+        [sys.executable, "-m", "rtui2.daemon"],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+    deadline = time.monotonic() + DAEMON_START_TIMEOUT
+    while time.monotonic() < deadline:
+        remote = RemoteRosInterface.connect()
+        if remote is not None:
+            click.echo(f"rtui2 daemon started (pid {remote.ping()['pid']})")
+            remote.terminate()
+            return
+        time.sleep(0.1)
+    raise click.ClickException("rtui2 daemon did not start")
+
+
+@click.command(name="stop", help="Stop the daemon of this ROS domain")
+def daemon_stop() -> None:
+    from .ros.interface.remote import RemoteRosInterface
+
+    remote = RemoteRosInterface.connect()
+    if remote is None:
+        click.echo("rtui2 daemon is not running")
+        return
+
+    remote.shutdown_daemon()
+    remote.terminate()
+    click.echo("rtui2 daemon stopped")
+
+
+@click.command(name="status", help="Show whether the daemon is running")
+def daemon_status() -> None:
+    from .ros.interface.remote import RemoteRosInterface, daemon_address
+
+    remote = RemoteRosInterface.connect()
+    if remote is None:
+        click.echo("rtui2 daemon is not running")
+        sys.exit(1)
+
+    status = remote.ping()
+    remote.terminate()
+    click.echo(
+        f"rtui2 daemon is running (pid {status['pid']}, "
+        f"up {status['uptime']:.0f} s, {status['graph_version']} graph changes, "
+        f"socket {daemon_address()})"
+    )
 
 
 @click.group(help="Terminal User Interface for ROS User", invoke_without_command=True)
+@click.option(
+    "--graph-depth",
+    type=click.IntRange(min=0),
+    default=DEFAULT_MAX_DEPTH,
+    show_default=True,
+    help="Number of node hops expanded in the dependency graph",
+)
+@click.option(
+    "--list-refresh",
+    type=click.FloatRange(min=0, min_open=True),
+    default=None,
+    metavar="SECONDS",
+    help="Periodically reload the entity list",
+)
+@click.option(
+    "--fan-out",
+    type=click.IntRange(min=0),
+    default=0,
+    show_default=True,
+    metavar="WORKERS",
+    help="Threads querying the endpoints of one entity at once, for slow "
+    "discovery servers (0: one after another)",
+)
+@click.option(
+    "--profile",
+    is_flag=True,
+    help="Record the latency of ROS queries and panel updates (shown with F12)",
+)
+@click.option(
+    "--profile-out",
+    type=click.Path(dir_okay=False, writable=True),
+    default=None,
+    metavar="FILE",
+    help="Write the recorded profile as JSON on exit (implies --profile)",
+)
 @click.pass_context
-def cli(ctx: click.Context) -> None:
+def cli(
+    ctx: click.Context,
+    graph_depth: int,
+    list_refresh: float | None,
+    fan_out: int,
+    profile: bool,
+    profile_out: str | None,
+) -> None:
     if ctx.invoked_subcommand is None:
         ctx.invoke(node)
 
@@ -104,11 +388,19 @@ def main() -> None:
         if "ROS_SUPER_CLIENT" not in environ:
             environ["ROS_SUPER_CLIENT"] = "true"
         cli.add_command(action)
+        cli.add_command(hz)
+        cli.add_command(qos_check)
         type.add_command(type_action)
 
         # old
         cli.add_command(actions)
 
+    if environ.get("ROS_VERSION") == "2":
+        cli.add_command(daemon)
+        daemon.add_command(daemon_start)
+        daemon.add_command(daemon_stop)
+        daemon.add_command(daemon_status)
+
     cli()
 
 
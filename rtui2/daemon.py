@@ -0,0 +1,221 @@
+"""
+Background daemon keeping a discovered ROS graph alive across invocations.
+
+``rtui2 daemon start`` runs :func:`main` in a detached process; RosClient
+then talks to it through RemoteRosInterface instead of creating its own
+rclpy node, so it neither pays for rclpy startup nor waits for discovery.
+"""
+from __future__ import annotations
+
+import os
+import secrets
+import sys
+from contextlib import suppress
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client, Connection, Listener
+from pathlib import Path
+from queue import Empty, Full, Queue
+from threading import Condition, Event, Thread
+from time import time
+from typing import Any, Callable
+
+from .ros.graph_snapshot import GraphSnapshot
+from .ros.interface import RosInterface
+from .ros.interface.remote import (
+    RemoteError,
+    daemon_address,
+    daemon_authkey_path,
+    runtime_dir,
+)
+
+# messages queued per raw subscription; newer ones are dropped beyond this so
+# that a slow client never blocks the ROS executor
+RAW_QUEUE_SIZE = 64
+
+# served from the graph snapshot so that repeated queries stay cheap
+_GRAPH_METHODS = {
+    name
+    for name in dir(GraphSnapshot)
+    if not name.startswith("_") and hasattr(RosInterface, name)
+}
+_INTERFACE_METHODS = set(RosInterface.__abstractmethods__) - {
+    "terminate",
+    "version",
+    "watch_graph",
+    "subscribe_raw",
+} | {"get_topic_endpoints"}
+
+
+class RosDaemon:
+    def __init__(self, interface: RosInterface, address: Path, authkey: bytes) -> None:
+        self._interface = interface
+        self._graph = GraphSnapshot(interface)
+        self._address = address
+        self._authkey = authkey
+        self._started = time()
+        self._graph_version = 0
+        self._graph_changed = Condition()
+        self._stopped = Event()
+        self._listener: Listener | None = None
+
+    def _on_graph_changed(self) -> None:
+        self._graph.invalidate()
+        with self._graph_changed:
+            self._graph_version += 1
+            self._graph_changed.notify_all()
+
+    def serve_forever(self) -> None:
+        self._interface.watch_graph(self._on_graph_changed)
+        self._listener = Listener(
+            str(self._address), family="AF_UNIX", authkey=self._authkey
+        )
+        with self._listener:
+            while True:
+                try:
+                    conn = self._listener.accept()
+                except (OSError, EOFError, AuthenticationError):
+                    # a client failed to authenticate
+                    continue
+                if self._stopped.is_set():
+                    conn.close()
+                    return
+                Thread(target=self._serve, args=(conn,), daemon=True).start()
+
+    def shutdown(self) -> None:
+        self._stopped.set()
+        # closing the listener does not interrupt accept(); connecting does
+        with suppress(OSError, EOFError, AuthenticationError):
+            Client(str(self._address), family="AF_UNIX", authkey=self._authkey).close()
+
+    def _serve(self, conn: Connection) -> None:
+        with conn:
+            while True:
+                try:
+                    method, args = conn.recv()
+                except (OSError, EOFError):
+                    return
+
+                if method == "subscribe_raw":
+                    self._stream(conn, *args)
+                    return
+
+                try:
+                    response = (True, self._dispatch(method, args))
+                except Exception as e:
+                    response = (False, e)
+
+                try:
+                    conn.send(response)
+                except (OSError, EOFError):
+                    return
+                except Exception:
+                    # not picklable
+                    conn.send((False, RemoteError(repr(response[1]))))
+
+                if method == "shutdown":
+                    self.shutdown()
+                    return
+
+    def _dispatch(self, method: str, args: tuple[Any, ...]) -> Any:
+        if method == "ping":
+            return {
+                "pid": os.getpid(),
+                "uptime": time() - self._started,
+                "graph_version": self._graph_version,
+            }
+        elif method == "shutdown":
+            return None
+        elif method == "wait_graph_change":
+            return self._wait_graph_change(*args)
+        elif method in _GRAPH_METHODS:
+            return getattr(self._graph, method)(*args)
+        elif method in _INTERFACE_METHODS:
+            return getattr(self._interface, method)(*args)
+        else:
+            raise ValueError(f"unknown method: {method}")
+
+    def _wait_graph_change(self, known: int | None, timeout: float) -> int:
+        with self._graph_changed:
+            self._graph_changed.wait_for(
+                lambda: self._graph_version != known, timeout=timeout
+            )
+            return self._graph_version
+
+    def _stream(self, conn: Connection, topic_name: str, topic_type: str) -> None:
+        """Forward the serialized messages of a topic until the client stops."""
+        queue: Queue[bytes | None] = Queue(maxsize=RAW_QUEUE_SIZE)
+
+        def enqueue(data: bytes) -> None:
+            with suppress(Full):
+                queue.put_nowait(data)
+
+        try:
+            unsubscribe = self._interface.subscribe_raw(topic_name, topic_type, enqueue)
+        except Exception as e:
+            conn.send((False, e))
+            return
+        conn.send((True, None))
+
+        sender = Thread(target=self._send_all, args=(conn, queue), daemon=True)
+        sender.start()
+        try:
+            # the client sends anything (or disconnects) to stop the stream
+            conn.recv()
+        except (OSError, EOFError):
+            pass
+        finally:
+            unsubscribe()
+            with suppress(Empty):
+                while True:
+                    queue.get_nowait()
+            queue.put(None)
+            sender.join()
+
+    @staticmethod
+    def _send_all(conn: Connection, queue: Queue[bytes | None]) -> None:
+        while (data := queue.get()) is not None:
+            try:
+                conn.send_bytes(data)
+            except (OSError, EOFError):
+                return
+
+
+def _write_authkey(path: Path) -> bytes:
+    authkey = secrets.token_bytes(32)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "wb") as f:
+        f.write(authkey)
+    return authkey
+
+
+def serve(make_interface: Callable[[], RosInterface]) -> None:
+    """Run the daemon of the current ROS domain in this process."""
+    address = daemon_address()
+    runtime_dir().mkdir(mode=0o700, parents=True, exist_ok=True)
+    with suppress(FileNotFoundError):
+        address.unlink()
+
+    interface = make_interface()
+    # clients then see a settled graph from their first query
+    interface.wait_for_discovery()
+    daemon = RosDaemon(interface, address, _write_authkey(daemon_authkey_path()))
+    try:
+        daemon.serve_forever()
+    finally:
+        interface.terminate()
+        for path in (address, daemon_authkey_path()):
+            with suppress(FileNotFoundError):
+                path.unlink()
+
+
+def main() -> None:
+    from .ros.interface.ros2 import Ros2
+
+    if "ROS_SUPER_CLIENT" not in os.environ:
+        os.environ["ROS_SUPER_CLIENT"] = "true"
+    serve(Ros2)
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
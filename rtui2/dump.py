@@ -0,0 +1,54 @@
+"""
+Headless output of entity information for scripts (``--dump``).
+
+Nothing here may import Textual; dumping must start as fast as possible.
+"""
+from __future__ import annotations
+
+import json
+import sys
+from importlib.util import find_spec
+from typing import Any, Callable, TextIO
+
+from .ros import RosClient, RosEntityType
+
+FORMATS = ("json", "yaml")
+
+
+def _to_json(value: dict[str, Any]) -> str:
+    # one object per line (JSON Lines), so that consumers can stream
+    return json.dumps(value) + "\n"
+
+
+def yaml_available() -> bool:
+    # PyYAML is an optional dependency (the ``yaml`` extra)
+    return find_spec("yaml") is not None
+
+
+def _to_yaml(value: dict[str, Any]) -> str:
+    import yaml
+
+    # one document per entity
+    return str(yaml.safe_dump(value, sort_keys=False, explicit_start=True))
+
+
+_SERIALIZERS: dict[str, Callable[[dict[str, Any]], str]] = {
+    "json": _to_json,
+    "yaml": _to_yaml,
+}
+
+
+def dump_entities(
+    ros: RosClient,
+    entity_type: RosEntityType,
+    format: str = "json",
+    out: TextIO = sys.stdout,
+) -> None:
+    """Write the information of every entity, flushing after each one."""
+    if format not in _SERIALIZERS:
+        raise ValueError(f"unknown format: {format}")
+
+    serialize = _SERIALIZERS[format]
+    for info in ros.iter_all_entity_infos(entity_type):
+        out.write(serialize(info.to_dict()))
+        out.flush()
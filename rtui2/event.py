@@ -39,3 +39,7 @@ class RosEntitySelected(Message):
     @classmethod
     def new_action_type(cls, name: str) -> "RosEntitySelected":
         return cls(RosEntityType.ActionType, name)
+
+
+class RosGraphChanged(Message):
+    """Posted when the ROS graph changes (nodes, topics or services)."""
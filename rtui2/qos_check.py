@@ -0,0 +1,84 @@
+"""
+QoS compatibility check of every topic in the graph (``rtui2 qos-check``).
+
+Nothing here may import Textual; the headless report must start fast.
+"""
+from __future__ import annotations
+
+import json
+import sys
+from dataclasses import asdict, dataclass
+from fnmatch import fnmatchcase
+from typing import Iterator, TextIO
+
+from .ros import RosClient
+from .ros.client import ENDPOINT_BATCH_SIZE, ENDPOINT_WORKERS
+from .ros.qos import find_incompatibilities
+
+FORMATS = ("text", "json")
+
+
+@dataclass(frozen=True)
+class TopicIncompatibility:
+    topic: str
+    publisher: str
+    subscriber: str
+    reasons: tuple[str, ...]
+
+
+def match_topics(ros: RosClient, patterns: tuple[str, ...] = ("*",)) -> list[str]:
+    return [
+        topic_name
+        for topic_name in ros.graph.list_topics()
+        if any(fnmatchcase(topic_name, pattern) for pattern in patterns)
+    ]
+
+
+def sweep_incompatibilities(
+    ros: RosClient,
+    topic_names: list[str],
+    batch_size: int = ENDPOINT_BATCH_SIZE,
+    max_workers: int = ENDPOINT_WORKERS,
+) -> Iterator[TopicIncompatibility]:
+    """
+    Every incompatible publisher and subscription pair of the given topics,
+    in topic order as soon as the endpoints of their batch are fetched.
+    """
+    for info in ros.iter_topic_infos(topic_names, batch_size, max_workers):
+        for pair in find_incompatibilities(info.publishers, info.subscribers):
+            yield TopicIncompatibility(
+                info.name, pair.publisher.node, pair.subscriber.node, pair.reasons
+            )
+
+
+def _to_text(found: TopicIncompatibility) -> str:
+    reasons = "".join(f"\n    {reason}" for reason in found.reasons)
+    return f"{found.topic}: {found.publisher} -> {found.subscriber}{reasons}\n"
+
+
+def _to_json(found: TopicIncompatibility) -> str:
+    return json.dumps(asdict(found)) + "\n"
+
+
+def report_incompatibilities(
+    ros: RosClient,
+    patterns: tuple[str, ...] = ("*",),
+    format: str = "text",
+    out: TextIO = sys.stdout,
+) -> tuple[int, int]:
+    """
+    Write every incompatible pair as found, flushing after each one.
+    Returns the numbers of topics checked and of incompatible pairs.
+    """
+    if format not in FORMATS:
+        raise ValueError(f"unknown format: {format}")
+
+    serialize = _to_text if format == "text" else _to_json
+    topic_names = match_topics(ros, patterns)
+    count = 0
+    for found in sweep_incompatibilities(ros, topic_names):
+        out.write(serialize(found))
+        out.flush()
+        count += 1
+
+    return len(topic_names), count
@@ -1,3 +1,5 @@
+from typing import TYPE_CHECKING, Any
+
 from . import exception
 from .client import RosClient
 from .entity import (
@@ -8,15 +10,34 @@ from .entity import (
     ServiceInfo,
     TopicInfo,
 )
+from .graph_snapshot import GraphSnapshot
+from .interface import TopicEndpoint
+from .qos import QoS
+
+if TYPE_CHECKING:
+    from .async_client import AsyncRosClient
 
 __all__ = [
     "exception",
     "ActionInfo",
+    "AsyncRosClient",
+    "GraphSnapshot",
     "NodeInfo",
+    "QoS",
     "RosClient",
     "RosEntity",
     "RosEntityType",
     "RosInterface",
     "ServiceInfo",
+    "TopicEndpoint",
     "TopicInfo",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # asyncio is only needed by the TUI; keep `rtui2 --help` and --dump light
+    if name == "AsyncRosClient":
+        from .async_client import AsyncRosClient
+
+        return AsyncRosClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
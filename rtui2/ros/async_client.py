@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from threading import RLock
+from typing import Any, Callable, Hashable, TypeVar
+
+from .client import RosClient
+from .entity import RosEntity, RosEntityInfo, RosEntityType, TreeKey
+from .message import format_message
+
+T = TypeVar("T")
+
+DEFAULT_MAX_WORKERS = 4
+
+
+@dataclass
+class _InFlight:
+    future: Future[Any]
+    waiters: int = 0
+
+
+class AsyncRosClient:
+    """Awaitable facade running RosClient queries on a bounded thread pool.
+
+    Identical requests that are in flight at the same time share one query.
+    Cancelling an awaiting task detaches it from the query, and a query that
+    has not started yet is dropped once it has no waiters left.
+    """
+
+    client: RosClient
+
+    def __init__(
+        self, client: RosClient, max_workers: int = DEFAULT_MAX_WORKERS
+    ) -> None:
+        self.client = client
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="rtui2-ros"
+        )
+        # reentrant: done callbacks may run synchronously under the lock
+        self._lock = RLock()
+        self._in_flight: dict[Hashable, _InFlight] = {}
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _acquire(self, key: Hashable, fn: Callable[..., Any], *args: Any) -> _InFlight:
+        with self._lock:
+            entry = self._in_flight.get(key)
+            if entry is None:
+                entry = _InFlight(self._executor.submit(fn, *args))
+                self._in_flight[key] = entry
+                entry.future.add_done_callback(lambda _: self._forget(key, entry))
+            entry.waiters += 1
+            return entry
+
+    def _release(self, entry: _InFlight) -> None:
+        with self._lock:
+            entry.waiters -= 1
+            if entry.waiters == 0:
+                # only succeeds if the query has not started yet
+                entry.future.cancel()
+
+    def _forget(self, key: Hashable, entry: _InFlight) -> None:
+        with self._lock:
+            if self._in_flight.get(key) is entry:
+                del self._in_flight[key]
+
+    async def run(self, key: Hashable, fn: Callable[..., T], *args: Any) -> T:
+        entry = self._acquire(key, fn, *args)
+        try:
+            # shield so that a cancelled waiter does not cancel the shared query
+            result: T = await asyncio.shield(asyncio.wrap_future(entry.future))
+        finally:
+            self._release(entry)
+
+        return result
+
+    async def get_entity_info(self, entity: RosEntity) -> RosEntityInfo:
+        return await self.run(
+            ("entity_info", entity), self.client.get_entity_info, entity
+        )
+
+    async def get_type_definition(self, entity: RosEntity) -> str:
+        return await self.run(
+            ("type_definition", entity), self.client.get_type_definition, entity
+        )
+
+    async def get_topic_types(self, topic_name: str) -> list[str]:
+        return await self.run(
+            ("topic_types", topic_name), self.client.graph.get_topic_types, topic_name
+        )
+
+    async def format_message(self, data: bytes, msg_type: str) -> str:
+        """Deserialize and format one serialized message off the event loop."""
+
+        def deserialize_and_format() -> str:
+            return format_message(self.client.deserialize_message(data, msg_type))
+
+        # data stays referenced while in flight, so its id is unique meanwhile
+        return await self.run(
+            ("format_message", msg_type, id(data)), deserialize_and_format
+        )
+
+    async def list_entities(self, entity_type: RosEntityType) -> list[TreeKey]:
+        return await self.run(
+            ("entities", entity_type), self.client.list_entities, entity_type
+        )
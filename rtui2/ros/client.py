@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
+from functools import partial
 from os import environ
-from typing import Generator
+from threading import Lock
+from typing import TYPE_CHECKING, Any, Callable, Generator, Iterator, Sequence, TypeVar
 
 from .entity import (
     ActionInfo,
@@ -16,29 +19,127 @@ from .entity import (
     TopicInfo,
     TreeKey,
 )
-from .interface import RosInterface, RosVersion
+from .graph_snapshot import GraphSnapshot
+from .interface import DiscoveryResult, RosInterface, RosVersion, TopicEndpoint
 
+if TYPE_CHECKING:
+    from concurrent.futures import ThreadPoolExecutor
 
-class RosClient:
-    interface: RosInterface
+T = TypeVar("T")
 
-    def __init__(self) -> None:
-        ros_version = environ.get("ROS_VERSION")
+# threads running the independent queries of one entity (e.g. the six
+# endpoint lists of a node) at once, when the fan-out mode is enabled
+DEFAULT_FAN_OUT_WORKERS = 6
 
-        if ros_version == "1":
-            from .interface.ros1 import Ros1
+# topics whose endpoints are fetched per call, and calls run in parallel,
+# when the information of many topics is needed at once
+ENDPOINT_BATCH_SIZE = 100
+ENDPOINT_WORKERS = 8
 
-            self.interface = Ros1()
-        elif ros_version == "2":
-            from .interface.ros2 import Ros2
+_Endpoints = list[tuple[str, str | None]]
 
-            self.interface = Ros2()
-        elif ros_version is None:
-            raise RuntimeError(
-                "ROS_VERSION is not set. Please source /opt/ros/<ROS distro>/setup.bash etc."
-            )
-        else:
-            raise RuntimeError(f"unknonw ROS version: {ros_version}")
+
+def _invert(
+    table: dict[str, dict[str, list[str | None]]],
+    name: str,
+    endpoints: Sequence[tuple[Any, ...]],
+) -> None:
+    """Add the entity ``name`` to the per-node entity tables of its endpoints."""
+    for endpoint in endpoints:
+        node_name, entity_type = endpoint[0], endpoint[1]
+        types = table.setdefault(node_name, {}).setdefault(name, [])
+        if entity_type not in types:
+            types.append(entity_type)
+
+
+def _map_in_order(
+    fn: Callable[[Any], T], items: Sequence[Any], max_workers: int
+) -> Iterator[T]:
+    """
+    ``map`` on a thread pool, yielding in order. Calls not started yet are
+    dropped once the results are no longer consumed (e.g. ``| head``).
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    executor = ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="rtui2-endpoints"
+    )
+    try:
+        yield from executor.map(fn, items)
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _flatten(entities: dict[str, list[str | None]] | None) -> _Endpoints:
+    if entities is None:
+        return []
+    return [(name, type) for name, types in entities.items() for type in types]
+
+
+@dataclass
+class _RawSubscription:
+    callbacks: tuple[Callable[[bytes], None], ...] = ()
+    unsubscribe: Callable[[], None] | None = None
+
+    def dispatch(self, data: bytes) -> None:
+        for callback in self.callbacks:
+            callback(data)
+
+
+def default_interface() -> RosInterface:
+    """The interface of the ROS version selected by ``ROS_VERSION``."""
+    ros_version = environ.get("ROS_VERSION")
+
+    if ros_version == "1":
+        from .interface.ros1 import Ros1
+
+        interface: RosInterface = Ros1()
+        return interface
+    elif ros_version == "2":
+        from .interface.remote import RemoteRosInterface, daemon_disabled
+
+        # prefer the already discovered graph of a running `rtui2 daemon`
+        remote = None if daemon_disabled() else RemoteRosInterface.connect()
+        if remote is not None:
+            return remote
+
+        from .interface.ros2 import Ros2
+
+        return Ros2()
+    elif ros_version == "fake":
+        from .interface.fake import FakeRosInterface
+
+        return FakeRosInterface.from_environ()
+    elif ros_version is None:
+        raise RuntimeError(
+            "ROS_VERSION is not set. Please source /opt/ros/<ROS distro>/setup.bash etc."
+        )
+    else:
+        raise RuntimeError(f"unknonw ROS version: {ros_version}")
+
+
+class RosClient:
+    interface: RosInterface
+    graph: GraphSnapshot
+    discovery: DiscoveryResult | None = None
+    _raw_subscriptions: dict[str, _RawSubscription]
+    _fan_out_workers: int
+    _fan_out_executor: ThreadPoolExecutor | None = None
+
+    def __init__(
+        self, interface: RosInterface | None = None, fan_out_workers: int = 0
+    ) -> None:
+        """
+        With ``fan_out_workers`` > 0, the independent graph queries behind one
+        entity's information are issued in parallel on that many threads,
+        which pays off when each query waits on DDS or the daemon.
+        """
+        self.interface = interface if interface is not None else default_interface()
+        self.graph = GraphSnapshot(self.interface)
+        self._raw_subscriptions = {}
+        self._subscription_lock = Lock()
+        self._fan_out_workers = fan_out_workers
+        self._fan_out_lock = Lock()
 
     def available(self, entity_type: RosEntityType) -> bool:
         if entity_type in (RosEntityType.Action, RosEntityType.ActionType):
@@ -47,58 +148,149 @@ class RosClient:
             return True
 
     def terminate(self) -> None:
+        if self._fan_out_executor is not None:
+            self._fan_out_executor.shutdown(wait=False, cancel_futures=True)
         self.interface.terminate()
 
+    def _submit(self, query: Callable[[str], T], name: str) -> Callable[[], T]:
+        """
+        Start querying ``name`` on a fan-out thread if enabled, otherwise once
+        the result is asked for; calling the returned function waits for it.
+        """
+        if self._fan_out_workers <= 0:
+            return partial(query, name)
+
+        with self._fan_out_lock:
+            if self._fan_out_executor is None:
+                from concurrent.futures import ThreadPoolExecutor
+
+                self._fan_out_executor = ThreadPoolExecutor(
+                    max_workers=self._fan_out_workers,
+                    thread_name_prefix="rtui2-fan-out",
+                )
+            executor = self._fan_out_executor
+
+        return executor.submit(query, name).result
+
+    def watch_graph(self, callback: Callable[[], None]) -> bool:
+        def on_graph_changed() -> None:
+            self.graph.invalidate()
+            callback()
+
+        return self.interface.watch_graph(on_graph_changed)
+
+    def wait_for_discovery(
+        self, on_progress: Callable[[], None] | None = None
+    ) -> DiscoveryResult:
+        """Wait for the graph to settle; ``on_progress`` sees it grow meanwhile."""
+
+        def on_graph_grown() -> None:
+            self.graph.invalidate()
+            if on_progress is not None:
+                on_progress()
+
+        self.discovery = self.interface.wait_for_discovery(on_progress=on_graph_grown)
+        return self.discovery
+
+    def subscribe_raw(
+        self, topic_name: str, topic_type: str, callback: Callable[[bytes], None]
+    ) -> Callable[[], None]:
+        """
+        Subscribe to the serialized messages of a topic. Panels watching the
+        same topic share one subscription, so each message is received once.
+        """
+        with self._subscription_lock:
+            subscription = self._raw_subscriptions.get(topic_name)
+            if subscription is None:
+                subscription = _RawSubscription()
+                subscription.unsubscribe = self.interface.subscribe_raw(
+                    topic_name, topic_type, subscription.dispatch
+                )
+                self._raw_subscriptions[topic_name] = subscription
+            # replaced rather than mutated; dispatch() runs on another thread
+            subscription.callbacks = (*subscription.callbacks, callback)
+
+        def unsubscribe() -> None:
+            with self._subscription_lock:
+                if callback not in subscription.callbacks:
+                    return
+                subscription.callbacks = tuple(
+                    c for c in subscription.callbacks if c is not callback
+                )
+                if not subscription.callbacks and subscription.unsubscribe:
+                    del self._raw_subscriptions[topic_name]
+                    subscription.unsubscribe()
+
+        return unsubscribe
+
+    def deserialize_message(self, data: bytes, msg_type: str) -> Any:
+        return self.interface.deserialize_message(data, msg_type)
+
     def get_node_info(self, node_name: str) -> NodeInfo:
+        # the topic index of the graph is built once per epoch by the first
+        # lookup; services and actions are queried per node
+        service_servers = self._submit(self.graph.get_node_service_servers, node_name)
+        service_clients = self._submit(self.graph.get_node_service_clients, node_name)
+        action_servers = self._submit(self.graph.get_node_action_servers, node_name)
+        action_clients = self._submit(self.graph.get_node_action_clients, node_name)
+        # the calling thread takes one query instead of waiting idle
         return NodeInfo(
             name=node_name,
-            publishers=self.interface.get_node_publishers(node_name),
-            subscribers=self.interface.get_node_subscribers(node_name),
-            service_servers=self.interface.get_node_service_servers(node_name),
-            service_clients=self.interface.get_node_service_clients(node_name),
-            action_servers=self.interface.get_node_action_servers(node_name),
-            action_clients=self.interface.get_node_action_clients(node_name),
+            publishers=self.graph.get_node_publishers(node_name),
+            subscribers=self.graph.get_node_subscribers(node_name),
+            service_servers=service_servers(),
+            service_clients=service_clients(),
+            action_servers=action_servers(),
+            action_clients=action_clients(),
         )
 
+    def get_topic_endpoints(
+        self, topic_names: list[str]
+    ) -> list[tuple[list[TopicEndpoint], list[TopicEndpoint]]]:
+        # a one-off sweep; not worth keeping in the graph snapshot
+        return self.interface.get_topic_endpoints(topic_names)
+
     def get_topic_info(self, topic_name: str) -> TopicInfo:
+        subscribers = self._submit(self.graph.get_topic_subscribers, topic_name)
         return TopicInfo(
             name=topic_name,
-            types=self.interface.get_topic_types(topic_name),
-            publishers=self.interface.get_topic_publishers(topic_name),
-            subscribers=self.interface.get_topic_subscribers(topic_name),
+            types=self.graph.get_topic_types(topic_name),
+            publishers=self.graph.get_topic_publishers(topic_name),
+            subscribers=subscribers(),
         )
 
     def get_service_info(self, service_name: str) -> ServiceInfo:
         return ServiceInfo(
             name=service_name,
-            types=self.interface.get_service_types(service_name),
-            servers=self.interface.get_service_servers(service_name),
+            types=self.graph.get_service_types(service_name),
+            servers=self.graph.get_service_servers(service_name),
         )
 
     def get_action_info(self, action_name: str) -> ActionInfo:
+        clients = self._submit(self.graph.get_action_clients, action_name)
         return ActionInfo(
             name=action_name,
-            types=self.interface.get_action_types(action_name),
-            servers=self.interface.get_action_servers(action_name),
-            clients=self.interface.get_action_clients(action_name),
+            types=self.graph.get_action_types(action_name),
+            servers=self.graph.get_action_servers(action_name),
+            clients=clients(),
         )
 
     def get_msg_type_info(self, msg_type: str) -> MsgTypeInfo:
         return MsgTypeInfo(
             name=msg_type,
-            topics=self.interface.list_topics(msg_type),
+            topics=self.graph.list_topics(msg_type),
         )
 
     def get_srv_type_info(self, srv_type: str) -> SrvTypeInfo:
         return SrvTypeInfo(
             name=srv_type,
-            services=self.interface.list_services(srv_type),
+            services=self.graph.list_services(srv_type),
         )
 
     def get_action_type_info(self, action_type: str) -> ActionTypeInfo:
         return ActionTypeInfo(
             name=action_type,
-            actions=self.interface.list_actions(action_type),
+            actions=self.graph.list_actions(action_type),
         )
 
     def get_entity_info(self, entity: RosEntity) -> RosEntityInfo:
@@ -129,6 +321,101 @@ class RosClient:
         else:
             raise ValueError(f"invalid entity type: {entity.type}")
 
+    def iter_topic_infos(
+        self,
+        topic_names: list[str],
+        batch_size: int = ENDPOINT_BATCH_SIZE,
+        max_workers: int = ENDPOINT_WORKERS,
+    ) -> Iterator[TopicInfo]:
+        """
+        Information of many topics. Endpoints are fetched in batches on a
+        thread pool, and yielded in topic order as soon as their batch is done.
+        """
+        batches = []
+        for start in range(0, len(topic_names), batch_size):
+            end = start + batch_size
+            batches.append(topic_names[start:end])
+        for batch, endpoints in zip(
+            batches, _map_in_order(self.get_topic_endpoints, batches, max_workers)
+        ):
+            for topic_name, (publishers, subscribers) in zip(batch, endpoints):
+                yield TopicInfo(
+                    name=topic_name,
+                    types=self.graph.get_topic_types(topic_name),
+                    publishers=publishers,
+                    subscribers=subscribers,
+                )
+
+    def get_all_node_infos(self) -> dict[str, NodeInfo]:
+        node_names = [key.full_name for key in self.list_nodes()]
+        return {info.name: info for info in self._iter_node_infos(node_names)}
+
+    def iter_all_entity_infos(
+        self, entity_type: RosEntityType
+    ) -> Iterator[RosEntityInfo]:
+        """
+        Information of every entity of a type, in list order. Nodes are built
+        from the endpoint tables of all topics and actions inverted once, so
+        the cost grows with the number of endpoints rather than nodes × graph.
+        Their services are the exception, queried per node on a thread pool.
+        """
+        names = [key.full_name for key in self.list_entities(entity_type)]
+        if entity_type == RosEntityType.Node:
+            yield from self._iter_node_infos(names)
+        elif entity_type == RosEntityType.Topic:
+            yield from self.iter_topic_infos(names)
+        else:
+            for name in names:
+                yield self.get_entity_info(RosEntity(entity_type, name))
+
+    def _iter_node_infos(self, node_names: list[str]) -> Iterator[NodeInfo]:
+        publishers: dict[str, dict[str, list[str | None]]] = {}
+        subscribers: dict[str, dict[str, list[str | None]]] = {}
+        for info in self.iter_topic_infos(self.graph.list_topics()):
+            _invert(publishers, info.name, info.publishers)
+            _invert(subscribers, info.name, info.subscribers)
+
+        action_servers: dict[str, dict[str, list[str | None]]] | None = None
+        action_clients: dict[str, dict[str, list[str | None]]] | None = None
+        if self.available(RosEntityType.Action):
+            action_servers, action_clients = {}, {}
+            for action_name in self.graph.list_actions():
+                _invert(
+                    action_servers,
+                    action_name,
+                    self.graph.get_action_servers(action_name),
+                )
+                _invert(
+                    action_clients,
+                    action_name,
+                    self.graph.get_action_clients(action_name),
+                )
+
+        def get_services(node_name: str) -> tuple[_Endpoints, _Endpoints | None]:
+            return (
+                self.graph.get_node_service_servers(node_name),
+                self.graph.get_node_service_clients(node_name),
+            )
+
+        # no interface lists the clients of a service, and ROS2 not even its
+        # servers (get_service_servers() is None), so these stay per node
+        for node_name, (service_servers, service_clients) in zip(
+            node_names, _map_in_order(get_services, node_names, ENDPOINT_WORKERS)
+        ):
+            yield NodeInfo(
+                name=node_name,
+                publishers=_flatten(publishers.get(node_name)),
+                subscribers=_flatten(subscribers.get(node_name)),
+                service_servers=service_servers,
+                service_clients=service_clients,
+                action_servers=None
+                if action_servers is None
+                else _flatten(action_servers.get(node_name)),
+                action_clients=None
+                if action_clients is None
+                else _flatten(action_clients.get(node_name)),
+            )
+
     @staticmethod
     def __common_list_entities(entities: list[str]) -> Generator[TreeKey, None, None]:
         for entity in entities:
@@ -143,16 +430,16 @@ class RosClient:
                 yield TreeKey(name=f"/{items[2]}", group=f"/{items[1]}")
 
     def list_nodes(self) -> list[TreeKey]:
-        return list(self.__common_list_entities(self.interface.list_nodes()))
+        return list(self.__common_list_entities(self.graph.list_nodes()))
 
     def list_topics(self) -> list[TreeKey]:
-        return list(self.__common_list_entities(self.interface.list_topics()))
+        return list(self.__common_list_entities(self.graph.list_topics()))
 
     def list_services(self) -> list[TreeKey]:
-        return list(self.__common_list_entities(self.interface.list_services()))
+        return list(self.__common_list_entities(self.graph.list_services()))
 
     def list_actions(self) -> list[TreeKey]:
-        return list(self.__common_list_entities(self.interface.list_actions()))
+        return list(self.__common_list_entities(self.graph.list_actions()))
 
     @staticmethod
     def __common_list_types(types: list[str]) -> Generator[TreeKey, None, None]:
@@ -169,7 +456,7 @@ class RosClient:
     def list_action_types(self) -> list[TreeKey]:
         return list(self.__common_list_types(self.interface.list_action_types()))
 
-    def list_entities(self, entity_type: RosEntityType) -> list[str]:
+    def list_entities(self, entity_type: RosEntityType) -> list[TreeKey]:
         if entity_type == RosEntityType.Node:
             return self.list_nodes()
         elif entity_type == RosEntityType.Topic:
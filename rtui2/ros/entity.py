@@ -1,8 +1,14 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field, fields
 from enum import IntEnum, auto
+from typing import TYPE_CHECKING, Any
+
+from .qos import QoS, QoSIncompatibility, find_incompatibilities
+
+if TYPE_CHECKING:
+    from .interface import TopicEndpoint
 
 UNKNOWN_TYPE = "<unknown type>"
 
@@ -71,65 +77,101 @@ class TreeKey:
             return f"{self.group}{self.name}"
 
 
+ENDPOINT_KEYS = ("name", "type", "qos")
+
+
+def _to_plain(value: Any) -> Any:
+    if isinstance(value, tuple):
+        # (name, type[, qos]) of a publisher, server, ...
+        return dict(zip(ENDPOINT_KEYS, map(_to_plain, value)))
+    elif isinstance(value, list):
+        return [_to_plain(item) for item in value]
+    elif isinstance(value, QoS):
+        return asdict(value)
+    else:
+        return value
+
+
 class RosEntityInfo(ABC):
     @abstractmethod
     def to_textual(self) -> str:
         ...
 
+    def to_dict(self) -> dict[str, Any]:
+        """Plain (JSON/YAML serializable) representation."""
+        return {f.name: _to_plain(getattr(self, f.name)) for f in fields(self)}  # type: ignore[arg-type]
+
 
 def _common_link(name: str, callback: str) -> str:
     return f"[@click={callback}('{name}')]{name}[/]"
 
 
-def _common_entities_with_type_and_qos(
-    entities: list[tuple[str, str | None] | tuple[str, str, str | None]],
-    callback: str,
-    type_callback: str,
+def _common_entities_with_type(
+    entities: list[tuple[str, str | None]], callback: str, type_callback: str
 ) -> str:
     if not entities:
         return " None"
 
-    out = ""
-    for i, entity in enumerate(entities):
+    parts: list[str] = []
+    for i, (name, type_) in enumerate(entities):
         if i > 0 and i % 5 == 0:
-            out += "\n"
+            parts.append("\n")
 
-        name = entity[0]
-        type_ = entity[1]
-        qos_profile = entity[2] if len(entity) == 3 else None
-
-        out += f"\n  {_common_link(name, callback)}"
+        parts.append(f"\n  {_common_link(name, callback)}")
         if type_ is not None:
-            out += f" \\[{_common_link(type_, type_callback)}]"
-        if qos_profile is not None:
-            # do not link QoS profile
-            formatted_qos = (
-                qos_profile.replace("{", "{\n        ")
-                .replace(",", ",\n        ")
-                .replace("}", "\n    }")
-            )
-            out += f"\n    {formatted_qos}"
+            parts.append(f" \\[{_common_link(type_, type_callback)}]")
 
-    return out
+    return "".join(parts)
 
 
-def _common_entities_with_type(
-    entities: list[tuple[str, str | None]], callback: str, type_callback: str
+def _common_endpoints(
+    endpoints: list[TopicEndpoint],
+    callback: str,
+    type_callback: str,
+    incompatible: set[TopicEndpoint],
 ) -> str:
-    return _common_entities_with_type_and_qos(
-        entities, callback, type_callback
-    )  # type: ignore[no-untyped-call]
+    """Endpoints of a topic grouped by their QoS profile."""
+    groups: dict[QoS | None, list[TopicEndpoint]] = {}
+    for endpoint in endpoints:
+        groups.setdefault(endpoint.qos, []).append(endpoint)
+
+    if not groups or list(groups) == [None]:
+        return _common_entities_with_type(
+            [(endpoint.node, endpoint.type) for endpoint in endpoints],
+            callback,
+            type_callback,
+        )
+
+    parts: list[str] = []
+    for qos, members in groups.items():
+        parts.append(f"\n  [i]QoS: {'unknown' if qos is None else qos}[/i]")
+        for endpoint in members:
+            parts.append(f"\n    {_common_link(endpoint.node, callback)}")
+            if endpoint.type is not None:
+                parts.append(f" \\[{_common_link(endpoint.type, type_callback)}]")
+            if endpoint in incompatible:
+                parts.append(" [b][red]incompatible QoS[/][/]")
+
+    return "".join(parts)
+
+
+def _common_incompatibilities(incompatibilities: list[QoSIncompatibility]) -> str:
+    parts = ["\n[b][red]QoS Incompatibilities:[/][/]"]
+    for pair in incompatibilities:
+        parts.append(
+            f"\n  {_common_link(pair.publisher.node, 'node_link')} -> "
+            f"{_common_link(pair.subscriber.node, 'node_link')}: "
+            f"{'; '.join(pair.reasons)}"
+        )
+    parts.append("\n")
+    return "".join(parts)
 
 
 def _common_entities(entities: list[str], callback: str) -> str:
     if not entities:
         return " None"
 
-    out = ""
-    for entity in entities:
-        out += f"\n  {_common_link(entity, callback)}"
-
-    return out
+    return "".join(f"\n  {_common_link(entity, callback)}" for entity in entities)
 
 
 def _common_types(types: list[str], callback: str) -> str:
@@ -183,29 +225,34 @@ class NodeInfo(RosEntityInfo):
 class TopicInfo(RosEntityInfo):
     name: str
     types: list[str] = field(default_factory=list)
-    publishers: list[tuple[str, str | None] | tuple[str, str, str | None]] = field(
-        default_factory=list
-    )
-    subscribers: list[tuple[str, str | None] | tuple[str, str, str | None]] = field(
-        default_factory=list
-    )
+    publishers: list[TopicEndpoint] = field(default_factory=list)
+    subscribers: list[TopicEndpoint] = field(default_factory=list)
 
     def to_textual(self) -> str:
-        return f"""[b]Topic:[/b] {self.name}
+        incompatibilities = find_incompatibilities(self.publishers, self.subscribers)
+        incompatible = {pair.publisher for pair in incompatibilities} | {
+            pair.subscriber for pair in incompatibilities
+        }
+
+        text = f"""[b]Topic:[/b] {self.name}
 
 [b]Type:[/b] {_common_types(self.types, "msg_type_link")}
 
-[b]Publishers:[/b]{_common_entities_with_type_and_qos(self.publishers, "node_link", "msg_type_link")}
+[b]Publishers:[/b]{_common_endpoints(self.publishers, "node_link", "msg_type_link", incompatible)}
 
-[b]Subscribers:[/b]{_common_entities_with_type_and_qos(self.subscribers, "node_link", "msg_type_link")}
+[b]Subscribers:[/b]{_common_endpoints(self.subscribers, "node_link", "msg_type_link", incompatible)}
 """
+        if incompatibilities:
+            text += _common_incompatibilities(incompatibilities)
+
+        return text
 
 
 @dataclass(repr=True)
 class ServiceInfo(RosEntityInfo):
     name: str
     types: list[str] = field(default_factory=list)
-    servers: list[str, str | None] | None = None  # not support for ros2
+    servers: list[tuple[str, str | None]] | None = None  # not support for ros2
 
     def to_textual(self) -> str:
         text = f"""[b]Service:[/b] {self.name}
@@ -0,0 +1,226 @@
+from __future__ import annotations
+
+from threading import Lock
+from time import monotonic
+from typing import Any, Callable, Hashable, Sequence, TypeVar
+
+from .interface import RosInterface, TopicEndpoint
+
+T = TypeVar("T")
+
+DEFAULT_TTL = 1.0
+
+_Endpoints = list[tuple[str, str | None]]
+# endpoints of every node, by node name
+_NodeIndex = dict[str, _Endpoints]
+
+
+def _invert(index: _NodeIndex, name: str, endpoints: Sequence[tuple[Any, ...]]) -> None:
+    """Add the entity ``name`` to the endpoints of the nodes serving it."""
+    for endpoint in endpoints:
+        entry = (name, endpoint[1])
+        entries = index.setdefault(endpoint[0], [])
+        if entry not in entries:
+            entries.append(entry)
+
+
+class GraphSnapshot:
+    """In-memory index of the ROS graph, refreshed once per epoch.
+
+    Each graph query is issued against the interface at most once per epoch and
+    served from the index afterwards. An epoch ends when ``ttl`` seconds have
+    elapsed or when :meth:`invalidate` is called (e.g. on a graph-change event).
+
+    The topics of every node are indexed from one bulk query of all topic
+    endpoints the first time a node is looked up, so nodes do not walk the
+    graph one by one. Services and actions are still queried per node: ROS 2
+    cannot list the servers and clients of a service, and inverting actions
+    would take two queries per action in the graph.
+    """
+
+    def __init__(
+        self, interface: RosInterface, ttl: float | None = DEFAULT_TTL
+    ) -> None:
+        self._interface = interface
+        self._ttl = ttl
+        self._lock = Lock()
+        self._epoch = 0
+        self._started = monotonic()
+        self._index: dict[Hashable, Any] = {}
+
+    @property
+    def epoch(self) -> int:
+        with self._lock:
+            self._expire()
+            return self._epoch
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._advance()
+
+    def _advance(self) -> None:
+        self._epoch += 1
+        self._started = monotonic()
+        self._index = {}
+
+    def _expire(self) -> None:
+        if self._ttl is not None and monotonic() - self._started > self._ttl:
+            self._advance()
+
+    def _lookup(self, key: Hashable, query: Callable[[], T]) -> T:
+        with self._lock:
+            self._expire()
+            epoch = self._epoch
+            if key in self._index:
+                return self._index[key]  # type: ignore[no-any-return]
+
+        # query without holding the lock so that independent lookups can overlap
+        value = query()
+
+        with self._lock:
+            if epoch == self._epoch:
+                self._index[key] = value
+
+        return value
+
+    def _names_and_types(
+        self, key: str, query: Callable[[], list[tuple[str, list[str]]]]
+    ) -> dict[str, list[str]]:
+        return self._lookup(key, lambda: dict(query()))
+
+    def _index_node_topics(self) -> tuple[_NodeIndex, _NodeIndex]:
+        with self._lock:
+            index = self._index
+        topic_names = self.list_topics()
+        endpoints = self._interface.get_topic_endpoints(topic_names)
+        publishers: _NodeIndex = {}
+        subscribers: _NodeIndex = {}
+        for topic_name, (topic_publishers, topic_subscribers) in zip(
+            topic_names, endpoints
+        ):
+            _invert(publishers, topic_name, topic_publishers)
+            _invert(subscribers, topic_name, topic_subscribers)
+
+        with self._lock:
+            # answer the per-topic lookups of this epoch from the same query
+            for topic_name, (topic_publishers, topic_subscribers) in zip(
+                topic_names, endpoints
+            ):
+                index.setdefault(("topic_publishers", topic_name), topic_publishers)
+                index.setdefault(("topic_subscribers", topic_name), topic_subscribers)
+        return publishers, subscribers
+
+    def _node_topics(self) -> tuple[_NodeIndex, _NodeIndex]:
+        return self._lookup("node_topics", self._index_node_topics)
+
+    # node
+
+    def list_nodes(self) -> list[str]:
+        return self._lookup("nodes", self._interface.list_nodes)
+
+    def get_node_publishers(self, node_name: str) -> list[tuple[str, str | None]]:
+        publishers, _ = self._node_topics()
+        return publishers.get(node_name, [])
+
+    def get_node_subscribers(self, node_name: str) -> list[tuple[str, str | None]]:
+        _, subscribers = self._node_topics()
+        return subscribers.get(node_name, [])
+
+    def get_node_service_servers(self, node_name: str) -> list[tuple[str, str | None]]:
+        return self._lookup(
+            ("node_service_servers", node_name),
+            lambda: self._interface.get_node_service_servers(node_name),
+        )
+
+    def get_node_service_clients(
+        self, node_name: str
+    ) -> list[tuple[str, str | None]] | None:
+        return self._lookup(
+            ("node_service_clients", node_name),
+            lambda: self._interface.get_node_service_clients(node_name),
+        )
+
+    def get_node_action_servers(
+        self, node_name: str
+    ) -> list[tuple[str, str | None]] | None:
+        return self._lookup(
+            ("node_action_servers", node_name),
+            lambda: self._interface.get_node_action_servers(node_name),
+        )
+
+    def get_node_action_clients(
+        self, node_name: str
+    ) -> list[tuple[str, str | None]] | None:
+        return self._lookup(
+            ("node_action_clients", node_name),
+            lambda: self._interface.get_node_action_clients(node_name),
+        )
+
+    # topic
+
+    def list_topics(self, type: str | None = None) -> list[str]:
+        return self._lookup(("topics", type), lambda: self._interface.list_topics(type))
+
+    def get_topic_types(self, topic_name: str) -> list[str]:
+        topic_types = self._names_and_types(
+            "topic_types", self._interface.get_topic_names_and_types
+        )
+        return topic_types.get(topic_name, [])
+
+    def get_topic_publishers(self, topic_name: str) -> list[TopicEndpoint]:
+        return self._lookup(
+            ("topic_publishers", topic_name),
+            lambda: self._interface.get_topic_publishers(topic_name),
+        )
+
+    def get_topic_subscribers(self, topic_name: str) -> list[TopicEndpoint]:
+        return self._lookup(
+            ("topic_subscribers", topic_name),
+            lambda: self._interface.get_topic_subscribers(topic_name),
+        )
+
+    # service
+
+    def list_services(self, type: str | None = None) -> list[str]:
+        return self._lookup(
+            ("services", type), lambda: self._interface.list_services(type)
+        )
+
+    def get_service_types(self, service_name: str) -> list[str]:
+        service_types = self._names_and_types(
+            "service_types", self._interface.get_service_names_and_types
+        )
+        return service_types.get(service_name, [])
+
+    def get_service_servers(
+        self, service_name: str
+    ) -> list[tuple[str, str | None]] | None:
+        return self._lookup(
+            ("service_servers", service_name),
+            lambda: self._interface.get_service_servers(service_name),
+        )
+
+    # action
+
+    def list_actions(self, type: str | None = None) -> list[str]:
+        return self._lookup(
+            ("actions", type), lambda: self._interface.list_actions(type)
+        )
+
+    def get_action_types(self, action_name: str) -> list[str]:
+        action_types = self._names_and_types(
+            "action_types", self._interface.get_action_names_and_types
+        )
+        return action_types.get(action_name, [])
+
+    def get_action_servers(self, action_name: str) -> list[tuple[str, str]]:
+        return self._lookup(
+            ("action_servers", action_name),
+            lambda: self._interface.get_action_servers(action_name),
+        )
+
+    def get_action_clients(self, action_name: str) -> list[tuple[str, str]]:
+        return self._lookup(
+            ("action_clients", action_name),
+            lambda: self._interface.get_action_clients(action_name),
+        )
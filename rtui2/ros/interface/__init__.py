@@ -1,3 +1,3 @@
-from .base import RosInterface, RosVersion
+from .base import DiscoveryResult, RosInterface, RosVersion, TopicEndpoint
 
-__all__ = ["RosInterface", "RosVersion"]
+__all__ = ["DiscoveryResult", "RosInterface", "RosVersion", "TopicEndpoint"]
@@ -1,7 +1,17 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from enum import Enum, auto
+from time import monotonic, sleep
+from typing import Any, Callable, NamedTuple
+
+from ..qos import QoS
+
+# discovery is considered settled once the graph has not grown for this long
+DISCOVERY_SETTLE = 0.5
+DISCOVERY_TIMEOUT = 5.0
+DISCOVERY_POLL_PERIOD = 0.05
 
 
 class RosVersion(Enum):
@@ -9,6 +19,31 @@ class RosVersion(Enum):
     ROS2 = auto()
 
 
+@dataclass(frozen=True)
+class DiscoveryResult:
+    settled: bool
+    # seconds until the graph stopped changing, and spent waiting in total
+    converged: float
+    elapsed: float
+    nodes: int
+    topics: int
+    services: int
+
+    def __str__(self) -> str:
+        found = f"{self.nodes} nodes, {self.topics} topics, {self.services} services"
+        if self.settled:
+            return f"discovered {found} in {self.converged:.2f} s"
+        return f"discovery not settled after {self.elapsed:.1f} s ({found} so far)"
+
+
+class TopicEndpoint(NamedTuple):
+    """A publisher or subscription of a topic; without QoS when unsupported."""
+
+    node: str
+    type: str | None
+    qos: QoS | None = None
+
+
 class RosInterface(ABC):
     @abstractmethod
     def terminate(self) -> None:
@@ -19,6 +54,69 @@ class RosInterface(ABC):
     def version(cls) -> RosVersion:
         ...
 
+    @abstractmethod
+    def watch_graph(self, callback: Callable[[], None]) -> bool:
+        """
+        Register a callback invoked whenever the ROS graph changes.
+        Returns False if graph change detection is unsupported.
+        """
+        ...
+
+    @abstractmethod
+    def subscribe_raw(
+        self, topic_name: str, topic_type: str, callback: Callable[[bytes], None]
+    ) -> Callable[[], None]:
+        """
+        Subscribe to a topic without deserializing its messages; the callback
+        receives the serialized bytes. Returns a function that unsubscribes.
+        """
+        ...
+
+    @abstractmethod
+    def deserialize_message(self, data: bytes, msg_type: str) -> Any:
+        ...
+
+    def graph_counts(self) -> tuple[int, int, int]:
+        """Numbers of nodes, topics and services currently discovered."""
+        return (
+            len(self.list_nodes()),
+            len(self.get_topic_names_and_types()),
+            len(self.get_service_names_and_types()),
+        )
+
+    def wait_for_discovery(
+        self,
+        timeout: float = DISCOVERY_TIMEOUT,
+        settle: float = DISCOVERY_SETTLE,
+        period: float = DISCOVERY_POLL_PERIOD,
+        on_progress: Callable[[], None] | None = None,
+    ) -> DiscoveryResult:
+        """
+        Block until the graph counts have been stable for ``settle`` seconds,
+        or ``timeout`` has passed. ``on_progress`` is called whenever they
+        change, so that lists can fill in while discovery goes on.
+        """
+        started = monotonic()
+        counts = self.graph_counts()
+        changed = started
+        while True:
+            now = monotonic()
+            if now - changed >= settle or now - started >= timeout:
+                return DiscoveryResult(
+                    now - changed >= settle,
+                    changed - started,
+                    now - started,
+                    *counts,
+                )
+
+            sleep(period)
+            latest = self.graph_counts()
+            if latest != counts:
+                counts = latest
+                changed = monotonic()
+                if on_progress is not None:
+                    on_progress()
+
     @abstractmethod
     def get_node_publishers(self, node_name: str) -> list[tuple[str, str | None]]:
         ...
@@ -54,25 +152,51 @@ class RosInterface(ABC):
         ...
 
     @abstractmethod
-    def get_topic_publishers(self, topic_name: str) -> list[tuple[str, str | None]]:
+    def get_topic_names_and_types(self) -> list[tuple[str, list[str]]]:
         ...
 
     @abstractmethod
-    def get_topic_subscribers(self, topic_name: str) -> list[tuple[str, str | None]]:
+    def get_topic_publishers(self, topic_name: str) -> list[TopicEndpoint]:
         ...
 
+    @abstractmethod
+    def get_topic_subscribers(self, topic_name: str) -> list[TopicEndpoint]:
+        ...
+
+    def get_topic_endpoints(
+        self, topic_names: list[str]
+    ) -> list[tuple[list[TopicEndpoint], list[TopicEndpoint]]]:
+        """
+        Publishers and subscribers of many topics at once, in the given order.
+        Interfaces with a per-call overhead answer it in a single round trip.
+        """
+        return [
+            (self.get_topic_publishers(name), self.get_topic_subscribers(name))
+            for name in topic_names
+        ]
+
     @abstractmethod
     def get_service_types(self, service_name: str) -> list[str]:
         ...
 
     @abstractmethod
-    def get_service_servers(self, service_name: str) -> list[tuple[str, str | None]]:
+    def get_service_names_and_types(self) -> list[tuple[str, list[str]]]:
+        ...
+
+    @abstractmethod
+    def get_service_servers(
+        self, service_name: str
+    ) -> list[tuple[str, str | None]] | None:
         ...
 
     @abstractmethod
     def get_action_types(self, action_name: str) -> list[str]:
         ...
 
+    @abstractmethod
+    def get_action_names_and_types(self) -> list[tuple[str, list[str]]]:
+        ...
+
     @abstractmethod
     def get_action_servers(self, action_name: str) -> list[tuple[str, str]]:
         ...
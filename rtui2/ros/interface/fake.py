@@ -0,0 +1,408 @@
+"""
+Synthetic ROS graph for benchmarks and demos without DDS (``ROS_VERSION=fake``).
+
+The graph is generated from a seed, so the same parameters always give the
+same nodes, topics and endpoints. ``RTUI2_FAKE_GRAPH`` configures it as comma
+separated ``key=value`` pairs, e.g. ``nodes=1000,latency=0.01``.
+"""
+from __future__ import annotations
+
+import random
+from collections import Counter
+from dataclasses import dataclass, field, fields
+from os import environ
+from threading import Event, Lock, Thread
+from time import sleep
+from typing import Any, Callable
+
+from ..qos import QoS
+from .base import RosInterface, RosVersion, TopicEndpoint
+
+NAMESPACES = ["perception", "planning", "control", "sensors", "localization", "drivers"]
+TOPIC_WORDS = ["points", "image", "odom", "cmd_vel", "status", "pose", "scan", "path"]
+MSG_TYPES = [
+    "std_msgs/msg/String",
+    "sensor_msgs/msg/Image",
+    "sensor_msgs/msg/PointCloud2",
+    "nav_msgs/msg/Odometry",
+    "geometry_msgs/msg/Twist",
+    "geometry_msgs/msg/PoseStamped",
+    "tf2_msgs/msg/TFMessage",
+    "diagnostic_msgs/msg/DiagnosticArray",
+]
+ACTION_TYPES = [
+    "nav2_msgs/action/NavigateToPose",
+    "control_msgs/action/FollowJointTrajectory",
+]
+# what every rclpy node serves
+PARAMETER_SERVICES = [
+    ("describe_parameters", "rcl_interfaces/srv/DescribeParameters"),
+    ("get_parameter_types", "rcl_interfaces/srv/GetParameterTypes"),
+    ("get_parameters", "rcl_interfaces/srv/GetParameters"),
+    ("list_parameters", "rcl_interfaces/srv/ListParameters"),
+    ("set_parameters", "rcl_interfaces/srv/SetParameters"),
+    ("set_parameters_atomically", "rcl_interfaces/srv/SetParametersAtomically"),
+]
+# profiles endpoints pick from, with their weights; about one in ten pairs
+# of a publisher and a subscription does not match
+PUBLISHER_QOS = [
+    (QoS("RELIABLE", "VOLATILE", "KEEP_LAST", 10), 6),
+    (QoS("BEST_EFFORT", "VOLATILE", "KEEP_LAST", 5), 3),
+    (QoS("RELIABLE", "TRANSIENT_LOCAL", "KEEP_LAST", 1), 1),
+    (QoS("RELIABLE", "VOLATILE", "KEEP_LAST", 10, deadline=0.1), 1),
+]
+SUBSCRIBER_QOS = [
+    (QoS("BEST_EFFORT", "VOLATILE", "KEEP_LAST", 5), 30),
+    (QoS("RELIABLE", "VOLATILE", "KEEP_LAST", 10), 15),
+    (QoS("RELIABLE", "TRANSIENT_LOCAL", "KEEP_LAST", 1), 1),
+]
+
+Endpoint = tuple[str, str]
+
+
+@dataclass
+class FakeGraphConfig:
+    """
+    Size and shape of the generated graph. Every topic has ``1 +`` a
+    geometric number of publishers with mean ``fan_out``, and a heavy tailed
+    number of subscriptions with mean about ``fan_in``, so that a few topics
+    (like ``/tf``) are subscribed by most nodes.
+    """
+
+    nodes: int = 100
+    topics: int | None = None  # twice the nodes by default
+    fan_out: float = 0.2
+    fan_in: float = 2.0
+    services_per_node: int = len(PARAMETER_SERVICES)
+    actions: int | None = None  # a twentieth of the nodes by default
+    rate: float = 10.0  # of the messages of subscribe_raw(), in Hz
+    latency: float = 0.0  # seconds slept by every query
+    seed: int = 0
+
+    @classmethod
+    def from_spec(cls, spec: str) -> FakeGraphConfig:
+        types = {f.name: f.type for f in fields(cls)}
+        values: dict[str, Any] = {}
+        for item in filter(None, spec.split(",")):
+            key, _, value = item.partition("=")
+            key = key.strip()
+            if key not in types:
+                raise ValueError(f"unknown fake graph parameter: {key}")
+            values[key] = float(value) if "float" in str(types[key]) else int(value)
+        return cls(**values)
+
+
+@dataclass
+class FakeGraph:
+    nodes: list[str] = field(default_factory=list)
+    topics: dict[str, str] = field(default_factory=dict)
+    publishers: dict[str, list[tuple[str, QoS]]] = field(default_factory=dict)
+    subscribers: dict[str, list[tuple[str, QoS]]] = field(default_factory=dict)
+    node_publishers: dict[str, list[Endpoint]] = field(default_factory=dict)
+    node_subscribers: dict[str, list[Endpoint]] = field(default_factory=dict)
+    services: dict[str, tuple[str, str]] = field(default_factory=dict)
+    node_services: dict[str, list[Endpoint]] = field(default_factory=dict)
+    actions: dict[str, str] = field(default_factory=dict)
+    action_servers: dict[str, list[Endpoint]] = field(default_factory=dict)
+    action_clients: dict[str, list[Endpoint]] = field(default_factory=dict)
+    node_action_servers: dict[str, list[Endpoint]] = field(default_factory=dict)
+    node_action_clients: dict[str, list[Endpoint]] = field(default_factory=dict)
+
+
+def _geometric(rng: random.Random, mean: float) -> int:
+    count = 0
+    while rng.random() < mean / (1 + mean):
+        count += 1
+    return count
+
+
+def _heavy_tailed(rng: random.Random, mean: float) -> int:
+    # Pareto with shape 1.5 has mean 3
+    return round(rng.paretovariate(1.5) * mean / 3)
+
+
+def generate_graph(config: FakeGraphConfig) -> FakeGraph:
+    rng = random.Random(config.seed)
+    publisher_qos, publisher_weights = zip(*PUBLISHER_QOS)
+    subscriber_qos, subscriber_weights = zip(*SUBSCRIBER_QOS)
+    graph = FakeGraph()
+
+    for i in range(config.nodes):
+        node = f"/{rng.choice(NAMESPACES)}/node_{i}"
+        graph.nodes.append(node)
+        graph.node_publishers[node] = []
+        graph.node_subscribers[node] = []
+        graph.node_services[node] = []
+        graph.node_action_servers[node] = []
+        graph.node_action_clients[node] = []
+        for name, srv_type in PARAMETER_SERVICES[: config.services_per_node]:
+            graph.services[f"{node}/{name}"] = (srv_type, node)
+            graph.node_services[node].append((f"{node}/{name}", srv_type))
+
+    if not graph.nodes:
+        return graph
+
+    topics = config.nodes * 2 if config.topics is None else config.topics
+    for j in range(topics):
+        topic = f"/{rng.choice(NAMESPACES)}/{rng.choice(TOPIC_WORDS)}_{j}"
+        msg_type = rng.choice(MSG_TYPES)
+        graph.topics[topic] = msg_type
+
+        count = min(len(graph.nodes), 1 + _geometric(rng, config.fan_out))
+        graph.publishers[topic] = [
+            (node, rng.choices(publisher_qos, publisher_weights)[0])
+            for node in rng.sample(graph.nodes, count)
+        ]
+        count = min(len(graph.nodes), _heavy_tailed(rng, config.fan_in))
+        graph.subscribers[topic] = [
+            (node, rng.choices(subscriber_qos, subscriber_weights)[0])
+            for node in rng.sample(graph.nodes, count)
+        ]
+        for node, _ in graph.publishers[topic]:
+            graph.node_publishers[node].append((topic, msg_type))
+        for node, _ in graph.subscribers[topic]:
+            graph.node_subscribers[node].append((topic, msg_type))
+
+    actions = config.nodes // 20 if config.actions is None else config.actions
+    for k in range(actions):
+        action = f"/{rng.choice(NAMESPACES)}/action_{k}"
+        action_type = rng.choice(ACTION_TYPES)
+        graph.actions[action] = action_type
+        server = rng.choice(graph.nodes)
+        clients = rng.sample(graph.nodes, min(len(graph.nodes), 2))
+        graph.action_servers[action] = [(server, action_type)]
+        graph.action_clients[action] = [(node, action_type) for node in clients]
+        graph.node_action_servers[server].append((action, action_type))
+        for node in clients:
+            graph.node_action_clients[node].append((action, action_type))
+
+    return graph
+
+
+@dataclass
+class FakeMessage:
+    """Deserialized message of subscribe_raw(); formatted like a ROS message."""
+
+    data: bytes
+
+    def get_fields_and_field_types(self) -> dict[str, str]:
+        return {"data": "sequence<uint8>"}
+
+
+class FakeRosInterface(RosInterface):
+    """
+    RosInterface serving a graph from :func:`generate_graph`. Every query
+    sleeps ``config.latency`` seconds, like a slow discovery server, and is
+    counted in ``calls``. Queries may come from several threads at once.
+    """
+
+    config: FakeGraphConfig
+    graph: FakeGraph
+    calls: Counter[str]
+
+    def __init__(self, config: FakeGraphConfig | None = None, **kwargs: Any) -> None:
+        self.config = config or FakeGraphConfig(**kwargs)
+        self.graph = generate_graph(self.config)
+        self.calls = Counter()
+        self._calls_lock = Lock()
+        self._stopped = Event()
+
+    @classmethod
+    def from_environ(cls) -> FakeRosInterface:
+        return cls(FakeGraphConfig.from_spec(environ.get("RTUI2_FAKE_GRAPH", "")))
+
+    def _query(self, name: str) -> None:
+        with self._calls_lock:
+            self.calls[name] += 1
+        if self.config.latency > 0:
+            sleep(self.config.latency)
+
+    def terminate(self) -> None:
+        self._stopped.set()
+
+    @classmethod
+    def version(cls) -> RosVersion:
+        return RosVersion.ROS2
+
+    def watch_graph(self, callback: Callable[[], None]) -> bool:
+        # the graph never changes
+        return False
+
+    def subscribe_raw(
+        self, topic_name: str, topic_type: str, callback: Callable[[bytes], None]
+    ) -> Callable[[], None]:
+        self._query("subscribe_raw")
+        unsubscribed = Event()
+        payload = topic_name.encode() * 8
+
+        def publish() -> None:
+            period = 1.0 / self.config.rate
+            while not (unsubscribed.wait(period) or self._stopped.is_set()):
+                callback(payload)
+
+        if topic_name in self.graph.topics and self.config.rate > 0:
+            Thread(target=publish, daemon=True).start()
+        return unsubscribed.set
+
+    def deserialize_message(self, data: bytes, msg_type: str) -> Any:
+        self._query("deserialize_message")
+        return FakeMessage(data)
+
+    def get_node_publishers(self, node_name: str) -> list[tuple[str, str | None]]:
+        self._query("get_node_publishers")
+        return list(self.graph.node_publishers.get(node_name, []))
+
+    def get_node_subscribers(self, node_name: str) -> list[tuple[str, str | None]]:
+        self._query("get_node_subscribers")
+        return list(self.graph.node_subscribers.get(node_name, []))
+
+    def get_node_service_servers(self, node_name: str) -> list[tuple[str, str | None]]:
+        self._query("get_node_service_servers")
+        return list(self.graph.node_services.get(node_name, []))
+
+    def get_node_service_clients(
+        self, node_name: str
+    ) -> list[tuple[str, str | None]] | None:
+        self._query("get_node_service_clients")
+        return []
+
+    def get_node_action_servers(
+        self, node_name: str
+    ) -> list[tuple[str, str | None]] | None:
+        self._query("get_node_action_servers")
+        return list(self.graph.node_action_servers.get(node_name, []))
+
+    def get_node_action_clients(
+        self, node_name: str
+    ) -> list[tuple[str, str | None]] | None:
+        self._query("get_node_action_clients")
+        return list(self.graph.node_action_clients.get(node_name, []))
+
+    def get_topic_types(self, topic_name: str) -> list[str]:
+        self._query("get_topic_types")
+        msg_type = self.graph.topics.get(topic_name)
+        return [] if msg_type is None else [msg_type]
+
+    def get_topic_names_and_types(self) -> list[tuple[str, list[str]]]:
+        self._query("get_topic_names_and_types")
+        return [(name, [msg_type]) for name, msg_type in self.graph.topics.items()]
+
+    def _topic_endpoints(
+        self, topic_name: str, publishers: bool
+    ) -> list[TopicEndpoint]:
+        msg_type = self.graph.topics.get(topic_name, "")
+        endpoints = self.graph.publishers if publishers else self.graph.subscribers
+        return [
+            TopicEndpoint(node, msg_type, qos)
+            for node, qos in endpoints.get(topic_name, [])
+        ]
+
+    def get_topic_publishers(self, topic_name: str) -> list[TopicEndpoint]:
+        self._query("get_topic_publishers")
+        return self._topic_endpoints(topic_name, publishers=True)
+
+    def get_topic_subscribers(self, topic_name: str) -> list[TopicEndpoint]:
+        self._query("get_topic_subscribers")
+        return self._topic_endpoints(topic_name, publishers=False)
+
+    def get_topic_endpoints(
+        self, topic_names: list[str]
+    ) -> list[tuple[list[TopicEndpoint], list[TopicEndpoint]]]:
+        """One query, like the bulk query of a daemon or discovery server."""
+        self._query("get_topic_endpoints")
+        return [
+            (
+                self._topic_endpoints(name, publishers=True),
+                self._topic_endpoints(name, publishers=False),
+            )
+            for name in topic_names
+        ]
+
+    def get_service_types(self, service_name: str) -> list[str]:
+        self._query("get_service_types")
+        service = self.graph.services.get(service_name)
+        return [] if service is None else [service[0]]
+
+    def get_service_names_and_types(self) -> list[tuple[str, list[str]]]:
+        self._query("get_service_names_and_types")
+        return [
+            (name, [srv_type]) for name, (srv_type, _) in self.graph.services.items()
+        ]
+
+    def get_service_servers(self, service_name: str) -> None:
+        """
+        Unsupported, like Ros2.
+        """
+        self._query("get_service_servers")
+        return None
+
+    def get_action_types(self, action_name: str) -> list[str]:
+        self._query("get_action_types")
+        action_type = self.graph.actions.get(action_name)
+        return [] if action_type is None else [action_type]
+
+    def get_action_names_and_types(self) -> list[tuple[str, list[str]]]:
+        self._query("get_action_names_and_types")
+        return [
+            (name, [action_type]) for name, action_type in self.graph.actions.items()
+        ]
+
+    def get_action_servers(self, action_name: str) -> list[tuple[str, str]]:
+        self._query("get_action_servers")
+        return list(self.graph.action_servers.get(action_name, []))
+
+    def get_action_clients(self, action_name: str) -> list[tuple[str, str]]:
+        self._query("get_action_clients")
+        return list(self.graph.action_clients.get(action_name, []))
+
+    def get_msg_definition(self, msg_type: str) -> str:
+        self._query("get_msg_definition")
+        return "std_msgs/Header header\nuint8[] data"
+
+    def get_srv_definition(self, srv_type: str) -> str:
+        self._query("get_srv_definition")
+        return "string request\n---\nbool success"
+
+    def get_action_definition(self, action_type: str) -> str:
+        self._query("get_action_definition")
+        return "string goal\n---\nbool success\n---\nfloat32 progress"
+
+    def list_nodes(self) -> list[str]:
+        self._query("list_nodes")
+        return list(self.graph.nodes)
+
+    def list_topics(self, type: str | None = None) -> list[str]:
+        self._query("list_topics")
+        return [
+            name
+            for name, msg_type in self.graph.topics.items()
+            if type is None or msg_type == type
+        ]
+
+    def list_services(self, type: str | None = None) -> list[str]:
+        self._query("list_services")
+        return [
+            name
+            for name, (srv_type, _) in self.graph.services.items()
+            if type is None or srv_type == type
+        ]
+
+    def list_actions(self, type: str | None = None) -> list[str]:
+        self._query("list_actions")
+        return [
+            name
+            for name, action_type in self.graph.actions.items()
+            if type is None or action_type == type
+        ]
+
+    def list_msg_types(self) -> list[str]:
+        self._query("list_msg_types")
+        return sorted(MSG_TYPES)
+
+    def list_srv_types(self) -> list[str]:
+        self._query("list_srv_types")
+        return sorted({srv_type for _, srv_type in PARAMETER_SERVICES})
+
+    def list_action_types(self) -> list[str]:
+        self._query("list_action_types")
+        return sorted(ACTION_TYPES)
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+from functools import cache
+from typing import Any, Callable
+
+from ...utility.profiler import Profiler
+from .base import DiscoveryResult, RosInterface, RosVersion
+
+
+def _recorded(name: str) -> Callable[..., Any]:
+    def method(self: InstrumentedRosInterface, *args: Any, **kwargs: Any) -> Any:
+        fn = getattr(self.interface, name)
+        return self.profiler.call(name, lambda: fn(*args, **kwargs))
+
+    method.__name__ = name
+    return method
+
+
+class InstrumentedRosInterface(RosInterface):
+    """
+    Proxy recording the latency and returned entries of every call to another
+    interface. Only installed when profiling is requested (``--profile``),
+    so there is no overhead otherwise. Created with :func:`instrument`.
+    """
+
+    interface: RosInterface
+    profiler: Profiler
+
+    def __init__(self, interface: RosInterface, profiler: Profiler) -> None:
+        self.interface = interface
+        self.profiler = profiler
+
+    def terminate(self) -> None:
+        self.interface.terminate()
+
+    def watch_graph(self, callback: Callable[[], None]) -> bool:
+        return self.interface.watch_graph(callback)
+
+    def subscribe_raw(
+        self, topic_name: str, topic_type: str, callback: Callable[[bytes], None]
+    ) -> Callable[[], None]:
+        unsubscribe: Callable[[], None] = self.profiler.call(
+            "subscribe_raw",
+            self.interface.subscribe_raw,
+            topic_name,
+            topic_type,
+            callback,
+            sized=False,
+        )
+        return unsubscribe
+
+    def deserialize_message(self, data: bytes, msg_type: str) -> Any:
+        # called per shown message; pickling every message would skew echo
+        return self.profiler.call(
+            "deserialize_message",
+            self.interface.deserialize_message,
+            data,
+            msg_type,
+            sized=False,
+        )
+
+    def wait_for_discovery(self, *args: Any, **kwargs: Any) -> DiscoveryResult:
+        # the wrapped interface may know better (e.g. the daemon's settled graph)
+        result: DiscoveryResult = self.profiler.call(
+            "wait_for_discovery",
+            lambda: self.interface.wait_for_discovery(*args, **kwargs),
+            sized=False,
+        )
+        return result
+
+    graph_counts = _recorded("graph_counts")
+    get_node_publishers = _recorded("get_node_publishers")
+    get_node_subscribers = _recorded("get_node_subscribers")
+    get_node_service_servers = _recorded("get_node_service_servers")
+    get_node_service_clients = _recorded("get_node_service_clients")
+    get_node_action_servers = _recorded("get_node_action_servers")
+    get_node_action_clients = _recorded("get_node_action_clients")
+    get_topic_types = _recorded("get_topic_types")
+    get_topic_names_and_types = _recorded("get_topic_names_and_types")
+    get_topic_publishers = _recorded("get_topic_publishers")
+    get_topic_subscribers = _recorded("get_topic_subscribers")
+    get_topic_endpoints = _recorded("get_topic_endpoints")
+    get_service_types = _recorded("get_service_types")
+    get_service_names_and_types = _recorded("get_service_names_and_types")
+    get_service_servers = _recorded("get_service_servers")
+    get_action_types = _recorded("get_action_types")
+    get_action_names_and_types = _recorded("get_action_names_and_types")
+    get_action_servers = _recorded("get_action_servers")
+    get_action_clients = _recorded("get_action_clients")
+    get_msg_definition = _recorded("get_msg_definition")
+    get_srv_definition = _recorded("get_srv_definition")
+    get_action_definition = _recorded("get_action_definition")
+    list_nodes = _recorded("list_nodes")
+    list_topics = _recorded("list_topics")
+    list_services = _recorded("list_services")
+    list_actions = _recorded("list_actions")
+    list_msg_types = _recorded("list_msg_types")
+    list_srv_types = _recorded("list_srv_types")
+    list_action_types = _recorded("list_action_types")
+
+
+@cache
+def _instrumented_class(
+    wrapped: type[RosInterface],
+) -> type[InstrumentedRosInterface]:
+    # version() is a classmethod, so it is answered by a proxy class per
+    # wrapped interface class rather than by the proxy instance
+    class Instrumented(InstrumentedRosInterface):
+        @classmethod
+        def version(cls) -> RosVersion:
+            return wrapped.version()
+
+    Instrumented.__qualname__ = f"Instrumented{wrapped.__name__}"
+    return Instrumented
+
+
+def instrument(interface: RosInterface, profiler: Profiler) -> InstrumentedRosInterface:
+    """Record every call to ``interface`` in ``profiler``."""
+    return _instrumented_class(type(interface))(interface, profiler)
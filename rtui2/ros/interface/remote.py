@@ -0,0 +1,313 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import tempfile
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client, Connection
+from os import environ
+from pathlib import Path
+from threading import Lock, Thread, local
+from typing import Any, Callable, cast
+
+from .base import DiscoveryResult, RosInterface, RosVersion, TopicEndpoint
+
+GRAPH_WAIT_TIMEOUT = 5.0
+# settings that change which graph is discovered; a daemon is only shared by
+# processes that agree on all of them
+DISCOVERY_ENVIRON = (
+    "ROS_DOMAIN_ID",
+    "ROS_LOCALHOST_ONLY",
+    "ROS_AUTOMATIC_DISCOVERY_RANGE",
+    "ROS_STATIC_PEERS",
+    "ROS_DISCOVERY_SERVER",
+    "RMW_IMPLEMENTATION",
+    "FASTRTPS_DEFAULT_PROFILES_FILE",
+    "CYCLONEDDS_URI",
+)
+
+
+def runtime_dir() -> Path:
+    base = environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+    return Path(base) / f"rtui2-{os.getuid()}"
+
+
+def _discovery_fingerprint() -> str:
+    settings = "\0".join(
+        f"{name}={environ.get(name, '')}" for name in DISCOVERY_ENVIRON
+    )
+    return hashlib.sha1(settings.encode()).hexdigest()[:12]
+
+
+def daemon_address() -> Path:
+    """Socket of the daemon serving the current ROS domain and discovery settings."""
+    domain = environ.get("ROS_DOMAIN_ID", "0")
+    return runtime_dir() / f"daemon-{domain}-{_discovery_fingerprint()}.sock"
+
+
+def daemon_authkey_path() -> Path:
+    return daemon_address().with_suffix(".key")
+
+
+def daemon_disabled() -> bool:
+    return environ.get("RTUI2_DAEMON", "1") == "0"
+
+
+class RemoteError(Exception):
+    """An error raised by the daemon that could not be sent back as is."""
+
+
+class RemoteRosInterface(RosInterface):
+    """
+    RosInterface served by a running ``rtui2 daemon``, which keeps an rclpy
+    node (and so a fully discovered graph) alive across invocations.
+
+    Each calling thread gets its own connection, so that concurrent queries
+    are not serialized on one socket.
+    """
+
+    def __init__(self, address: Path, authkey: bytes) -> None:
+        self._address = address
+        self._authkey = authkey
+        self._local = local()
+        self._connections: list[Connection] = []
+        self._lock = Lock()
+        self._closed = False
+        # fail early if the daemon is not there
+        self.ping()
+
+    @classmethod
+    def connect(cls) -> RemoteRosInterface | None:
+        """Connect to the daemon of this ROS domain, None if none is running."""
+        try:
+            authkey = daemon_authkey_path().read_bytes()
+            return cls(daemon_address(), authkey)
+        except (OSError, EOFError, AuthenticationError):
+            # e.g. a daemon started with another authkey file
+            return None
+
+    def _open(self) -> Connection:
+        return Client(str(self._address), family="AF_UNIX", authkey=self._authkey)
+
+    def _connection(self) -> Connection:
+        conn: Connection | None = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = self._open()
+            with self._lock:
+                self._connections.append(conn)
+        return conn
+
+    def _call(self, method: str, *args: Any) -> Any:
+        conn = self._connection()
+        conn.send((method, args))
+        ok, value = conn.recv()
+        if not ok:
+            raise value
+        return value
+
+    def ping(self) -> dict[str, Any]:
+        status: dict[str, Any] = self._call("ping")
+        return status
+
+    def shutdown_daemon(self) -> None:
+        self._call("shutdown")
+
+    def terminate(self) -> None:
+        # only disconnects; the daemon keeps running for the next invocation
+        with self._lock:
+            self._closed = True
+            for conn in self._connections:
+                conn.close()
+            self._connections = []
+
+    @classmethod
+    def version(cls) -> RosVersion:
+        return RosVersion.ROS2
+
+    def wait_for_discovery(
+        self,
+        timeout: float = 0.0,
+        settle: float = 0.0,
+        period: float = 0.0,
+        on_progress: Callable[[], None] | None = None,
+    ) -> DiscoveryResult:
+        # the daemon only starts listening once its discovery has settled
+        return DiscoveryResult(True, 0.0, 0.0, *self.graph_counts())
+
+    def watch_graph(self, callback: Callable[[], None]) -> bool:
+        Thread(target=self._watch_graph, args=(callback,), daemon=True).start()
+        return True
+
+    def _watch_graph(self, callback: Callable[[], None]) -> None:
+        try:
+            version = self._call("wait_graph_change", None, 0.0)
+            while not self._closed:
+                changed = self._call("wait_graph_change", version, GRAPH_WAIT_TIMEOUT)
+                if changed != version:
+                    version = changed
+                    callback()
+        except (OSError, EOFError):
+            # the daemon went away or we were terminated
+            return
+
+    def subscribe_raw(
+        self, topic_name: str, topic_type: str, callback: Callable[[bytes], None]
+    ) -> Callable[[], None]:
+        # a dedicated connection over which the daemon streams the messages
+        conn = self._open()
+        conn.send(("subscribe_raw", (topic_name, topic_type)))
+        ok, value = conn.recv()
+        if not ok:
+            conn.close()
+            raise value
+
+        def receive() -> None:
+            try:
+                while True:
+                    callback(conn.recv_bytes())
+            except (OSError, EOFError):
+                # the daemon closes the stream once asked to stop
+                pass
+            finally:
+                conn.close()
+
+        Thread(target=receive, daemon=True).start()
+
+        def unsubscribe() -> None:
+            try:
+                conn.send(None)
+            except OSError:
+                pass
+
+        return unsubscribe
+
+    def deserialize_message(self, data: bytes, msg_type: str) -> Any:
+        return self._call("deserialize_message", data, msg_type)
+
+    def get_node_publishers(self, node_name: str) -> list[tuple[str, str | None]]:
+        return cast(
+            list[tuple[str, str | None]], self._call("get_node_publishers", node_name)
+        )
+
+    def get_node_subscribers(self, node_name: str) -> list[tuple[str, str | None]]:
+        return cast(
+            list[tuple[str, str | None]], self._call("get_node_subscribers", node_name)
+        )
+
+    def get_node_service_servers(self, node_name: str) -> list[tuple[str, str | None]]:
+        return cast(
+            list[tuple[str, str | None]],
+            self._call("get_node_service_servers", node_name),
+        )
+
+    def get_node_service_clients(
+        self, node_name: str
+    ) -> list[tuple[str, str | None]] | None:
+        return cast(
+            list[tuple[str, str | None]] | None,
+            self._call("get_node_service_clients", node_name),
+        )
+
+    def get_node_action_servers(
+        self, node_name: str
+    ) -> list[tuple[str, str | None]] | None:
+        return cast(
+            list[tuple[str, str | None]] | None,
+            self._call("get_node_action_servers", node_name),
+        )
+
+    def get_node_action_clients(
+        self, node_name: str
+    ) -> list[tuple[str, str | None]] | None:
+        return cast(
+            list[tuple[str, str | None]] | None,
+            self._call("get_node_action_clients", node_name),
+        )
+
+    def get_topic_types(self, topic_name: str) -> list[str]:
+        return cast(list[str], self._call("get_topic_types", topic_name))
+
+    def get_topic_names_and_types(self) -> list[tuple[str, list[str]]]:
+        return cast(
+            list[tuple[str, list[str]]], self._call("get_topic_names_and_types")
+        )
+
+    def get_topic_publishers(self, topic_name: str) -> list[TopicEndpoint]:
+        return cast(list[TopicEndpoint], self._call("get_topic_publishers", topic_name))
+
+    def get_topic_subscribers(self, topic_name: str) -> list[TopicEndpoint]:
+        return cast(
+            list[TopicEndpoint], self._call("get_topic_subscribers", topic_name)
+        )
+
+    def get_topic_endpoints(
+        self, topic_names: list[str]
+    ) -> list[tuple[list[TopicEndpoint], list[TopicEndpoint]]]:
+        return cast(
+            list[tuple[list[TopicEndpoint], list[TopicEndpoint]]],
+            self._call("get_topic_endpoints", topic_names),
+        )
+
+    def get_service_types(self, service_name: str) -> list[str]:
+        return cast(list[str], self._call("get_service_types", service_name))
+
+    def get_service_names_and_types(self) -> list[tuple[str, list[str]]]:
+        return cast(
+            list[tuple[str, list[str]]], self._call("get_service_names_and_types")
+        )
+
+    def get_service_servers(
+        self, service_name: str
+    ) -> list[tuple[str, str | None]] | None:
+        return cast(
+            list[tuple[str, str | None]] | None,
+            self._call("get_service_servers", service_name),
+        )
+
+    def get_action_types(self, action_name: str) -> list[str]:
+        return cast(list[str], self._call("get_action_types", action_name))
+
+    def get_action_names_and_types(self) -> list[tuple[str, list[str]]]:
+        return cast(
+            list[tuple[str, list[str]]], self._call("get_action_names_and_types")
+        )
+
+    def get_action_servers(self, action_name: str) -> list[tuple[str, str]]:
+        return cast(
+            list[tuple[str, str]], self._call("get_action_servers", action_name)
+        )
+
+    def get_action_clients(self, action_name: str) -> list[tuple[str, str]]:
+        return cast(
+            list[tuple[str, str]], self._call("get_action_clients", action_name)
+        )
+
+    def get_msg_definition(self, msg_type: str) -> str:
+        return cast(str, self._call("get_msg_definition", msg_type))
+
+    def get_srv_definition(self, srv_type: str) -> str:
+        return cast(str, self._call("get_srv_definition", srv_type))
+
+    def get_action_definition(self, action_type: str) -> str:
+        return cast(str, self._call("get_action_definition", action_type))
+
+    def list_nodes(self) -> list[str]:
+        return cast(list[str], self._call("list_nodes"))
+
+    def list_topics(self, type: str | None = None) -> list[str]:
+        return cast(list[str], self._call("list_topics", type))
+
+    def list_services(self, type: str | None = None) -> list[str]:
+        return cast(list[str], self._call("list_services", type))
+
+    def list_actions(self, type: str | None = None) -> list[str]:
+        return cast(list[str], self._call("list_actions", type))
+
+    def list_msg_types(self) -> list[str]:
+        return cast(list[str], self._call("list_msg_types"))
+
+    def list_srv_types(self) -> list[str]:
+        return cast(list[str], self._call("list_srv_types"))
+
+    def list_action_types(self) -> list[str]:
+        return cast(list[str], self._call("list_action_types"))
@@ -3,7 +3,6 @@ from __future__ import annotations
 import typing as t
 from pathlib import Path
 from threading import Thread
-from time import sleep
 
 import rclpy
 import ros2action.api
@@ -15,8 +14,11 @@ from rclpy.action import (
     get_action_names_and_types,
     get_action_server_names_and_types_by_node,
 )
+from rclpy.callback_groups import MutuallyExclusiveCallbackGroup
 from rclpy.executors import MultiThreadedExecutor
 from rclpy.node import Node
+from rclpy.qos import qos_profile_sensor_data
+from rclpy.serialization import deserialize_message
 from rclpy.topic_endpoint_info import QoSProfile
 from rosidl_runtime_py import (
     get_action_interfaces,
@@ -24,8 +26,13 @@ from rosidl_runtime_py import (
     get_message_interfaces,
     get_service_interfaces,
 )
+from rosidl_runtime_py.utilities import get_message
 
-from .base import RosInterface, RosVersion
+from ..qos import QoS, seconds_from_nanoseconds
+from .base import RosInterface, RosVersion, TopicEndpoint
+from .type_cache import TypeCache
+
+GRAPH_WATCH_PERIOD = 0.2
 
 
 def _get_full_path(namespace: str, name: str) -> str:
@@ -56,6 +63,38 @@ def _flatten_name_types(
                 yield name, type_
 
 
+# QoS by value; a graph has only a handful of distinct profiles
+_qos_profiles: dict[tuple[t.Any, ...], QoS] = {}
+
+
+def _to_qos(profile: QoSProfile) -> QoS:
+    key = (
+        profile.reliability,
+        profile.durability,
+        profile.history,
+        profile.depth,
+        profile.deadline.nanoseconds,
+        profile.lifespan.nanoseconds,
+        profile.liveliness,
+        profile.liveliness_lease_duration.nanoseconds,
+    )
+    qos = _qos_profiles.get(key)
+    if qos is None:
+        qos = _qos_profiles[key] = QoS(
+            reliability=profile.reliability.name,
+            durability=profile.durability.name,
+            history=profile.history.name,
+            depth=profile.depth,
+            deadline=seconds_from_nanoseconds(profile.deadline.nanoseconds),
+            lifespan=seconds_from_nanoseconds(profile.lifespan.nanoseconds),
+            liveliness=profile.liveliness.name,
+            liveliness_lease_duration=seconds_from_nanoseconds(
+                profile.liveliness_lease_duration.nanoseconds
+            ),
+        )
+    return qos
+
+
 def _list_types_common(interfaces: dict[str, list[str]]) -> list[str]:
     full_types = []
     for package, type_names in interfaces.items():
@@ -67,6 +106,9 @@ def _list_types_common(interfaces: dict[str, list[str]]) -> list[str]:
 
 class Ros2(RosInterface):
     node: Node
+    _graph_callbacks: list[t.Callable[[], None]]
+    _graph_fingerprint: int | None = None
+    _type_cache: TypeCache
 
     def __init__(self, start_parameter_services: bool = False) -> None:
         if not rclpy.ok():
@@ -92,18 +134,86 @@ class Ros2(RosInterface):
         self.thread = Thread(target=executor.spin, daemon=True)
         self.thread.start()
 
-        sleep(0.01)
+        self._graph_callbacks = []
+        self._type_cache = TypeCache()
 
+        # discovery goes on in the background; see wait_for_discovery()
         super().__init__()
 
     def terminate(self) -> None:
         rclpy.shutdown()
         self.thread.join()
+        self._type_cache.flush()
 
     @classmethod
     def version(_cls) -> RosVersion:
         return RosVersion.ROS2
 
+    def watch_graph(self, callback: t.Callable[[], None]) -> bool:
+        """
+        rclpy does not expose the rcl graph guard condition, so the names and
+        types held in the local graph cache, and the number of publishers and
+        subscribers of every topic, are compared on the executor thread
+        instead. This is far cheaper than the per-entity endpoint queries.
+        """
+        self._graph_callbacks.append(callback)
+        if self._graph_fingerprint is None:
+            self._graph_fingerprint = self._get_graph_fingerprint()
+            self.node.create_timer(GRAPH_WATCH_PERIOD, self._check_graph)
+
+        return True
+
+    def _get_graph_fingerprint(self) -> int:
+        return hash(
+            (
+                frozenset(self.node.get_node_names_and_namespaces()),
+                # endpoints joining or leaving a topic that already exists
+                frozenset(
+                    (
+                        name,
+                        tuple(types),
+                        self.node.count_publishers(name),
+                        self.node.count_subscribers(name),
+                    )
+                    for name, types in self.node.get_topic_names_and_types()
+                ),
+                frozenset(
+                    (name, tuple(types))
+                    for name, types in self.node.get_service_names_and_types()
+                ),
+            )
+        )
+
+    def _check_graph(self) -> None:
+        fingerprint = self._get_graph_fingerprint()
+        if fingerprint == self._graph_fingerprint:
+            return
+
+        self._graph_fingerprint = fingerprint
+        for callback in self._graph_callbacks:
+            callback()
+
+    def subscribe_raw(
+        self,
+        topic_name: str,
+        topic_type: str,
+        callback: t.Callable[[bytes], None],
+    ) -> t.Callable[[], None]:
+        # best effort so that both reliable and best effort publishers match;
+        # one callback group per subscription keeps its callbacks sequential
+        subscription = self.node.create_subscription(
+            get_message(topic_type),
+            topic_name,
+            callback,
+            qos_profile_sensor_data,
+            callback_group=MutuallyExclusiveCallbackGroup(),
+            raw=True,
+        )
+        return lambda: self.node.destroy_subscription(subscription)
+
+    def deserialize_message(self, data: bytes, msg_type: str) -> t.Any:
+        return deserialize_message(data, get_message(msg_type))
+
     def get_node_publishers(self, node_name: str) -> list[tuple[str, str | None]]:
         return list(
             _flatten_node_info(
@@ -159,64 +269,53 @@ class Ros2(RosInterface):
         )
 
     def get_topic_types(self, topic_name: str) -> list[str]:
-        names_and_types: list[
-            tuple[str, list[str]]
-        ] = ros2topic.api.get_topic_names_and_types(
-            node=self.node, include_hidden_topics=True
-        )
-        for name, types in names_and_types:
+        for name, types in self.get_topic_names_and_types():
             if name == topic_name:
                 return types
 
         return []
 
-    def _format_qos(self, qos: QoSProfile) -> str:
-        return (
-            "qos_profile: {"
-            + f"reliability: {qos.reliability.name},"
-            + f"durability: {qos.durability.name},"
-            + f"history: {qos.history.name},"
-            + f"depth: {qos.depth},"
-            + f"liveliness: {qos.liveliness.name},"
-            + f"liveliness_lease_duration: {qos.liveliness_lease_duration},"
-            + f"avoid_ros_namespace_conventions: {qos.avoid_ros_namespace_conventions},"
-            + f"deadline: {qos.deadline},"
-            + f"lifespan: {qos.lifespan}"
-            + "}"
+    def get_topic_names_and_types(self) -> list[tuple[str, list[str]]]:
+        return list(
+            ros2topic.api.get_topic_names_and_types(
+                node=self.node, include_hidden_topics=True
+            )
         )
 
-    def get_topic_publishers(self, topic_name: str) -> list[tuple[str, str, str]]:
+    def get_topic_publishers(self, topic_name: str) -> list[TopicEndpoint]:
         pubs = self.node.get_publishers_info_by_topic(topic_name)
-        return list(
-            (
+        return [
+            TopicEndpoint(
                 _get_full_path(comm.node_namespace, comm.node_name),
                 comm.topic_type,
-                self._format_qos(comm.qos_profile),
+                _to_qos(comm.qos_profile),
             )
             for comm in pubs
-        )
+        ]
 
-    def get_topic_subscribers(self, topic_name: str) -> list[tuple[str, str, str]]:
+    def get_topic_subscribers(self, topic_name: str) -> list[TopicEndpoint]:
         subs = self.node.get_subscriptions_info_by_topic(topic_name)
-        return list(
-            (
+        return [
+            TopicEndpoint(
                 _get_full_path(comm.node_namespace, comm.node_name),
                 comm.topic_type,
-                self._format_qos(comm.qos_profile),
+                _to_qos(comm.qos_profile),
             )
             for comm in subs
-        )
+        ]
 
     def get_service_types(self, service_name: str) -> list[str]:
-        names_and_types = ros2service.api.get_service_names_and_types(
-            node=self.node, include_hidden_services=True
-        )
-        for name, types in names_and_types:
+        for name, types in self.get_service_names_and_types():
             if name == service_name:
                 return types
 
         return []
 
+    def get_service_names_and_types(self) -> list[tuple[str, list[str]]]:
+        return ros2service.api.get_service_names_and_types(
+            node=self.node, include_hidden_services=True
+        )
+
     def get_service_servers(self, service_name: str) -> None:
         """
         Unsupported for ROS2 because of the lack of API.
@@ -224,13 +323,15 @@ class Ros2(RosInterface):
         return None
 
     def get_action_types(self, action_name: str) -> list[str]:
-        names_and_types = ros2action.api.get_action_names_and_types(node=self.node)
-        for name, types in names_and_types:
+        for name, types in self.get_action_names_and_types():
             if name == action_name:
                 return types
 
         return []
 
+    def get_action_names_and_types(self) -> list[tuple[str, list[str]]]:
+        return ros2action.api.get_action_names_and_types(node=self.node)
+
     def get_action_servers(self, action_name: str) -> list[str]:
         _, servers = ros2action.api.get_action_clients_and_servers(
             node=self.node, action_name=action_name
@@ -243,9 +344,10 @@ class Ros2(RosInterface):
         )
         return list(_flatten_name_types(clients))
 
-    @staticmethod
-    def __common_get_type_definition(type: str) -> str:
-        return Path(get_interface_path(type)).read_text()
+    def __common_get_type_definition(self, type: str) -> str:
+        return self._type_cache.get_definition(
+            type, lambda: Path(get_interface_path(type)).read_text()
+        )
 
     def get_msg_definition(self, msg_type: str) -> str:
         return self.__common_get_type_definition(msg_type)
@@ -279,10 +381,16 @@ class Ros2(RosInterface):
         return names
 
     def list_msg_types(self) -> list[str]:
-        return _list_types_common(get_message_interfaces())
+        return self._type_cache.get_types(
+            "msg", lambda: _list_types_common(get_message_interfaces())
+        )
 
     def list_srv_types(self) -> list[str]:
-        return _list_types_common(get_service_interfaces())
+        return self._type_cache.get_types(
+            "srv", lambda: _list_types_common(get_service_interfaces())
+        )
 
     def list_action_types(self) -> list[str]:
-        return _list_types_common(get_action_interfaces())
+        return self._type_cache.get_types(
+            "action", lambda: _list_types_common(get_action_interfaces())
+        )
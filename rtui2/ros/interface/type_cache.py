@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from contextlib import suppress
+from os import environ
+from pathlib import Path
+from threading import Lock
+from time import monotonic
+from typing import Any, Callable
+
+CACHE_VERSION = 1
+# caches of this many package sets (e.g. workspaces) are kept, the most
+# recently used ones
+MAX_CACHE_FILES = 4
+# values loaded within this many seconds of a save are written together
+SAVE_INTERVAL = 5.0
+INTERFACE_INDEX = Path("share", "ament_index", "resource_index", "rosidl_interfaces")
+
+
+def default_cache_dir() -> Path:
+    cache_home = environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "rtui2"
+
+
+def _index_fingerprint(prefix_path: str) -> str:
+    """
+    Hash of AMENT_PREFIX_PATH and the mtimes of every rosidl_interfaces index
+    entry, which changes whenever a package with interfaces is (re)installed.
+    """
+    digest = hashlib.sha1(f"{CACHE_VERSION}:{prefix_path}".encode())
+    for prefix in prefix_path.split(os.pathsep):
+        index = Path(prefix) / INTERFACE_INDEX
+        try:
+            entries = sorted(os.scandir(index), key=lambda e: e.name)
+            digest.update(f"{index}:{index.stat().st_mtime_ns}".encode())
+        except OSError:
+            continue
+
+        for entry in entries:
+            digest.update(f"{entry.name}:{entry.stat().st_mtime_ns}".encode())
+
+    return digest.hexdigest()
+
+
+class TypeCache:
+    """
+    Persistent cache of the interface type catalog and type definitions, stored
+    under ``$XDG_CACHE_HOME/rtui2``. Failing to read or write the cache is not
+    an error; the values are then simply loaded again.
+
+    New values are written at most once per ``SAVE_INTERVAL``; call
+    :meth:`flush` before exiting to write the rest.
+    """
+
+    def __init__(
+        self, cache_dir: Path | None = None, prefix_path: str | None = None
+    ) -> None:
+        self._cache_dir = cache_dir or default_cache_dir()
+        self._prefix_path = (
+            environ.get("AMENT_PREFIX_PATH", "") if prefix_path is None else prefix_path
+        )
+        self._path: Path | None = None
+        self._data: dict[str, Any] | None = None
+        self._dirty = False
+        self._saved: float | None = None
+        self._lock = Lock()
+
+    @property
+    def path(self) -> Path:
+        if self._path is None:
+            fingerprint = _index_fingerprint(self._prefix_path)
+            self._path = self._cache_dir / f"types-{fingerprint[:16]}.json"
+        return self._path
+
+    def _load(self) -> dict[str, Any]:
+        if self._data is None:
+            try:
+                self._data = json.loads(self.path.read_text())
+                # marks the cache as recently used for pruning
+                os.utime(self.path)
+            except (OSError, ValueError):
+                self._data = {}
+        return self._data
+
+    def _save(self) -> None:
+        first_save = self._saved is None
+        self._dirty = False
+        self._saved = monotonic()
+
+        tmp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(json.dumps(self._data))
+            os.replace(tmp_path, self.path)
+        except OSError:
+            with suppress(OSError):
+                tmp_path.unlink()
+            return
+
+        if first_save:
+            self._prune()
+
+    def _prune(self) -> None:
+        """Drop the least recently used caches beyond ``MAX_CACHE_FILES``."""
+        mtimes = {}
+        for path in self._cache_dir.glob("types-*.json"):
+            with suppress(OSError):
+                mtimes[path] = path.stat().st_mtime
+        for stale in sorted(mtimes, key=mtimes.__getitem__)[:-MAX_CACHE_FILES]:
+            with suppress(OSError):
+                stale.unlink()
+
+    def _changed(self) -> None:
+        self._dirty = True
+        if self._saved is None or monotonic() - self._saved > SAVE_INTERVAL:
+            self._save()
+
+    def flush(self) -> None:
+        """Write the values loaded since the last save, if any."""
+        with self._lock:
+            if self._dirty:
+                self._save()
+
+    def get_types(self, kind: str, load: Callable[[], list[str]]) -> list[str]:
+        with self._lock:
+            types = self._load().setdefault("types", {})
+            if kind not in types:
+                types[kind] = load()
+                self._changed()
+            return list(types[kind])
+
+    def get_definition(self, type: str, load: Callable[[], str]) -> str:
+        with self._lock:
+            definitions = self._load().setdefault("definitions", {})
+            if type not in definitions:
+                definitions[type] = load()
+                self._changed()
+            return str(definitions[type])
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import array
+from typing import Any, Iterator
+
+# arrays longer than this are summarized instead of printed in full
+ARRAY_SUMMARY_LIMIT = 64
+ARRAY_PREVIEW_LENGTH = 8
+STRING_LIMIT = 1000
+INDENT = "  "
+
+_SEQUENCE_TYPES = (list, tuple, bytes, bytearray, array.array)
+
+
+def _is_message(value: Any) -> bool:
+    return hasattr(value, "get_fields_and_field_types")
+
+
+def _is_sequence(value: Any) -> bool:
+    # duck-typed for NumPy arrays so that NumPy is not imported here
+    return isinstance(value, _SEQUENCE_TYPES) or getattr(value, "ndim", 0) > 0
+
+
+def _format_scalar(value: Any) -> str:
+    if isinstance(value, str):
+        if len(value) > STRING_LIMIT:
+            return f"{value[:STRING_LIMIT]!r}... <{len(value)} chars>"
+        return repr(value)
+    return str(value)
+
+
+def _format_fields(msg: Any, depth: int, limit: int) -> Iterator[str]:
+    for field, field_type in msg.get_fields_and_field_types().items():
+        prefix = f"{INDENT * depth}{field}"
+        yield from _format_value(prefix, field_type, getattr(msg, field), depth, limit)
+
+
+def _format_value(
+    prefix: str, field_type: str, value: Any, depth: int, limit: int
+) -> Iterator[str]:
+    if _is_message(value):
+        yield f"{prefix}:"
+        yield from _format_fields(value, depth + 1, limit)
+    elif not _is_sequence(value):
+        yield f"{prefix}: {_format_scalar(value)}"
+    elif len(value) > limit:
+        summary = f"{prefix}: <{field_type}, {len(value)} elements>"
+        if len(value) and not _is_message(value[0]):
+            preview = ", ".join(map(_format_scalar, value[:ARRAY_PREVIEW_LENGTH]))
+            summary += f" [{preview}, ...]"
+        yield summary
+    elif len(value) and _is_message(value[0]):
+        yield f"{prefix}:"
+        for item in value:
+            yield f"{INDENT * (depth + 1)}-"
+            yield from _format_fields(item, depth + 2, limit)
+    else:
+        yield f"{prefix}: [{', '.join(map(_format_scalar, value))}]"
+
+
+def format_message(msg: Any, array_limit: int = ARRAY_SUMMARY_LIMIT) -> str:
+    """
+    YAML-like text of a deserialized message. Arrays longer than
+    ``array_limit`` (image pixels, point cloud data, ...) are shown as their
+    length and first few elements only.
+    """
+    return "\n".join(_format_fields(msg, 0, array_limit))
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Iterable
+
+if TYPE_CHECKING:
+    from .interface import TopicEndpoint
+
+# RMW_DURATION_INFINITE; 0 (unspecified) is also treated as infinite
+INFINITE_NANOSECONDS = 2**63 - 1
+
+_LIVELINESS_STRENGTH = {"AUTOMATIC": 0, "MANUAL_BY_NODE": 1, "MANUAL_BY_TOPIC": 2}
+
+
+def seconds_from_nanoseconds(nanoseconds: int) -> float | None:
+    """Seconds of a QoS duration, None if it is infinite."""
+    if nanoseconds <= 0 or nanoseconds >= INFINITE_NANOSECONDS:
+        return None
+    return nanoseconds / 1e9
+
+
+def _format_seconds(seconds: float | None) -> str:
+    return "∞" if seconds is None else f"{seconds:g} s"
+
+
+@dataclass(frozen=True, slots=True)
+class QoS:
+    """
+    QoS profile of a topic endpoint. Policies are kept as their rmw names
+    (e.g. ``RELIABLE``), durations in seconds with None meaning infinite.
+    """
+
+    reliability: str
+    durability: str
+    history: str
+    depth: int
+    deadline: float | None = None
+    lifespan: float | None = None
+    liveliness: str = "AUTOMATIC"
+    liveliness_lease_duration: float | None = None
+
+    def __str__(self) -> str:
+        history = (
+            f"{self.history}({self.depth})"
+            if self.history == "KEEP_LAST"
+            else self.history
+        )
+        return (
+            f"{self.reliability}, {self.durability}, {history}, "
+            f"deadline {_format_seconds(self.deadline)}, "
+            f"lifespan {_format_seconds(self.lifespan)}, "
+            f"{self.liveliness} liveliness "
+            f"(lease {_format_seconds(self.liveliness_lease_duration)})"
+        )
+
+
+def _longer(offered: float | None, requested: float | None) -> bool:
+    if requested is None:
+        return False
+    return offered is None or offered > requested
+
+
+def incompatibilities(publisher: QoS, subscriber: QoS) -> list[str]:
+    """
+    Reasons why a subscription does not receive from a publisher, following
+    the request vs offered rules of ROS 2. Empty if they are compatible.
+    """
+    reasons = []
+    if publisher.reliability == "BEST_EFFORT" and subscriber.reliability == "RELIABLE":
+        reasons.append("BEST_EFFORT publisher, RELIABLE subscription")
+    if (
+        publisher.durability == "VOLATILE"
+        and subscriber.durability == "TRANSIENT_LOCAL"
+    ):
+        reasons.append("VOLATILE publisher, TRANSIENT_LOCAL subscription")
+    if _longer(publisher.deadline, subscriber.deadline):
+        reasons.append(
+            f"publisher deadline {_format_seconds(publisher.deadline)} > "
+            f"subscription deadline {_format_seconds(subscriber.deadline)}"
+        )
+    if _LIVELINESS_STRENGTH.get(publisher.liveliness, 0) < _LIVELINESS_STRENGTH.get(
+        subscriber.liveliness, 0
+    ):
+        reasons.append(
+            f"{publisher.liveliness} publisher, "
+            f"{subscriber.liveliness} subscription liveliness"
+        )
+    if _longer(
+        publisher.liveliness_lease_duration, subscriber.liveliness_lease_duration
+    ):
+        reasons.append(
+            "publisher liveliness lease "
+            f"{_format_seconds(publisher.liveliness_lease_duration)} > subscription "
+            f"lease {_format_seconds(subscriber.liveliness_lease_duration)}"
+        )
+    return reasons
+
+
+@dataclass(frozen=True, slots=True)
+class QoSIncompatibility:
+    publisher: TopicEndpoint
+    subscriber: TopicEndpoint
+    reasons: tuple[str, ...]
+
+
+def _endpoint_qos(
+    endpoints: Iterable[TopicEndpoint],
+) -> list[tuple[TopicEndpoint, QoS]]:
+    # endpoints without QoS (unsupported) cannot be checked
+    return [
+        (endpoint, endpoint.qos) for endpoint in endpoints if endpoint.qos is not None
+    ]
+
+
+def find_incompatibilities(
+    publishers: Iterable[TopicEndpoint],
+    subscribers: Iterable[TopicEndpoint],
+) -> list[QoSIncompatibility]:
+    """Every publisher and subscription pair of one topic that cannot match."""
+    subscriber_qos = _endpoint_qos(subscribers)
+    # endpoints mostly share a few profiles; check each distinct pair once
+    checked: dict[tuple[QoS, QoS], tuple[str, ...]] = {}
+    found = []
+    for publisher, pub_qos in _endpoint_qos(publishers):
+        for subscriber, sub_qos in subscriber_qos:
+            reasons = checked.get((pub_qos, sub_qos))
+            if reasons is None:
+                reasons = checked[pub_qos, sub_qos] = tuple(
+                    incompatibilities(pub_qos, sub_qos)
+                )
+            if reasons:
+                found.append(QoSIncompatibility(publisher, subscriber, reasons))
+    return found
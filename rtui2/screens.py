@@ -1,18 +1,30 @@
 from __future__ import annotations
 
+from rich.table import Table
 from textual.app import ComposeResult
+from textual.binding import Binding
 from textual.containers import Horizontal, ScrollableContainer, Vertical
-from textual.screen import Screen
-from textual.widgets import Footer
+from textual.screen import ModalScreen, Screen
+from textual.widgets import Footer, Static, TabbedContent, TabPane
 
-from .ros import RosClient, RosEntity, RosEntityType
+from .ros import AsyncRosClient, RosEntity, RosEntityType
+from .ros.dependency_graph import DEFAULT_MAX_DEPTH
+from .utility import Profiler
+from .utility.profiler import HISTOGRAM_LABELS
 from .widgets import (
     RosEntityGraphPanel,
     RosEntityInfoPanel,
     RosEntityListPanel,
+    RosTopicEchoPanel,
+    RosTopicStatsPanel,
     RosTypeDefinitionPanel,
 )
 
+UPDATE_INTERVAL = 5.0
+FALLBACK_UPDATE_INTERVAL = 30.0
+PROFILE_REFRESH_INTERVAL = 1.0
+HISTOGRAM_BARS = " ▁▂▃▄▅▆▇█"
+
 
 class RosEntityInspection(Screen):
     _entity_type: RosEntityType
@@ -21,6 +33,9 @@ class RosEntityInspection(Screen):
     _info_panel: RosEntityInfoPanel
     _graph_panel: RosEntityGraphPanel
     _definition_panel: RosTypeDefinitionPanel | None = None
+    _stats_panel: RosTopicStatsPanel | None = None
+    _echo_panel: RosTopicEchoPanel | None = None
+    _graph_changed: bool = False
 
     DEFAULT_CSS = """
     .container {
@@ -44,23 +59,52 @@ class RosEntityInspection(Screen):
     .main-half {
         height: 50%;
     }
+
+    #main-lower {
+        height: 1fr;
+    }
+
+    #main-lower TabPane {
+        padding: 0;
+    }
     """
 
-    def __init__(self, ros: RosClient, entity_type: RosEntityType) -> None:
+    def __init__(
+        self,
+        ros: AsyncRosClient,
+        entity_type: RosEntityType,
+        watching_graph: bool = False,
+        graph_depth: int = DEFAULT_MAX_DEPTH,
+        list_refresh: float | None = None,
+    ) -> None:
         super().__init__()
         self._entity_type = entity_type
         self._entity_name = None
-        self._list_panel = RosEntityListPanel(ros, entity_type)
+        self._list_panel = RosEntityListPanel(
+            ros,
+            entity_type,
+            # type lists do not depend on the graph
+            auto_refresh=None if entity_type.has_definition() else list_refresh,
+        )
         self._info_panel = RosEntityInfoPanel(
             ros,
             None,
-            update_interval=5.0,
+            update_interval=FALLBACK_UPDATE_INTERVAL
+            if watching_graph
+            else UPDATE_INTERVAL,
         )
         self._graph_panel = RosEntityGraphPanel(
-            ros, None, on_highlighted_changed=self._info_panel.set_entity
+            ros,
+            None,
+            on_highlighted_changed=self._info_panel.set_entity,
+            max_depth=graph_depth,
         )
         if entity_type.has_definition():
             self._definition_panel = RosTypeDefinitionPanel(ros)
+        if entity_type == RosEntityType.Topic:
+            self._stats_panel = RosTopicStatsPanel(ros)
+            # subscribed only while its tab is shown
+            self._echo_panel = RosTopicEchoPanel(ros, active=False)
 
     def set_entity_name(self, name: str) -> None:
         self._entity_name = name
@@ -69,10 +113,53 @@ class RosEntityInspection(Screen):
         self._graph_panel.set_entity(entity)
         if self._definition_panel is not None:
             self._definition_panel.set_entity(entity)
+        if self._stats_panel is not None:
+            self._stats_panel.set_topic(name)
+        if self._echo_panel is not None:
+            self._echo_panel.set_topic(name)
 
     def force_update(self) -> None:
         self._list_panel.update_items()
 
+    def on_graph_changed(self) -> None:
+        if not self.is_current:
+            self._graph_changed = True
+            return
+
+        self._graph_changed = False
+        if not self._entity_type.has_definition():
+            # type lists do not depend on the graph
+            self._list_panel.update_items()
+        self._info_panel.update_info()
+        self._graph_panel.refresh_graph()
+
+    def _echo_shown(self) -> bool:
+        return self.query_one(TabbedContent).active == "echo"
+
+    def on_screen_resume(self) -> None:
+        if self._stats_panel is not None:
+            self._stats_panel.resume()
+        if self._echo_panel is not None and self._echo_shown():
+            self._echo_panel.resume()
+        if self._graph_changed:
+            self.on_graph_changed()
+
+    def on_screen_suspend(self) -> None:
+        # do not keep subscriptions alive behind another screen
+        if self._stats_panel is not None:
+            self._stats_panel.suspend()
+        if self._echo_panel is not None:
+            self._echo_panel.suspend()
+
+    def on_tabbed_content_tab_activated(self, _: TabbedContent.TabActivated) -> None:
+        if self._echo_panel is None:
+            return
+
+        if self._echo_shown():
+            self._echo_panel.resume()
+        else:
+            self._echo_panel.suspend()
+
     def compose(self) -> ComposeResult:
         yield Footer()
         with Horizontal(classes="container"):
@@ -82,10 +169,97 @@ class RosEntityInspection(Screen):
                 if self._definition_panel is None:
                     with ScrollableContainer(id="main-upper", classes="main-half"):
                         yield self._graph_panel
-                    with ScrollableContainer(classes="main-half"):
-                        yield self._info_panel
+                    if self._echo_panel is None:
+                        with ScrollableContainer(id="main-lower"):
+                            yield self._info_panel
+                    else:
+                        with TabbedContent(id="main-lower"):
+                            with TabPane("Info", id="info"):
+                                with ScrollableContainer():
+                                    yield self._info_panel
+                            with TabPane("Echo", id="echo"):
+                                with ScrollableContainer():
+                                    yield self._echo_panel
+                    if self._stats_panel is not None:
+                        yield self._stats_panel
                 else:
                     with ScrollableContainer(id="main-upper", classes="main-half"):
                         yield self._definition_panel
                     with ScrollableContainer(classes="main-half"):
                         yield self._info_panel
+
+
+def _histogram_bars(histogram: list[int]) -> str:
+    peak = max(histogram) or 1
+    return "".join(
+        HISTOGRAM_BARS[(count * (len(HISTOGRAM_BARS) - 1) + peak - 1) // peak]
+        for count in histogram
+    )
+
+
+class ProfileScreen(ModalScreen[None]):
+    """Latency of the ROS queries and panel updates recorded by ``--profile``."""
+
+    _profiler: Profiler
+    _table: Static
+
+    DEFAULT_CSS = """
+    ProfileScreen {
+        align: center middle;
+    }
+
+    ProfileScreen > ScrollableContainer {
+        width: auto;
+        max-width: 100%;
+        height: auto;
+        max-height: 90%;
+        border: round $primary;
+        background: $panel;
+    }
+    """
+
+    BINDINGS = [
+        Binding("f12,escape", "dismiss", "Close", key_display="F12"),
+        Binding("c", "clear", "Clear", key_display="c"),
+    ]
+
+    def __init__(self, profiler: Profiler) -> None:
+        super().__init__()
+        self._profiler = profiler
+        self._table = Static()
+
+    def compose(self) -> ComposeResult:
+        with ScrollableContainer():
+            yield self._table
+        yield Footer()
+
+    def on_mount(self) -> None:
+        self._update_table()
+        self.set_interval(PROFILE_REFRESH_INTERVAL, self._update_table)
+
+    def _update_table(self) -> None:
+        table = Table(
+            title="Profile",
+            caption=f"latency {HISTOGRAM_LABELS[0]} .. {HISTOGRAM_LABELS[-1]}",
+        )
+        table.add_column("Operation")
+        for header in ("Calls", "Errors", "Total ms", "Mean ms", "Max ms", "Items"):
+            table.add_column(header, justify="right")
+        table.add_column("Latency")
+
+        for name, stats in self._profiler.snapshot().items():
+            table.add_row(
+                name,
+                str(stats.calls),
+                str(stats.errors) if stats.errors else "",
+                f"{stats.total * 1e3:.1f}",
+                f"{stats.mean * 1e3:.2f}",
+                f"{stats.max * 1e3:.2f}",
+                str(stats.items) if stats.items else "",
+                _histogram_bars(stats.histogram),
+            )
+        self._table.update(table)
+
+    def action_clear(self) -> None:
+        self._profiler.reset()
+        self._update_table()
@@ -1,3 +1,14 @@
+from .fuzzy import FuzzyIndex
 from .hisotry import History
+from .profiler import Profiler, profiled
+from .rate import RateMonitor, RateStats, RateTable
 
-__all__ = ["History"]
+__all__ = [
+    "FuzzyIndex",
+    "History",
+    "Profiler",
+    "RateMonitor",
+    "RateStats",
+    "RateTable",
+    "profiled",
+]
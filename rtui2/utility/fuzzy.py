@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+import re
+from typing import Iterable
+
+
+class FuzzyIndex:
+    """
+    Case-insensitive subsequence matcher over a fixed list of strings.
+    When a query extends the previous one, only the previous matches are
+    scanned again, so results narrow cheaply on each keystroke.
+    """
+
+    def __init__(self, items: Iterable[str]) -> None:
+        self._items = list(items)
+        self._lowered = [item.lower() for item in self._items]
+        self._query = ""
+        self._matches = list(range(len(self._items)))
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def search(self, query: str) -> list[str]:
+        query = query.lower()
+        if query.startswith(self._query):
+            candidates: Iterable[int] = self._matches
+        else:
+            candidates = range(len(self._items))
+
+        pattern = re.compile(".*?".join(map(re.escape, query)))
+        lowered = self._lowered
+        self._matches = [i for i in candidates if pattern.search(lowered[i])]
+        self._query = query
+
+        return [self._items[i] for i in self._matches]
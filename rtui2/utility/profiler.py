@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import inspect
+import json
+from bisect import bisect_right
+from dataclasses import dataclass, field, replace
+from functools import wraps
+from threading import Lock
+from time import monotonic, perf_counter
+from typing import Any, Callable, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# upper bounds (seconds) of the latency histogram buckets; the last is open
+HISTOGRAM_BOUNDS = (1e-5, 1e-4, 1e-3, 1e-2, 1e-1, 1.0)
+HISTOGRAM_LABELS = ("<10us", "<100us", "<1ms", "<10ms", "<100ms", "<1s", ">=1s")
+
+
+def result_size(value: Any) -> int:
+    """
+    Entries of a returned value (bytes of bytes or str), 0 if it has no
+    length. Counted rather than serialized, so that profiling stays cheap.
+    """
+    try:
+        return len(value)
+    except Exception:
+        return 0
+
+
+@dataclass
+class CallStats:
+    calls: int = 0
+    errors: int = 0
+    total: float = 0.0
+    max: float = 0.0
+    items: int = 0
+    histogram: list[int] = field(default_factory=lambda: [0] * len(HISTOGRAM_LABELS))
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.calls if self.calls else 0.0
+
+    def record(self, elapsed: float, size: int, error: bool) -> None:
+        self.calls += 1
+        self.errors += error
+        self.total += elapsed
+        self.max = max(self.max, elapsed)
+        self.items += size
+        self.histogram[bisect_right(HISTOGRAM_BOUNDS, elapsed)] += 1
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "total": self.total,
+            "mean": self.mean,
+            "max": self.max,
+            "items": self.items,
+            "histogram": dict(zip(HISTOGRAM_LABELS, self.histogram)),
+        }
+
+
+class Profiler:
+    """
+    Call counts, latency histograms and returned entries per named operation,
+    recorded from any thread (ROS queries run on an executor).
+    """
+
+    def __init__(self) -> None:
+        self._stats: dict[str, CallStats] = {}
+        self._lock = Lock()
+        self._started = monotonic()
+
+    def record(
+        self, name: str, elapsed: float, size: int = 0, error: bool = False
+    ) -> None:
+        with self._lock:
+            stats = self._stats.get(name)
+            if stats is None:
+                stats = self._stats[name] = CallStats()
+            stats.record(elapsed, size, error)
+
+    def call(
+        self, name: str, fn: Callable[..., Any], *args: Any, sized: bool = True
+    ) -> Any:
+        """Call ``fn`` and record it; the size is computed outside the timing."""
+        started = perf_counter()
+        try:
+            result = fn(*args)
+        except Exception:
+            self.record(name, perf_counter() - started, error=True)
+            raise
+
+        elapsed = perf_counter() - started
+        self.record(name, elapsed, result_size(result) if sized else 0)
+        return result
+
+    def snapshot(self) -> dict[str, CallStats]:
+        """Copies of the statistics, by descending total time."""
+        with self._lock:
+            stats = [
+                (name, replace(stats, histogram=[*stats.histogram]))
+                for name, stats in self._stats.items()
+            ]
+        return dict(sorted(stats, key=lambda item: item[1].total, reverse=True))
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats = {}
+            self._started = monotonic()
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "elapsed": monotonic() - self._started,
+            "operations": {
+                name: stats.to_dict() for name, stats in self.snapshot().items()
+            },
+        }
+
+    def write(self, path: str) -> None:
+        with open(path, "w") as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+
+# the profiler of this process; None unless profiling was requested
+_profiler: Profiler | None = None
+
+
+def enable_profiling() -> Profiler:
+    global _profiler
+    if _profiler is None:
+        _profiler = Profiler()
+    return _profiler
+
+
+def disable_profiling() -> None:
+    global _profiler
+    _profiler = None
+
+
+def active_profiler() -> Profiler | None:
+    return _profiler
+
+
+def profiled(name: str) -> Callable[[F], F]:
+    """
+    Record every call of the decorated function or coroutine function while
+    profiling is enabled. Otherwise the only overhead is a check for None.
+    """
+
+    def decorator(fn: F) -> F:
+        if inspect.iscoroutinefunction(fn):
+
+            @wraps(fn)
+            async def profiled_coroutine(*args: Any, **kwargs: Any) -> Any:
+                profiler = _profiler
+                if profiler is None:
+                    return await fn(*args, **kwargs)
+
+                started = perf_counter()
+                error = False
+                try:
+                    return await fn(*args, **kwargs)
+                except Exception:
+                    error = True
+                    raise
+                finally:
+                    profiler.record(name, perf_counter() - started, error=error)
+
+            return profiled_coroutine  # type: ignore[return-value]
+
+        @wraps(fn)
+        def profiled_function(*args: Any, **kwargs: Any) -> Any:
+            profiler = _profiler
+            if profiler is None:
+                return fn(*args, **kwargs)
+            return profiler.call(name, lambda: fn(*args, **kwargs), sized=False)
+
+        return profiled_function  # type: ignore[return-value]
+
+    return decorator
@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from threading import Lock
+from time import monotonic
+
+import numpy as np
+import numpy.typing as npt
+
+DEFAULT_WINDOW_SIZE = 10000
+DEFAULT_WINDOW_SEC = 5.0
+DEFAULT_TABLE_WINDOW_SIZE = 1000
+
+
+def format_bytes(size: float) -> str:
+    if size < 1000:
+        return f"{size:.0f} B"
+    for unit in ("KB", "MB", "GB"):
+        size /= 1000
+        if size < 1000:
+            break
+    return f"{size:.1f} {unit}"
+
+
+@dataclass(frozen=True)
+class RateStats:
+    count: int
+    hz: float
+    min_period: float
+    max_period: float
+    jitter: float
+    bytes_per_sec: float
+    mean_size: float
+
+
+class RateMonitor:
+    """
+    Receive rate and bandwidth of a message stream over a sliding window.
+
+    Receive times and sizes are written into preallocated ring buffers, so
+    :meth:`record` is O(1) and safe to call from a subscription callback at
+    kHz rates; the statistics are computed with NumPy only when requested.
+    """
+
+    def __init__(
+        self,
+        window_size: int = DEFAULT_WINDOW_SIZE,
+        window_sec: float = DEFAULT_WINDOW_SEC,
+    ) -> None:
+        self._stamps = np.zeros(window_size, dtype=np.float64)
+        self._sizes = np.zeros(window_size, dtype=np.int64)
+        self._window_sec = window_sec
+        self._head = 0
+        self._count = 0
+        self._lock = Lock()
+
+    def record(self, size: int, stamp: float | None = None) -> None:
+        if stamp is None:
+            stamp = monotonic()
+
+        with self._lock:
+            self._stamps[self._head] = stamp
+            self._sizes[self._head] = size
+            self._head = (self._head + 1) % len(self._stamps)
+            self._count = min(self._count + 1, len(self._stamps))
+
+    def reset(self) -> None:
+        with self._lock:
+            self._head = 0
+            self._count = 0
+
+    def _window(
+        self, now: float
+    ) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.int64]]:
+        with self._lock:
+            order = np.arange(self._head - self._count, self._head) % len(self._stamps)
+            stamps = self._stamps[order]
+            sizes = self._sizes[order]
+
+        recent = stamps >= now - self._window_sec
+        return stamps[recent], sizes[recent]
+
+    def stats(self, now: float | None = None) -> RateStats | None:
+        """Statistics of the last ``window_sec`` seconds, None if too few messages."""
+        stamps, sizes = self._window(monotonic() if now is None else now)
+        if len(stamps) < 2:
+            return None
+
+        periods = np.diff(stamps)
+        span = stamps[-1] - stamps[0]
+        if span <= 0:
+            return None
+
+        return RateStats(
+            count=len(stamps),
+            hz=len(periods) / span,
+            min_period=float(periods.min()),
+            max_period=float(periods.max()),
+            jitter=float(periods.std()),
+            # the first message only opens the window
+            bytes_per_sec=float(sizes[1:].sum()) / span,
+            mean_size=float(sizes.mean()),
+        )
+
+
+@dataclass(frozen=True)
+class RateTableStats:
+    """Per-row statistics; NaN where a row has fewer than two messages."""
+
+    count: npt.NDArray[np.int64]
+    hz: npt.NDArray[np.float64]
+    max_period: npt.NDArray[np.float64]
+    bytes_per_sec: npt.NDArray[np.float64]
+
+
+class RateTable:
+    """
+    :class:`RateMonitor` for many streams at once: row ``i`` of two 2D ring
+    buffers holds the receive times and sizes of stream ``i``. Recording is
+    O(1), and the statistics of all rows are computed in one vectorized pass,
+    so the cost grows linearly with the number of streams.
+    """
+
+    def __init__(
+        self,
+        window_size: int = DEFAULT_TABLE_WINDOW_SIZE,
+        window_sec: float = DEFAULT_WINDOW_SEC,
+        capacity: int = 64,
+    ) -> None:
+        self._window_size = window_size
+        self._window_sec = window_sec
+        self._stamps = np.zeros((capacity, window_size), dtype=np.float64)
+        self._sizes = np.zeros((capacity, window_size), dtype=np.int64)
+        self._heads = np.zeros(capacity, dtype=np.int64)
+        self._counts = np.zeros(capacity, dtype=np.int64)
+        self._rows = 0
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return self._rows
+
+    def add_row(self) -> int:
+        with self._lock:
+            if self._rows == len(self._stamps):
+                self._grow()
+            self._rows += 1
+            return self._rows - 1
+
+    def _grow(self) -> None:
+        capacity = len(self._stamps)
+        self._stamps = np.concatenate([self._stamps, np.zeros_like(self._stamps)])
+        self._sizes = np.concatenate([self._sizes, np.zeros_like(self._sizes)])
+        self._heads = np.concatenate([self._heads, np.zeros(capacity, np.int64)])
+        self._counts = np.concatenate([self._counts, np.zeros(capacity, np.int64)])
+
+    def record(self, row: int, size: int, stamp: float | None = None) -> None:
+        if stamp is None:
+            stamp = monotonic()
+
+        with self._lock:
+            head = self._heads[row]
+            self._stamps[row, head] = stamp
+            self._sizes[row, head] = size
+            self._heads[row] = (head + 1) % self._window_size
+            self._counts[row] = min(self._counts[row] + 1, self._window_size)
+
+    def stats(self, now: float | None = None) -> RateTableStats:
+        """Statistics of the last ``window_sec`` seconds of every row."""
+        if now is None:
+            now = monotonic()
+
+        with self._lock:
+            rows = self._rows
+            stamps = self._stamps[:rows].copy()
+            sizes = self._sizes[:rows].copy()
+            counts = self._counts[:rows].copy()
+
+        slots = np.arange(self._window_size)
+        valid = (slots < counts[:, None]) & (stamps >= now - self._window_sec)
+        count = valid.sum(axis=1)
+        enough = count >= 2
+
+        # sorting moves the valid stamps of each row to the front, in order
+        ordered = np.sort(np.where(valid, stamps, np.inf), axis=1)
+        index = np.arange(rows)
+        first = ordered[:, 0]
+        last = ordered[index, np.maximum(count - 1, 0)]
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            span = last - first
+            enough &= span > 0
+            periods = np.diff(ordered, axis=1)
+            periods = np.where(slots[:-1] < (count - 1)[:, None], periods, -np.inf)
+            max_period = periods.max(axis=1, initial=-np.inf)
+
+            # the first message only opens the window
+            first_size = sizes[
+                index, np.argmin(np.where(valid, stamps, np.inf), axis=1)
+            ]
+            total = np.where(valid, sizes, 0).sum(axis=1) - first_size
+            hz = np.where(enough, (count - 1) / span, np.nan)
+            bytes_per_sec = np.where(enough, total / span, np.nan)
+            max_period = np.where(enough, max_period, np.nan)
+
+        return RateTableStats(
+            count=count,
+            hz=hz,
+            max_period=max_period,
+            bytes_per_sec=bytes_per_sec,
+        )
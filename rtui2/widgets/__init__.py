@@ -1,11 +1,15 @@
 from .graph_panel import RosEntityGraphPanel
 from .info_panel import RosEntityInfoPanel
 from .list_panel import RosEntityListPanel
+from .topic_echo import RosTopicEchoPanel
+from .topic_stats import RosTopicStatsPanel
 from .type_definition import RosTypeDefinitionPanel
 
 __all__ = [
     "RosEntityInfoPanel",
     "RosEntityListPanel",
     "RosEntityGraphPanel",
+    "RosTopicEchoPanel",
+    "RosTopicStatsPanel",
     "RosTypeDefinitionPanel",
 ]
@@ -1,17 +1,19 @@
 from __future__ import annotations
 
-from typing import Callable
+from collections import deque
+from typing import Any, Callable
 
 from rich.text import Text
+from textual import work
 from textual.app import ComposeResult
 from textual.events import Key
 from textual.widgets import Static, Tree
 from textual.widgets.tree import TreeNode
 
-from ..ros import RosClient, RosEntity, RosEntityType
-from ..ros.dependency_graph import RosDependencyGraph, RosDependencyNode
-
-EXPAND_UP_TO_NODES = 1
+from ..ros import AsyncRosClient, RosEntity, RosEntityType
+from ..ros.dependency_graph import DEFAULT_MAX_DEPTH, get_dependencies
+from ..utility import profiled
+from .placeholder import LOADING
 
 
 class TreeLabel:
@@ -30,6 +32,13 @@ class TreeLabel:
         text.stylize("bold underline")
         return text
 
+    @staticmethod
+    def back_reference(entity: RosEntity) -> Text:
+        text = TreeLabel.label(entity)
+        text.append(" ↩", style="dim")
+        text.stylize("italic")
+        return text
+
     @staticmethod
     def error(msg: str) -> Text:
         return Text(f"ERROR: {msg}", style="red")
@@ -43,18 +52,35 @@ class TreeLabel:
 
 
 class RosEntityGraphPanel(Static):
+    """
+    Dependency tree of the selected entity. Children are queried only when a
+    tree node is expanded, and cached per entity for the current graph epoch.
+    Every entity is expanded once per tree, where it is reached first; shared
+    subtrees and cycles are shown as back-references to it. On graph changes
+    only the loaded tree nodes are queried again, so that what is expanded
+    stays expanded.
+    """
+
     def __init__(
         self,
-        ros: RosClient,
+        ros: AsyncRosClient,
         entity: RosEntity | None = None,
         on_highlighted_changed: Callable[[RosEntity], None] | None = None,
-        **kwargs,
+        max_depth: int = DEFAULT_MAX_DEPTH,
+        **kwargs: Any,
     ) -> None:
         super().__init__(**kwargs)
         self._ros = ros
         self._entity = entity
+        self._max_depth = max_depth
         self._on_highlighted_changed = on_highlighted_changed
         self._tree: Tree[RosEntity] | None = None
+        # dependencies shown per loaded tree node id, None if they failed
+        self._loaded: dict[int, list[RosEntity] | None] = {}
+        # the tree node expanding each entity shown in the tree
+        self._shown: dict[RosEntity, TreeNode[RosEntity]] = {}
+        self._epoch: int | None = None
+        self._dependencies: dict[RosEntity, list[RosEntity]] = {}
 
     def compose(self) -> ComposeResult:
         if self._tree:
@@ -66,102 +92,187 @@ class RosEntityGraphPanel(Static):
             self.update_graph()
 
     def update_graph(self) -> None:
+        self._update_graph()
+
+    def refresh_graph(self) -> None:
+        """Query the loaded tree nodes again, keeping what is expanded."""
+        if self._tree is None:
+            self.update_graph()
+            return
+        self._refresh_graph()
+
+    async def _get_dependencies(self, entity: RosEntity) -> list[RosEntity]:
+        graph = self._ros.client.graph
+        epoch = graph.epoch
+        if epoch != self._epoch:
+            self._epoch = epoch
+            self._dependencies = {}
+
+        if entity not in self._dependencies:
+            self._dependencies[entity] = await self._ros.run(
+                ("dependencies", entity, epoch), get_dependencies, graph, entity
+            )
+
+        return self._dependencies[entity]
+
+    @work(group="update_graph", exclusive=True)
+    @profiled("graph_panel.update_graph")
+    async def _update_graph(self) -> None:
+        entity = self._entity
+        self.workers.cancel_group(self, "refresh_graph")
         if self._tree:
             self._tree.remove()
+            self._tree = None
+        self._loaded.clear()
+        self._shown.clear()
 
-        if self._entity is None:
+        if entity is None:
+            self.update("")
             return
 
-        self._tree = Tree(TreeLabel.label(self._entity), data=self._entity)
-        self.mount(self._tree)
-
-        graph = RosDependencyGraph(
-            self._entity, self._ros, max_depth=EXPAND_UP_TO_NODES
-        )
-        self._populate_tree(self._tree.root, graph.root)
-
-    def _populate_tree(
-        self,
-        parent: TreeNode,
-        dep_node: RosDependencyNode,
-        depth: int = 0,
-    ) -> None:
-        for child in dep_node.children:
-            entity = child.entity
-
-            if child.children:
-                label = TreeLabel.label(entity)
-                child_node = parent.add(label, data=entity)
-
-                if entity.type == RosEntityType.Node:
-                    self._populate_tree(child_node, child, depth + 1)
-                else:
-                    self._populate_tree(child_node, child, depth)
-            else:
-                if entity.type == RosEntityType.Topic:
-                    topic_node = parent.add(TreeLabel.label(entity), data=entity)
-                    topic_node.add_leaf(TreeLabel.NO_PUBLISHER)
-                    if depth < EXPAND_UP_TO_NODES:
-                        topic_node.expand()
-                else:
-                    parent.add_leaf(TreeLabel.leaf_label(entity), data=entity)
-
-        if depth < EXPAND_UP_TO_NODES:
-            parent.expand()
-
-    def on_tree_node_selected(self, event: Tree.NodeSelected) -> None:
-        node = event.node
-        if self._should_update_subtree(node):
-            self._update_subtree(node)
-
-    def _should_update_subtree(self, node: TreeNode) -> bool:
-        entity = node.data
-        if not isinstance(entity, RosEntity):
-            return False
-        if not node.is_expanded:
-            return False
-        if node.children and all(child.is_expanded for child in node.children):
-            return False
-        if self._subtree_depth(node) > EXPAND_UP_TO_NODES:
-            return False
-
-        return True
-
-    def _update_subtree(self, node: TreeNode) -> None:
+        self.update(LOADING)
+        tree: Tree[RosEntity] = Tree(TreeLabel.label(entity), data=entity)
+        self._shown[entity] = tree.root
+        await self._load_levels(tree.root)
+        self.update("")
+        self._tree = tree
+        self.mount(tree)
+
+    @work(group="refresh_graph", exclusive=True)
+    @profiled("graph_panel.refresh_graph")
+    async def _refresh_graph(self) -> None:
+        if self._tree is not None:
+            await self._refresh_children(self._tree.root)
+
+    def _depth(self, node: TreeNode[RosEntity]) -> int:
+        # a topic and its publishers are shown at the same depth
+        depth = 0
+        current: TreeNode[RosEntity] | None = node
+        while current is not None and current.parent is not None:
+            if current.data is not None and current.data.type == RosEntityType.Node:
+                depth += 1
+            current = current.parent
+        return depth
+
+    async def _load_levels(self, node: TreeNode[RosEntity]) -> None:
+        # 0-1 breadth first, so that an entity is expanded at the shallowest
+        # depth it is reached, and referred back to everywhere deeper
+        queue: deque[TreeNode[RosEntity]] = deque([node])
+        while queue:
+            current = queue.popleft()
+            depth = self._depth(current)
+            same_depth = []
+            for child in await self._load_children(current):
+                child_depth = self._depth(child)
+                if child_depth == depth:
+                    same_depth.append(child)
+                elif child_depth < self._max_depth:
+                    queue.append(child)
+            # keep the order of the siblings
+            queue.extendleft(reversed(same_depth))
+
+    async def _load_children(
+        self, node: TreeNode[RosEntity]
+    ) -> list[TreeNode[RosEntity]]:
         entity = node.data
-        if not isinstance(entity, RosEntity):
-            return
+        if entity is None or node.id in self._loaded:
+            return []
+        self._loaded[node.id] = None
 
         try:
-            graph = RosDependencyGraph(entity, self._ros, max_depth=EXPAND_UP_TO_NODES)
-            if graph.root.children:
-                node._children.clear()
-                node._expanded = False
-                self._populate_tree(node, graph.root)
+            dependencies = await self._get_dependencies(entity)
         except Exception as e:
             node.add_leaf(TreeLabel.error(str(e)))
+            return []
 
-    def _subtree_depth(self, node: TreeNode) -> int:
-        if not node.children:
-            return 0
+        self._loaded[node.id] = dependencies
+        if dependencies:
+            node.expand()
+        return self._show_dependencies(node, entity, dependencies)
 
-        max_depth = 0
+    def _show_dependencies(
+        self,
+        node: TreeNode[RosEntity],
+        entity: RosEntity,
+        dependencies: list[RosEntity],
+    ) -> list[TreeNode[RosEntity]]:
+        """
+        Add the dependencies that are not shown under the tree node yet, and
+        return the tree nodes added to expand them.
+        """
+        if not dependencies:
+            if entity.type == RosEntityType.Topic:
+                node.add_leaf(TreeLabel.NO_PUBLISHER)
+            elif not node.is_root:
+                node.set_label(TreeLabel.leaf_label(entity))
+                node.allow_expand = False
+            return []
+
+        present = {child.data for child in node.children}
+        children = []
+        for child in dependencies:
+            if child in present:
+                continue
+            if child in self._shown:
+                # shared subtree or cycle: refer back instead of expanding again
+                node.add_leaf(TreeLabel.back_reference(child), data=child)
+            else:
+                child_node = node.add(TreeLabel.label(child), data=child)
+                self._shown[child] = child_node
+                children.append(child_node)
+        return children
+
+    def _forget(self, node: TreeNode[RosEntity]) -> None:
+        """Drop a removed subtree from what is shown and loaded."""
+        self._loaded.pop(node.id, None)
+        if node.data is not None and self._shown.get(node.data) is node:
+            del self._shown[node.data]
         for child in node.children:
-            child_entity = child.data
-            child_depth = self._subtree_depth(child)
+            self._forget(child)
 
-            if (
-                isinstance(child_entity, RosEntity)
-                and child_entity.type == RosEntityType.Node
-            ):
-                child_depth += 1
+    async def _refresh_children(self, node: TreeNode[RosEntity]) -> None:
+        entity = node.data
+        if entity is None or node.id not in self._loaded:
+            # never expanded; queried once it is
+            return
+
+        try:
+            dependencies = await self._get_dependencies(entity)
+        except Exception:
+            # keep showing the last known dependencies
+            return
 
-            max_depth = max(max_depth, child_depth)
+        if dependencies != self._loaded[node.id]:
+            self._loaded[node.id] = dependencies
+            # subtrees of the dependencies still there are kept as they are
+            for child in list(node.children):
+                if child.data not in dependencies:
+                    self._forget(child)
+                    child.remove()
+            if not node.is_root:
+                node.set_label(TreeLabel.label(entity))
+                node.allow_expand = True
+            for child_node in self._show_dependencies(node, entity, dependencies):
+                if self._depth(child_node) < self._max_depth:
+                    await self._load_levels(child_node)
+
+        for child in list(node.children):
+            await self._refresh_children(child)
+
+    def on_tree_node_expanded(self, event: Tree.NodeExpanded[RosEntity]) -> None:
+        node = event.node
+        if node.allow_expand and node.id not in self._loaded:
+            self._expand(node)
 
-        return max_depth
+    @work(group="load_children")
+    async def _expand(self, node: TreeNode[RosEntity]) -> None:
+        await self._load_children(node)
 
     async def on_key(self, event: Key) -> None:
         if event.key == "space":
+            if self._tree is None:
+                return
+
             selected_node = self._tree.cursor_node
             if selected_node is None or selected_node.parent is None:
                 return
@@ -175,11 +286,9 @@ class RosEntityGraphPanel(Static):
                 else:
                     sibling.collapse()
 
-            self.on_tree_node_selected(Tree.NodeSelected(selected_node))
-
             event.stop()
 
-    def on_tree_node_highlighted(self, event: Tree.NodeHighlighted) -> None:
+    def on_tree_node_highlighted(self, event: Tree.NodeHighlighted[RosEntity]) -> None:
         node = event.node
         entity = node.data
         if isinstance(entity, RosEntity) and self._on_highlighted_changed:
@@ -1,15 +1,21 @@
 from __future__ import annotations
 
+from textual import work
 from textual.widgets import Static
 
 from ..event import RosEntitySelected
-from ..ros import RosClient, RosEntity
+from ..ros import AsyncRosClient, RosEntity
+from ..ros.entity import RosEntityInfo
 from ..ros.exception import RosMasterException
+from ..utility import profiled
+from .placeholder import LOADING
 
 
 class RosEntityInfoPanel(Static):
-    _ros: RosClient
+    _ros: AsyncRosClient
     _entity: RosEntity | None = None
+    # what is on display, to skip re-rendering identical information
+    _info: RosEntityInfo | None = None
     _update_interval: float | None = None
 
     DEFAULT_CSS = """
@@ -20,7 +26,7 @@ class RosEntityInfoPanel(Static):
 
     def __init__(
         self,
-        ros: RosClient,
+        ros: AsyncRosClient,
         entity: RosEntity | None = None,
         update_interval: float | None = None,
         *,
@@ -48,21 +54,43 @@ class RosEntityInfoPanel(Static):
     def set_entity(self, entity: RosEntity) -> None:
         if entity != self._entity:
             self._entity = entity
-            self.update_info()
-
-    def update_info(self) -> None:
-        if self._entity is None:
+            self.update_info(loading=True)
+
+    def update_info(self, loading: bool = False) -> None:
+        # a newer request supersedes (cancels) the one in flight
+        self._update_info(loading)
+
+    @work(group="update_info", exclusive=True)
+    @profiled("info_panel.update_info")
+    async def _update_info(self, loading: bool) -> None:
+        entity = self._entity
+        if entity is None:
+            self._info = None
             self.update("")
             return
 
+        if loading:
+            self._info = None
+            self.update(LOADING)
+
         try:
-            info = self._ros.get_entity_info(self._entity).to_textual()
+            info = await self._ros.get_entity_info(entity)
         except RosMasterException as e:
-            info = f"[b][red]Fail to communicate to master[/][/]\n{e}"
+            self._info = None
+            self.update(f"[b][red]Fail to communicate to master[/][/]\n{e}")
         except Exception as e:
-            info = f"[b][red]Fail to get information of {self._entity.name}[/][/]\n{e}"
-
-        self.update(info)
+            self._info = None
+            self.update(f"[b][red]Fail to get information of {entity.name}[/][/]\n{e}")
+        else:
+            # periodic updates mostly fetch what is already shown
+            if info != self._info:
+                self._info = info
+                self.update(self._to_textual(info))
+
+    @staticmethod
+    @profiled("info_panel.to_textual")
+    def _to_textual(info: RosEntityInfo) -> str:
+        return info.to_textual()
 
     def action_node_link(self, name: str) -> None:
         self.post_message(RosEntitySelected.new_node(name))
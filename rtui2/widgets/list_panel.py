@@ -1,21 +1,67 @@
 from __future__ import annotations
 
+from textual import work
 from textual.app import ComposeResult
-from textual.widgets import Static, Tree
+from textual.binding import Binding
+from textual.events import Key
+from textual.widgets import Input, Static, Tree
+from textual.widgets.tree import TreeNode
 
 from ..event import RosEntitySelected
-from ..ros import RosClient, RosEntityType
+from ..ros import AsyncRosClient, RosEntityType
+from ..ros.entity import TreeKey
+from ..utility import FuzzyIndex, profiled
+from .placeholder import LOADING
+
+# groups are expanded while filtering only if the matches fit on a few screens
+FILTER_EXPAND_LIMIT = 200
+
+
+def _sort_key(node: TreeNode[str]) -> tuple[bool, str]:
+    # groups first, then leaves, both in alphabetical order
+    return node.data is not None, str(node.label)
 
 
 class RosEntityListPanel(Static):
-    _ros: RosClient
+    """
+    Entity list with an incremental fuzzy filter (``/``).
+
+    Leaves of a group are only materialized as tree nodes once the group is
+    expanded; the Tree itself renders visible lines only, so thousands of
+    entries stay cheap.
+    """
+
+    _ros: AsyncRosClient
     _entity_type: RosEntityType
     _tree: Tree[str]
+    _filter: Input
+    _entities: list[TreeKey]
+    _index: FuzzyIndex
+    _view: dict[str, TreeKey]
+    _members: dict[str | None, dict[str, TreeKey]]
+    _groups: dict[str, TreeNode[str]]
+    _leaves: dict[str, TreeNode[str]]
+    _auto_refresh: float | None
+
+    DEFAULT_CSS = """
+    RosEntityListPanel Input {
+        display: none;
+    }
+
+    RosEntityListPanel.-filtering Input {
+        display: block;
+    }
+    """
+
+    BINDINGS = [
+        Binding("slash", "filter", "Filter", key_display="/"),
+    ]
 
     def __init__(
         self,
-        ros: RosClient,
+        ros: AsyncRosClient,
         entity_type: RosEntityType,
+        auto_refresh: float | None = None,
         *,
         name: str | None = None,
         id: str | None = None,
@@ -31,26 +77,139 @@ class RosEntityListPanel(Static):
 
         self._ros = ros
         self._entity_type = entity_type
-        self._tree = Tree(entity_type.name)
+        self._tree = Tree(f"{entity_type.name} {LOADING}")
         self._tree.auto_expand = True
+        # disabled while hidden so that it never takes the initial focus
+        self._filter = Input(placeholder="Filter", disabled=True)
+        self._entities = []
+        self._index = FuzzyIndex([])
+        self._view = {}
+        self._members = {}
+        self._groups = {}
+        self._leaves = {}
+        self._auto_refresh = auto_refresh
+
+    def on_mount(self) -> None:
         self.update_items()
+        if self._auto_refresh is not None:
+            self.set_interval(self._auto_refresh, self.update_items)
 
     def update_items(self) -> None:
-        self._tree.clear()
+        self._update_items()
 
-        entities = self._ros.list_entities(self._entity_type)
-        groups = {e.group for e in entities if e.group is not None}
-        parents = {None: self._tree.root}
+    @work(group="update_items", exclusive=True)
+    @profiled("list_panel.update_items")
+    async def _update_items(self) -> None:
+        entities = await self._ros.list_entities(self._entity_type)
+        if not self._entities:
+            # the placeholder is only shown until the first list arrives
+            self._tree.root.set_label(self._entity_type.name)
+        if [e.full_name for e in entities] != [e.full_name for e in self._entities]:
+            self._entities = entities
+            self._index = FuzzyIndex(entity.full_name for entity in entities)
+            self._apply_filter()
+
+    def _apply_filter(self) -> None:
+        query = self._filter.value if self.has_class("-filtering") else ""
+        if not query:
+            self._apply_diff({entity.full_name: entity for entity in self._entities})
+            return
+
+        keys = {entity.full_name: entity for entity in self._entities}
+        self._apply_diff({name: keys[name] for name in self._index.search(query)})
+        if len(self._view) <= FILTER_EXPAND_LIMIT:
+            for group_node in self._groups.values():
+                group_node.expand()
+
+    def _apply_diff(self, view: dict[str, TreeKey]) -> None:
+        """Touch only the tree nodes of entities added to or removed from the view."""
+        removed = self._view.keys() - view.keys()
+        added = view.keys() - self._view.keys()
+        if not removed and not added:
+            return
 
-        for group in sorted(groups):
-            parents[group] = self._tree.root.add(group)
+        cursor_node = self._tree.cursor_node
+        for name in removed:
+            entity = self._view.pop(name)
+            del self._members[entity.group][name]
+            if leaf := self._leaves.pop(name, None):
+                leaf.remove()
 
-        for entity in entities:
-            parents[entity.group].add_leaf(entity.name, entity.full_name)
+        for group, group_node in list(self._groups.items()):
+            if not self._members[group]:
+                del self._members[group]
+                del self._groups[group]
+                group_node.remove()
+
+        touched: set[TreeNode[str]] = set()
+        for name in added:
+            entity = self._view[name] = view[name]
+            self._members.setdefault(entity.group, {})[name] = entity
+
+            if entity.group is None:
+                parent = self._tree.root
+            elif entity.group in self._groups:
+                parent = self._groups[entity.group]
+            else:
+                parent = self._groups[entity.group] = self._tree.root.add(entity.group)
+                touched.add(self._tree.root)
+
+            # leaves of collapsed groups are materialized on expand
+            if parent.is_expanded:
+                self._leaves[name] = parent.add_leaf(entity.name, name)
+                touched.add(parent)
+
+        for parent in touched:
+            parent._children.sort(key=_sort_key)
+
+        if cursor_node is not None and cursor_node.data in self._leaves:
+            self._tree.call_after_refresh(self._move_cursor, cursor_node)
+
+    def _move_cursor(self, node: TreeNode[str]) -> None:
+        if node.line >= 0:
+            self._tree.cursor_line = node.line
+
+    def on_tree_node_expanded(self, e: Tree.NodeExpanded[str]) -> None:
+        node = e.node
+        if node.is_root or node.data is not None:
+            return
+
+        group = str(node.label)
+        pending = [
+            (name, entity)
+            for name, entity in self._members.get(group, {}).items()
+            if name not in self._leaves
+        ]
+        for name, entity in pending:
+            self._leaves[name] = node.add_leaf(entity.name, name)
+        if pending:
+            node._children.sort(key=_sort_key)
 
     def compose(self) -> ComposeResult:
+        yield self._filter
         yield self._tree
 
+    def action_filter(self) -> None:
+        self.add_class("-filtering")
+        self._filter.disabled = False
+        self._filter.focus()
+
+    def on_input_changed(self, e: Input.Changed) -> None:
+        e.stop()
+        self._apply_filter()
+
+    def on_input_submitted(self, e: Input.Submitted) -> None:
+        e.stop()
+        self._tree.focus()
+
+    def on_key(self, e: Key) -> None:
+        if e.key == "escape" and self.has_class("-filtering"):
+            e.stop()
+            self.remove_class("-filtering")
+            self._filter.value = ""
+            self._filter.disabled = True
+            self._tree.focus()
+
     def on_tree_node_selected(self, e: Tree.NodeSelected[str]) -> None:
         if e.node.is_root or e.node.data is None:
             return
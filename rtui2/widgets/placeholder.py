@@ -0,0 +1,3 @@
+# shown in place of content that is still being queried; Textual's loading
+# indicator crashes when toggled faster than it mounts (Textual 0.40)
+LOADING = "[dim]Loading...[/]"
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+from collections import deque
+from datetime import datetime
+from time import time
+
+from rich.markup import escape
+from textual import work
+from textual.binding import Binding
+
+from ..ros import AsyncRosClient
+from ..utility.rate import format_bytes
+from .topic_subscription import RosTopicSubscriptionPanel
+
+ECHO_BUFFER_SIZE = 100
+ECHO_UPDATE_INTERVAL = 0.5
+
+
+class RosTopicEchoPanel(RosTopicSubscriptionPanel):
+    """
+    Messages of a topic. Serialized messages are kept in a bounded buffer as
+    received, and only the one on display is deserialized, so echoing a
+    high-bandwidth topic costs little more than receiving it.
+    """
+
+    _buffer: deque[tuple[float, bytes]]
+    _received: int = 0
+    _shown: int = 0
+    _paused: list[tuple[float, bytes]] | None = None
+    _position: int = 0
+
+    can_focus = True
+
+    DEFAULT_CSS = """
+    RosTopicEchoPanel {
+        padding: 1 2;
+    }
+    """
+
+    BINDINGS = [
+        Binding("p", "pause", "Pause", key_display="p"),
+        Binding("left_square_bracket", "older", "Older", key_display="["),
+        Binding("right_square_bracket", "newer", "Newer", key_display="]"),
+    ]
+
+    def __init__(
+        self,
+        ros: AsyncRosClient,
+        active: bool = True,
+        *,
+        name: str | None = None,
+        id: str | None = None,
+        classes: str | None = None,
+        disabled: bool = False,
+    ) -> None:
+        self._buffer = deque(maxlen=ECHO_BUFFER_SIZE)
+        super().__init__(
+            ros,
+            active,
+            name=name,
+            id=id,
+            classes=classes,
+            disabled=disabled,
+        )
+
+    def on_mount(self) -> None:
+        self.set_interval(ECHO_UPDATE_INTERVAL, self._update_echo)
+
+    def reset(self) -> None:
+        self._buffer.clear()
+        self._received = self._shown = 0
+        self._paused = None
+        if self._topic_name is None:
+            self.update("")
+        else:
+            self.update(f"[b]{self._topic_name}:[/b] waiting for messages...")
+
+    def on_message(self, data: bytes) -> None:
+        # keep the bytes as they are; deserialized only when shown
+        self._buffer.append((time(), data))
+        self._received += 1
+
+    def _update_echo(self) -> None:
+        if self._paused is None and self._received != self._shown and self._buffer:
+            self._shown = self._received
+            self._show(self._buffer[-1], len(self._buffer), len(self._buffer))
+
+    def _show(self, message: tuple[float, bytes], index: int, total: int) -> None:
+        self._format(message, index, total)
+
+    # described statically; the default description is the repr of the message
+    @work(group="format", exclusive=True, description="format message")
+    async def _format(
+        self, message: tuple[float, bytes], index: int, total: int
+    ) -> None:
+        if self._topic_name is None or self._topic_type is None:
+            return
+
+        stamp, data = message
+        received = datetime.fromtimestamp(stamp).strftime("%H:%M:%S.%f")[:-3]
+        header = (
+            f"[b]{self._topic_name}[/b] message {index}/{total}, "
+            f"received at {received}, {format_bytes(len(data))}"
+        )
+        if self._paused is not None:
+            header += " [b](paused)[/b]"
+
+        try:
+            text = escape(await self._ros.format_message(data, self._topic_type))
+        except Exception as e:
+            text = f"[b][red]Fail to deserialize the message[/][/]\n{e}"
+
+        self.update(f"{header}\n\n{text}")
+
+    def _show_paused(self) -> None:
+        if self._paused:
+            total = len(self._paused)
+            self._show(self._paused[self._position], self._position + 1, total)
+
+    def action_pause(self) -> None:
+        if self._paused is None:
+            # freeze a copy; the buffer keeps receiving
+            self._paused = list(self._buffer)
+            self._position = len(self._paused) - 1
+            self._show_paused()
+        else:
+            self._paused = None
+            self._shown = 0
+            self._update_echo()
+
+    def action_older(self) -> None:
+        if self._paused is None:
+            self.action_pause()
+        elif self._position > 0:
+            self._position -= 1
+            self._show_paused()
+
+    def action_newer(self) -> None:
+        if self._paused is not None and self._position < len(self._paused) - 1:
+            self._position += 1
+            self._show_paused()
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from ..ros import AsyncRosClient
+from ..utility.rate import RateMonitor, RateStats, format_bytes
+from .topic_subscription import RosTopicSubscriptionPanel
+
+STATS_UPDATE_INTERVAL = 0.5
+
+
+def _format_stats(topic_name: str, stats: RateStats | None) -> str:
+    if stats is None:
+        return f"[b]Rate of {topic_name}:[/b] waiting for messages..."
+
+    return f"""\
+[b]Rate of {topic_name}:[/b] {stats.hz:.2f} Hz ({stats.count} msgs in window)
+[b]Period:[/b] min {stats.min_period:.4f} s / max {stats.max_period:.4f} s / jitter {stats.jitter:.4f} s
+[b]Bandwidth:[/b] {format_bytes(stats.bytes_per_sec)}/s (mean {format_bytes(stats.mean_size)}/msg)"""
+
+
+class RosTopicStatsPanel(RosTopicSubscriptionPanel):
+    """
+    Live receive rate and bandwidth of a topic; messages are counted as
+    received and never deserialized.
+    """
+
+    _monitor: RateMonitor
+
+    DEFAULT_CSS = """
+    RosTopicStatsPanel {
+        height: auto;
+        padding: 0 2;
+        border-top: inner $primary;
+    }
+    """
+
+    def __init__(
+        self,
+        ros: AsyncRosClient,
+        active: bool = True,
+        *,
+        name: str | None = None,
+        id: str | None = None,
+        classes: str | None = None,
+        disabled: bool = False,
+    ) -> None:
+        self._monitor = RateMonitor()
+        super().__init__(
+            ros,
+            active,
+            name=name,
+            id=id,
+            classes=classes,
+            disabled=disabled,
+        )
+
+    def on_mount(self) -> None:
+        self.set_interval(STATS_UPDATE_INTERVAL, self._update_stats)
+
+    def reset(self) -> None:
+        self._monitor.reset()
+        if self._topic_name is None:
+            self.update("")
+        else:
+            self.update(_format_stats(self._topic_name, None))
+
+    def on_message(self, data: bytes) -> None:
+        self._monitor.record(len(data))
+
+    def _update_stats(self) -> None:
+        if self._topic_name is not None and self.subscribed:
+            self.update(_format_stats(self._topic_name, self._monitor.stats()))
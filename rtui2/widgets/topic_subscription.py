@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+from typing import Callable
+
+from textual import work
+from textual.widgets import Static
+
+from ..ros import AsyncRosClient
+
+
+class RosTopicSubscriptionPanel(Static):
+    """
+    Base of panels fed by a raw subscription to one topic. The subscription
+    only exists while the panel is active and has a topic; see
+    :meth:`suspend` and :meth:`resume`.
+    """
+
+    _ros: AsyncRosClient
+    _topic_name: str | None = None
+    _topic_type: str | None = None
+    _unsubscribe: Callable[[], None] | None = None
+    _active: bool
+
+    def __init__(
+        self,
+        ros: AsyncRosClient,
+        active: bool = True,
+        *,
+        name: str | None = None,
+        id: str | None = None,
+        classes: str | None = None,
+        disabled: bool = False,
+    ) -> None:
+        super().__init__(
+            name=name,
+            id=id,
+            classes=classes,
+            disabled=disabled,
+        )
+
+        self._ros = ros
+        self._active = active
+
+    @property
+    def subscribed(self) -> bool:
+        return self._unsubscribe is not None
+
+    def on_unmount(self) -> None:
+        self._stop()
+
+    def set_topic(self, topic_name: str) -> None:
+        if topic_name != self._topic_name:
+            self._topic_name = topic_name
+            self._restart()
+
+    def suspend(self) -> None:
+        """Drop the subscription, e.g. while the panel is not shown."""
+        self._active = False
+        self._restart()
+
+    def resume(self) -> None:
+        self._active = True
+        self._restart()
+
+    def reset(self) -> None:
+        """Clear what was received so far; called whenever the subscription changes."""
+
+    def on_message(self, data: bytes) -> None:
+        """Called with each serialized message on a ROS executor thread."""
+
+    def _restart(self) -> None:
+        self._stop()
+        self.reset()
+        if self._active and self._topic_name is not None:
+            self._subscribe(self._topic_name)
+
+    def _stop(self) -> None:
+        self.workers.cancel_group(self, "subscribe")
+        if self._unsubscribe is not None:
+            self._unsubscribe()
+            self._unsubscribe = None
+
+    @work(group="subscribe", exclusive=True)
+    async def _subscribe(self, topic_name: str) -> None:
+        try:
+            types = await self._ros.get_topic_types(topic_name)
+            if not types:
+                self.update(f"[b]{topic_name}:[/b] unknown topic type")
+                return
+
+            # created on this thread so that a cancelled worker never leaks it
+            self._topic_type = types[0]
+            self._unsubscribe = self._ros.client.subscribe_raw(
+                topic_name, types[0], self.on_message
+            )
+        except Exception as e:
+            self.update(f"[b][red]Fail to subscribe to {topic_name}[/][/]\n{e}")
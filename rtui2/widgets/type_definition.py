@@ -1,12 +1,15 @@
 from __future__ import annotations
 
+from textual import work
 from textual.widgets import Static
 
-from ..ros import RosClient, RosEntity
+from ..ros import AsyncRosClient, RosEntity
+from ..utility import profiled
+from .placeholder import LOADING
 
 
 class RosTypeDefinitionPanel(Static):
-    _ros: RosClient
+    _ros: AsyncRosClient
     _entity: RosEntity | None = None
 
     DEFAULT_CSS = """
@@ -17,7 +20,7 @@ class RosTypeDefinitionPanel(Static):
 
     def __init__(
         self,
-        ros: RosClient,
+        ros: AsyncRosClient,
         entity: RosEntity | None = None,
         *,
         name: str | None = None,
@@ -33,6 +36,8 @@ class RosTypeDefinitionPanel(Static):
 
         self._ros = ros
         self._entity = entity
+
+    def on_mount(self) -> None:
         self.update_content()
 
     def set_entity(self, entity: RosEntity) -> None:
@@ -40,8 +45,21 @@ class RosTypeDefinitionPanel(Static):
             self._entity = entity
             self.update_content()
 
-    def update_content(self):
-        if self._entity is None or not self._entity.type.has_definition():
+    def update_content(self) -> None:
+        self._update_content()
+
+    @work(group="update_content", exclusive=True)
+    @profiled("definition_panel.update_content")
+    async def _update_content(self) -> None:
+        entity = self._entity
+        if entity is None or not entity.type.has_definition():
             self.update("")
+            return
+
+        self.update(LOADING)
+        try:
+            definition = await self._ros.get_type_definition(entity)
+        except Exception as e:
+            self.update(f"[b][red]Fail to get definition of {entity.name}[/][/]\n{e}")
         else:
-            self.update(self._ros.get_type_definition(self._entity))
+            self.update(definition)
@@ -1,7 +1,25 @@
 import unittest
 from os import environ
 
+from .test_async_client import TestAsyncRosClient
+from .test_client import TestRosClient
+from .test_daemon import TestDaemonAddress, TestRosDaemon
+from .test_dependency_graph import TestDependencyGraph
+from .test_discovery import TestWaitForDiscovery
+from .test_dump import TestDump
+from .test_entity import TestEntityInfo
+from .test_fake import TestFakeRosInterface
+from .test_fuzzy import TestFuzzyIndex
+from .test_graph_snapshot import TestGraphSnapshot
 from .test_history import TestHistory
+from .test_import_time import TestImportTime
+from .test_message import TestFormatMessage
+from .test_profiler import TestProfiler
+from .test_qos import TestQoS
+from .test_qos_check import TestQoSCheck
+from .test_rate import TestRateMonitor, TestRateTable
+from .test_type_cache import TestTypeCache
+from .test_widgets import TestWidgets
 
 if environ.get("ROS_VERSION") == "1":
     from .ros1 import *
@@ -0,0 +1,57 @@
+"""
+Latency of RosClient.get_node_info with its graph queries issued in
+series and fanned out on a thread pool, against FakeRosInterface whose every
+query sleeps ``--latency`` seconds like a round trip to DDS or the daemon.
+
+    poetry run python -m tests.benchmark.node_info --latency 0.002
+"""
+from __future__ import annotations
+
+from argparse import ArgumentParser
+from statistics import median
+from time import perf_counter
+
+from rtui2.ros import RosClient
+from rtui2.ros.client import DEFAULT_FAN_OUT_WORKERS
+from rtui2.ros.interface.fake import FakeRosInterface
+
+
+def time_node_infos(ros: RosClient, node_names: list[str]) -> list[float]:
+    samples = []
+    for node_name in node_names:
+        # every sample queries the interface rather than the snapshot
+        ros.graph.invalidate()
+        start = perf_counter()
+        ros.get_node_info(node_name)
+        samples.append(perf_counter() - start)
+    return samples
+
+
+def main() -> None:
+    parser = ArgumentParser()
+    parser.add_argument("--size", type=int, default=100, help="number of nodes")
+    parser.add_argument("--latency", type=float, default=0.002)
+    parser.add_argument("--samples", type=int, default=50)
+    parser.add_argument(
+        "--workers", type=int, nargs="+", default=[0, 2, DEFAULT_FAN_OUT_WORKERS]
+    )
+    args = parser.parse_args()
+
+    print(f"{'workers':>8} {'median (ms)':>12} {'max (ms)':>10} {'speedup':>8}")
+    serial: float | None = None
+    for workers in args.workers:
+        interface = FakeRosInterface(nodes=args.size, latency=args.latency)
+        ros = RosClient(interface, fan_out_workers=workers)
+        samples = time_node_infos(ros, interface.list_nodes()[: args.samples])
+        ros.terminate()
+
+        latency = median(samples)
+        serial = latency if serial is None else serial
+        print(
+            f"{workers:>8} {latency * 1e3:>12.3f} {max(samples) * 1e3:>10.3f} "
+            f"{serial / latency:>7.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""
+Cost of RateTable.record() and of one RateTable.stats() pass by number of
+monitored topics; both should grow (at most) linearly.
+
+    poetry run python -m tests.benchmark.rate_table
+"""
+from __future__ import annotations
+
+from argparse import ArgumentParser
+from time import perf_counter
+
+from rtui2.utility.rate import RateTable
+
+
+def measure(topics: int, messages: int) -> tuple[float, float]:
+    table = RateTable()
+    rows = [table.add_row() for _ in range(topics)]
+
+    start = perf_counter()
+    for i in range(messages):
+        table.record(rows[i % topics], 100, stamp=i * 1e-4)
+    record = (perf_counter() - start) / messages
+
+    start = perf_counter()
+    table.stats(now=messages * 1e-4)
+    stats = perf_counter() - start
+
+    return record, stats
+
+
+def main() -> None:
+    parser = ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 500, 1000])
+    parser.add_argument("--messages", type=int, default=100000)
+    args = parser.parse_args()
+
+    print(f"{'topics':>8} {'record (us)':>12} {'stats (ms)':>11}")
+    for size in args.sizes:
+        record, stats = measure(size, args.messages)
+        print(f"{size:>8} {record * 1e6:>12.2f} {stats * 1e3:>11.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Time-to-first-paint of ``rtui2 node`` against FakeRosInterface, measured from
+InspectApp construction until the initial entity list is shown.
+
+    poetry run python -m tests.benchmark.startup --size 1000 --latency 0.01
+"""
+from __future__ import annotations
+
+import asyncio
+from argparse import ArgumentParser
+from collections import Counter
+from statistics import median
+from time import perf_counter
+
+from rtui2.app import InspectApp
+from rtui2.ros import RosClient, RosEntityType
+from rtui2.ros.interface.fake import FakeRosInterface
+from rtui2.screens import RosEntityInspection
+
+POLL_INTERVAL = 0.001
+
+
+def _painted(app: InspectApp) -> bool:
+    screen = app.screen
+    if not isinstance(screen, RosEntityInspection):
+        return False
+    panel = screen._list_panel
+    return bool(panel._view)
+
+
+async def time_to_first_paint(
+    size: int, latency: float, target: RosEntityType = RosEntityType.Node
+) -> tuple[float, Counter[str]]:
+    interface = FakeRosInterface(nodes=size, latency=latency)
+    start = perf_counter()
+    app = InspectApp(RosClient(interface), target)
+    async with app.run_test() as pilot:
+        while not _painted(app):
+            await pilot.pause(POLL_INTERVAL)
+        elapsed = perf_counter() - start
+        await pilot.app.action_quit()
+
+    return elapsed, interface.calls
+
+
+def main() -> None:
+    parser = ArgumentParser()
+    parser.add_argument("--size", type=int, default=100, help="number of nodes")
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="seconds per interface query"
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    samples = []
+    calls: Counter[str] = Counter()
+    for _ in range(args.repeat):
+        elapsed, calls = asyncio.run(time_to_first_paint(args.size, args.latency))
+        samples.append(elapsed)
+
+    print(f"size={args.size} latency={args.latency}s repeat={args.repeat}")
+    print(
+        f"time to first paint: median {median(samples) * 1000:.1f} ms, "
+        f"min {min(samples) * 1000:.1f} ms, max {max(samples) * 1000:.1f} ms"
+    )
+    print("interface queries until first paint:")
+    for name, count in sorted(calls.items()):
+        print(f"  {name}: {count}")
+
+
+if __name__ == "__main__":
+    main()
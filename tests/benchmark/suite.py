@@ -0,0 +1,299 @@
+"""
+Scaling benchmarks of the query, graph and rendering paths against synthetic
+graphs of increasing size (FakeRosInterface). Results are written as JSON so
+that two commits can be compared:
+
+    poetry run python -m tests.benchmark.suite --out before.json
+    poetry run python -m tests.benchmark.suite --out after.json --compare before.json
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import platform
+import subprocess
+import sys
+from argparse import ArgumentParser
+from datetime import datetime, timezone
+from statistics import median
+from time import perf_counter
+from typing import Any, Callable
+
+from textual.app import App, ComposeResult
+from textual.pilot import Pilot
+from textual.widget import Widget
+
+from rtui2.ros import AsyncRosClient, RosClient, RosEntity, RosEntityType
+from rtui2.ros.dependency_graph import get_dependencies
+from rtui2.ros.interface.fake import FakeRosInterface
+from rtui2.widgets import RosEntityGraphPanel, RosEntityListPanel
+
+SIZES = [10, 100, 1000, 5000]
+POLL_INTERVAL = 0.001
+# a case is a regression once it is this many times slower than the baseline
+DEFAULT_THRESHOLD = 1.5
+# entities whose info is fetched per sample
+INFO_SAMPLES = 20
+
+Sampler = Callable[[RosClient, int], list[float]]
+
+
+def _repeat(
+    repeat: int, setup: Callable[[], None], fn: Callable[[], Any]
+) -> list[float]:
+    samples = []
+    for _ in range(repeat):
+        setup()
+        start = perf_counter()
+        fn()
+        samples.append(perf_counter() - start)
+    return samples
+
+
+def _busiest_topic(ros: RosClient) -> str:
+    # the most subscribed topic, like /tf
+    subscribers = {
+        name: len(ros.interface.get_topic_subscribers(name))
+        for name in ros.interface.list_topics()
+    }
+    return max(subscribers, key=subscribers.__getitem__)
+
+
+def list_entities(ros: RosClient, repeat: int) -> list[float]:
+    def list_all() -> None:
+        for entity_type in (RosEntityType.Node, RosEntityType.Topic):
+            ros.list_entities(entity_type)
+
+    return _repeat(repeat, ros.graph.invalidate, list_all)
+
+
+def get_entity_info(ros: RosClient, repeat: int) -> list[float]:
+    nodes = ros.interface.list_nodes()[:INFO_SAMPLES]
+    topics = ros.interface.list_topics()[:INFO_SAMPLES]
+
+    def get_infos() -> None:
+        for name in nodes:
+            ros.get_entity_info(RosEntity.new_node(name))
+        for name in topics:
+            ros.get_entity_info(RosEntity.new_topic(name))
+
+    return _repeat(repeat, ros.graph.invalidate, get_infos)
+
+
+def dependency_graph(ros: RosClient, repeat: int) -> list[float]:
+    root = RosEntity.new_node(ros.interface.list_nodes()[0])
+
+    def walk() -> None:
+        # the entities of the graph panel's tree three nodes deep, each
+        # queried once like the panel's per-epoch cache
+        nodes = [root]
+        for _ in range(3):
+            topics = dict.fromkeys(
+                topic for node in nodes for topic in get_dependencies(ros.graph, node)
+            )
+            nodes = list(
+                dict.fromkeys(
+                    node
+                    for topic in topics
+                    for node in get_dependencies(ros.graph, topic)
+                )
+            )
+
+    return _repeat(repeat, ros.graph.invalidate, walk)
+
+
+def to_textual(ros: RosClient, repeat: int) -> list[float]:
+    info = ros.get_entity_info(RosEntity.new_topic(_busiest_topic(ros)))
+    return _repeat(repeat, lambda: None, info.to_textual)
+
+
+async def _wait(pilot: Pilot, done: Callable[[], bool]) -> None:
+    while not done():
+        if not pilot.app.is_running:
+            raise RuntimeError("the app exited before the panel was ready")
+        await pilot.pause(POLL_INTERVAL)
+
+
+class _PanelApp(App):
+    def __init__(self, ros: AsyncRosClient) -> None:
+        super().__init__()
+        self.ros = ros
+
+    def compose(self) -> ComposeResult:
+        return iter(())
+
+
+async def _time_panels(
+    ros: RosClient,
+    repeat: int,
+    create: Callable[[AsyncRosClient, int], Widget],
+    ready: Callable[[Widget], bool],
+) -> list[float]:
+    """Time from mounting a fresh panel until it shows its content."""
+    ros_async = AsyncRosClient(ros)
+    app = _PanelApp(ros_async)
+    samples = []
+    async with app.run_test() as pilot:
+        for i in range(repeat):
+            ros.graph.invalidate()
+            panel = create(ros_async, i)
+            start = perf_counter()
+            await app.mount(panel)
+            await _wait(pilot, lambda: ready(panel))
+            samples.append(perf_counter() - start)
+            await panel.remove()
+    ros_async.shutdown()
+    return samples
+
+
+def list_panel(ros: RosClient, repeat: int) -> list[float]:
+    def ready(panel: Widget) -> bool:
+        assert isinstance(panel, RosEntityListPanel)
+        return bool(panel._view)
+
+    return asyncio.run(
+        _time_panels(
+            ros,
+            repeat,
+            lambda ros_async, _: RosEntityListPanel(ros_async, RosEntityType.Topic),
+            ready,
+        )
+    )
+
+
+async def _time_graph_panel(ros: RosClient, repeat: int) -> list[float]:
+    """Time from selecting a node until its dependency tree is shown."""
+    nodes = ros.interface.list_nodes()
+    ros_async = AsyncRosClient(ros)
+    app = _PanelApp(ros_async)
+    panel = RosEntityGraphPanel(ros_async)
+    samples = []
+    async with app.run_test() as pilot:
+        await app.mount(panel)
+        for i in range(repeat):
+            ros.graph.invalidate()
+            shown = panel._tree
+            start = perf_counter()
+            # consecutive nodes differ, set_entity ignores the shown one
+            panel.set_entity(RosEntity.new_node(nodes[i % len(nodes)]))
+            await _wait(pilot, lambda: panel._tree not in (None, shown))
+            samples.append(perf_counter() - start)
+    ros_async.shutdown()
+    return samples
+
+
+def graph_panel(ros: RosClient, repeat: int) -> list[float]:
+    return asyncio.run(_time_graph_panel(ros, repeat))
+
+
+CASES: dict[str, Sampler] = {
+    "list_entities": list_entities,
+    "get_entity_info": get_entity_info,
+    "dependency_graph": dependency_graph,
+    "to_textual": to_textual,
+    "list_panel": list_panel,
+    "graph_panel": graph_panel,
+}
+
+
+def _commit() -> str | None:
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip()
+
+
+def run(
+    sizes: list[int], cases: list[str], repeat: int, latency: float
+) -> dict[str, Any]:
+    results = []
+    for size in sizes:
+        ros = RosClient(FakeRosInterface(nodes=size, latency=latency))
+        for case in cases:
+            samples = CASES[case](ros, repeat)
+            results.append(
+                {
+                    "case": case,
+                    "size": size,
+                    "median_ms": median(samples) * 1e3,
+                    "min_ms": min(samples) * 1e3,
+                }
+            )
+            print(
+                f"{case:>18} {size:>6} {results[-1]['median_ms']:>12.3f}",
+                file=sys.stderr,
+            )
+        ros.terminate()
+
+    return {
+        "commit": _commit(),
+        "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "repeat": repeat,
+        "latency": latency,
+        "results": results,
+    }
+
+
+def compare(
+    baseline: dict[str, Any], current: dict[str, Any], threshold: float
+) -> list[str]:
+    """Print the ratio of every case to the baseline; returns the regressions."""
+    before = {(r["case"], r["size"]): r["median_ms"] for r in baseline["results"]}
+    regressions = []
+    print(
+        f"{'case':>18} {'size':>6} {'before (ms)':>12} {'after (ms)':>12} {'ratio':>6}"
+    )
+    for result in current["results"]:
+        key = (result["case"], result["size"])
+        if key not in before:
+            continue
+
+        ratio = result["median_ms"] / max(before[key], 1e-9)
+        flag = " <- regression" if ratio > threshold else ""
+        print(
+            f"{key[0]:>18} {key[1]:>6} {before[key]:>12.3f} "
+            f"{result['median_ms']:>12.3f} {ratio:>6.2f}{flag}"
+        )
+        if flag:
+            regressions.append(f"{key[0]} at {key[1]} nodes: {ratio:.2f}x")
+
+    return regressions
+
+
+def main() -> None:
+    parser = ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES)
+    parser.add_argument("--cases", nargs="+", choices=list(CASES), default=list(CASES))
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="seconds per interface query"
+    )
+    parser.add_argument("--out", help="write the results to this JSON file")
+    parser.add_argument("--compare", metavar="BASELINE", help="JSON of a previous run")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    args = parser.parse_args()
+
+    current = run(args.sizes, args.cases, args.repeat, args.latency)
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(current, f, indent=2)
+
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(json.load(f), current, args.threshold)
+        if regressions:
+            print("regressions:\n  " + "\n  ".join(regressions))
+            sys.exit(1)
+    elif not args.out:
+        json.dump(current, sys.stdout, indent=2)
+
+
+if __name__ == "__main__":
+    main()
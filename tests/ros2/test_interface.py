@@ -3,10 +3,13 @@ from __future__ import annotations
 import typing as t
 import unittest
 import warnings
+from threading import Event
 
 import rclpy
+from std_msgs.msg import String
 
 from rtui2.ros.interface.ros2 import Ros2
+from rtui2.ros.qos import QoS
 
 from .node.dummy_node1 import DummyNode1
 from .node.dummy_node2 import DummyNode2
@@ -42,6 +45,27 @@ class TestRos2Interface(unittest.TestCase):
     def tearDownClass(cls) -> None:
         cls.ROS.terminate()
 
+    def test_wait_for_discovery(self):
+        result = self.ROS.wait_for_discovery()
+        self.assertTrue(result.settled)
+        self.assertIn("/dummy_node1", self.ROS.list_nodes())
+        self.assertGreaterEqual(result.nodes, 3)
+
+    def test_graph_fingerprint_endpoints(self):
+        fingerprint = self.ROS._get_graph_fingerprint()
+        # a new subscriber of an existing topic changes the graph
+        subscription = self.NODE2.create_subscription(
+            String, "/topic", lambda _: None, 10
+        )
+        try:
+            for _ in range(50):
+                if self.ROS._get_graph_fingerprint() != fingerprint:
+                    break
+                Event().wait(0.1)
+            self.assertNotEqual(self.ROS._get_graph_fingerprint(), fingerprint)
+        finally:
+            self.NODE2.destroy_subscription(subscription)
+
     def test_get_node_publisher(self):
         publishers = self.ROS.get_node_publishers("/dummy_node1")
         self.assertIn(("/topic", "std_msgs/msg/String"), publishers)
@@ -91,23 +115,21 @@ class TestRos2Interface(unittest.TestCase):
 
         # Check that we have the expected publisher (node, type, qos)
         self.assertEqual(len(publishers), 1)
-        self.assertEqual(publishers[0][0], "/dummy_node1")
-        self.assertEqual(publishers[0][1], "std_msgs/msg/String")
-        # Third element should be QoS profile string
-        self.assertIn("qos_profile:", publishers[0][2])
-        self.assertIn("reliability:", publishers[0][2])
-        self.assertIn("durability:", publishers[0][2])
+        self.assertEqual(publishers[0].node, "/dummy_node1")
+        self.assertEqual(publishers[0].type, "std_msgs/msg/String")
+        self.assertIsInstance(publishers[0].qos, QoS)
+        self.assertEqual(publishers[0].qos.reliability, "RELIABLE")
+        self.assertEqual(publishers[0].qos.durability, "VOLATILE")
 
     def test_get_topic_subscribers(self):
         subscribers = self.ROS.get_topic_subscribers("/topic")
         # Check that we have the expected subscriber (node, type, qos)
         self.assertEqual(len(subscribers), 1)
-        self.assertEqual(subscribers[0][0], "/dummy_node2")
-        self.assertEqual(subscribers[0][1], "std_msgs/msg/String")
-        # Third element should be QoS profile string
-        self.assertIn("qos_profile:", subscribers[0][2])
-        self.assertIn("reliability:", subscribers[0][2])
-        self.assertIn("durability:", subscribers[0][2])
+        self.assertEqual(subscribers[0].node, "/dummy_node2")
+        self.assertEqual(subscribers[0].type, "std_msgs/msg/String")
+        self.assertIsInstance(subscribers[0].qos, QoS)
+        self.assertEqual(subscribers[0].qos.reliability, "RELIABLE")
+        self.assertEqual(subscribers[0].qos.durability, "VOLATILE")
 
     def test_get_service_types(self):
         self.assertEqual(
@@ -157,6 +179,29 @@ class TestRos2Interface(unittest.TestCase):
         self.assertIn("/action", actions)
         self.assertIn("/action_client", actions)
 
+    def test_subscribe_raw(self):
+        received: list[bytes] = []
+        event = Event()
+
+        def callback(data: bytes) -> None:
+            received.append(data)
+            event.set()
+
+        unsubscribe = self.ROS.subscribe_raw("/topic", "std_msgs/msg/String", callback)
+        try:
+            for _ in range(20):
+                self.NODE1.pub1.publish(String(data="hello"))
+                if event.wait(0.1):
+                    break
+        finally:
+            unsubscribe()
+
+        self.assertTrue(received)
+        self.assertIsInstance(received[0], bytes)
+
+        msg = self.ROS.deserialize_message(received[0], "std_msgs/msg/String")
+        self.assertEqual(msg.data, "hello")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,62 @@
+import asyncio
+import unittest
+from threading import Event
+from unittest import mock
+
+from rtui2.ros.async_client import AsyncRosClient
+
+
+class TestAsyncRosClient(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.ros = AsyncRosClient(mock.Mock(), max_workers=1)
+        self.release = Event()
+
+    def tearDown(self):
+        self.release.set()
+        self.ros.shutdown()
+
+    def blocking_query(self, value):
+        self.release.wait(1.0)
+        return value
+
+    async def test_async_client_run(self):
+        self.release.set()
+        self.assertEqual(await self.ros.run("key", self.blocking_query, 1), 1)
+
+    async def test_async_client_coalesce_in_flight_requests(self):
+        query = mock.Mock(side_effect=self.blocking_query)
+
+        tasks = [asyncio.create_task(self.ros.run("key", query, 1)) for _ in range(3)]
+        await asyncio.sleep(0.01)
+        self.release.set()
+
+        self.assertEqual(await asyncio.gather(*tasks), [1, 1, 1])
+        self.assertEqual(query.call_count, 1)
+
+    async def test_async_client_cancel_drops_pending_request(self):
+        pending = mock.Mock(return_value=2)
+
+        running = asyncio.create_task(self.ros.run("running", self.blocking_query, 1))
+        cancelled = asyncio.create_task(self.ros.run("pending", pending))
+        await asyncio.sleep(0.01)
+        cancelled.cancel()
+        await asyncio.sleep(0.01)
+        self.release.set()
+
+        self.assertEqual(await running, 1)
+        with self.assertRaises(asyncio.CancelledError):
+            await cancelled
+        pending.assert_not_called()
+
+    async def test_async_client_cancel_keeps_shared_request(self):
+        first = asyncio.create_task(self.ros.run("key", self.blocking_query, 1))
+        second = asyncio.create_task(self.ros.run("key", self.blocking_query, 1))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        self.release.set()
+
+        self.assertEqual(await second, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,125 @@
+import unittest
+from threading import current_thread
+from unittest import mock
+
+from rtui2.ros import RosClient, RosEntity, RosEntityType
+from rtui2.ros.interface import RosInterface, TopicEndpoint
+from rtui2.ros.interface.fake import FakeRosInterface
+
+
+class TestRosClient(unittest.TestCase):
+    def setUp(self):
+        self.interface = mock.Mock(spec=RosInterface)
+        self.unsubscribe = mock.Mock()
+        self.interface.subscribe_raw.return_value = self.unsubscribe
+        self.client = RosClient(self.interface)
+
+    def test_subscribe_raw_shared(self):
+        first, second = mock.Mock(), mock.Mock()
+        unsubscribe_first = self.client.subscribe_raw("/topic", "T", first)
+        unsubscribe_second = self.client.subscribe_raw("/topic", "T", second)
+        self.assertEqual(self.interface.subscribe_raw.call_count, 1)
+
+        dispatch = self.interface.subscribe_raw.call_args.args[2]
+        dispatch(b"data")
+        first.assert_called_once_with(b"data")
+        second.assert_called_once_with(b"data")
+
+        unsubscribe_first()
+        unsubscribe_first()
+        dispatch(b"more")
+        self.assertEqual(first.call_count, 1)
+        self.assertEqual(second.call_count, 2)
+        self.unsubscribe.assert_not_called()
+
+        unsubscribe_second()
+        self.unsubscribe.assert_called_once()
+
+        self.client.subscribe_raw("/topic", "T", first)
+        self.assertEqual(self.interface.subscribe_raw.call_count, 2)
+
+    def test_wait_for_discovery_invalidates_graph(self):
+        self.interface.list_nodes.return_value = ["/a"]
+        self.assertEqual(self.client.graph.list_nodes(), ["/a"])
+
+        def discover(on_progress):
+            self.interface.list_nodes.return_value = ["/a", "/b"]
+            on_progress()
+            return mock.sentinel.result
+
+        self.interface.wait_for_discovery.side_effect = discover
+        on_progress = mock.Mock()
+        self.assertIs(self.client.wait_for_discovery(on_progress), mock.sentinel.result)
+        on_progress.assert_called_once()
+        self.assertIs(self.client.discovery, mock.sentinel.result)
+        self.assertEqual(self.client.graph.list_nodes(), ["/a", "/b"])
+
+    def test_fan_out_node_info(self):
+        threads = set()
+
+        def recorded(result):
+            def query(*_):
+                threads.add(current_thread().name)
+                return result
+
+            return query
+
+        self.interface.list_topics.return_value = ["/t"]
+        self.interface.get_topic_endpoints.side_effect = recorded(
+            [([TopicEndpoint("/a", "T")], [])]
+        )
+        self.interface.get_node_action_servers.side_effect = recorded([("/x", "A")])
+        self.interface.get_node_action_clients.side_effect = recorded([])
+        self.interface.get_node_service_servers.side_effect = recorded([])
+        self.interface.get_node_service_clients.side_effect = recorded([])
+
+        serial = self.client.get_node_info("/a")
+        self.assertEqual(serial.publishers, [("/t", "T")])
+        self.assertEqual(serial.action_servers, [("/x", "A")])
+        self.assertEqual(threads, {current_thread().name})
+
+        client = RosClient(self.interface, fan_out_workers=4)
+        try:
+            self.assertEqual(client.get_node_info("/a"), serial)
+        finally:
+            client.terminate()
+        self.assertGreater(len(threads), 1)
+
+    def test_fan_out_same_infos(self):
+        interface = FakeRosInterface(nodes=30, actions=5)
+        serial = RosClient(interface)
+        fan_out = RosClient(interface, fan_out_workers=4)
+        try:
+            for entity_type in (
+                RosEntityType.Node,
+                RosEntityType.Topic,
+                RosEntityType.Action,
+            ):
+                for key in serial.list_entities(entity_type):
+                    entity = RosEntity(entity_type, key.full_name)
+                    self.assertEqual(
+                        fan_out.get_entity_info(entity), serial.get_entity_info(entity)
+                    )
+        finally:
+            fan_out.terminate()
+
+    def test_all_node_infos_inverted(self):
+        interface = FakeRosInterface(nodes=30, actions=5)
+        client = RosClient(interface)
+        infos = client.get_all_node_infos()
+        self.assertEqual(list(infos), interface.list_nodes())
+        self.assertEqual(interface.calls["get_node_publishers"], 0)
+        self.assertEqual(interface.calls["get_node_action_servers"], 0)
+
+        for node_name, info in infos.items():
+            expected = client.get_node_info(node_name)
+            for field in (
+                "publishers",
+                "subscribers",
+                "action_servers",
+                "action_clients",
+            ):
+                self.assertCountEqual(getattr(info, field), getattr(expected, field))
+
+        streamed = client.iter_all_entity_infos(RosEntityType.Node)
+        self.assertEqual(next(streamed), next(iter(infos.values())))
@@ -0,0 +1,152 @@
+import tempfile
+import threading
+import unittest
+from os import environ
+from pathlib import Path
+from unittest import mock
+
+from rtui2.daemon import RosDaemon
+from rtui2.ros.interface import RosInterface, TopicEndpoint
+from rtui2.ros.interface.remote import RemoteRosInterface, daemon_address
+
+AUTHKEY = b"test"
+
+
+class TestRosDaemon(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.address = Path(self.tmpdir.name) / "daemon.sock"
+
+        self.interface = mock.Mock(spec=RosInterface)
+        self.interface.list_nodes.return_value = ["/a", "/b"]
+        self.interface.list_topics.return_value = ["/chatter"]
+
+        self.daemon = RosDaemon(self.interface, self.address, AUTHKEY)
+        self.thread = threading.Thread(target=self.daemon.serve_forever)
+        self.thread.start()
+        self.remote = self._connect()
+
+    def tearDown(self):
+        self.remote.terminate()
+        self.daemon.shutdown()
+        self.thread.join(timeout=5)
+        self.tmpdir.cleanup()
+
+    def _connect(self) -> RemoteRosInterface:
+        for _ in range(100):
+            try:
+                return RemoteRosInterface(self.address, AUTHKEY)
+            except OSError:
+                threading.Event().wait(0.01)
+        self.fail("daemon did not start")
+
+    def test_queries(self):
+        self.interface.get_topic_endpoints.return_value = [
+            ([TopicEndpoint("/a", "std_msgs/msg/String")], [])
+        ]
+        self.assertEqual(self.remote.list_nodes(), ["/a", "/b"])
+        self.assertEqual(self.remote.list_topics(), ["/chatter"])
+        self.assertEqual(
+            self.remote.get_node_publishers("/a"),
+            [("/chatter", "std_msgs/msg/String")],
+        )
+        # answered from the node index of the daemon's graph snapshot
+        self.interface.get_node_publishers.assert_not_called()
+        self.interface.get_topic_endpoints.assert_called_once_with(["/chatter"])
+
+    def test_topic_endpoints_in_one_call(self):
+        self.interface.get_topic_endpoints.return_value = [([], []), ([], [])]
+        self.assertEqual(
+            self.remote.get_topic_endpoints(["/a", "/b"]), [([], []), ([], [])]
+        )
+        self.interface.get_topic_endpoints.assert_called_once_with(["/a", "/b"])
+
+    def test_graph_queries_cached(self):
+        self.remote.list_nodes()
+        self.remote.list_nodes()
+        self.assertEqual(self.interface.list_nodes.call_count, 1)
+
+    def test_error(self):
+        self.interface.get_msg_definition.side_effect = KeyError("unknown")
+        with self.assertRaises(KeyError):
+            self.remote.get_msg_definition("unknown")
+        # the connection is still usable
+        self.assertEqual(self.remote.list_nodes(), ["/a", "/b"])
+
+    def test_subscribe_raw(self):
+        unsubscribe_daemon = mock.Mock()
+        self.interface.subscribe_raw.return_value = unsubscribe_daemon
+
+        received = []
+        done = threading.Event()
+
+        def callback(data: bytes) -> None:
+            received.append(data)
+            if len(received) == 2:
+                done.set()
+
+        unsubscribe = self.remote.subscribe_raw("/chatter", "T", callback)
+        enqueue = self.interface.subscribe_raw.call_args.args[2]
+        enqueue(b"first")
+        enqueue(b"second")
+        self.assertTrue(done.wait(timeout=5))
+        self.assertEqual(received, [b"first", b"second"])
+
+        unsubscribe()
+        for _ in range(500):
+            if unsubscribe_daemon.called:
+                break
+            threading.Event().wait(0.01)
+        unsubscribe_daemon.assert_called_once()
+
+    def test_watch_graph(self):
+        changed = threading.Event()
+        self.remote.watch_graph(changed.set)
+        on_graph_changed = self.interface.watch_graph.call_args.args[0]
+
+        self.remote.list_nodes()
+        self.interface.list_nodes.return_value = ["/a"]
+        # until the watcher has read the initial version, a change may be missed
+        for _ in range(100):
+            on_graph_changed()
+            if changed.wait(timeout=0.05):
+                break
+        self.assertTrue(changed.is_set())
+        self.assertEqual(self.remote.list_nodes(), ["/a"])
+
+    def test_connect_wrong_authkey(self):
+        authkey_path = Path(self.tmpdir.name) / "authkey"
+        authkey_path.write_bytes(b"wrong")
+        remote = "rtui2.ros.interface.remote"
+        with mock.patch(f"{remote}.daemon_address", return_value=self.address):
+            with mock.patch(f"{remote}.daemon_authkey_path", return_value=authkey_path):
+                self.assertIsNone(RemoteRosInterface.connect())
+
+        # the daemon still serves the clients that know the authkey
+        remote = self._connect()
+        self.assertEqual(remote.list_nodes(), ["/a", "/b"])
+        remote.terminate()
+
+    def test_shutdown(self):
+        self.remote.shutdown_daemon()
+        self.thread.join(timeout=5)
+        self.assertFalse(self.thread.is_alive())
+
+
+class TestDaemonAddress(unittest.TestCase):
+    @mock.patch.dict(environ, {"ROS_DOMAIN_ID": "3"})
+    def test_discovery_settings(self):
+        address = daemon_address()
+        self.assertTrue(address.name.startswith("daemon-3-"))
+        environ["ROS_LOG_DIR"] = "/tmp"
+        self.assertEqual(daemon_address(), address)
+
+        # a daemon with other discovery settings sees another graph
+        for name, value in [
+            ("RMW_IMPLEMENTATION", "rmw_cyclonedds_cpp"),
+            ("ROS_LOCALHOST_ONLY", "1"),
+            ("ROS_DISCOVERY_SERVER", "127.0.0.1:11811"),
+        ]:
+            with mock.patch.dict(environ, {name: value}):
+                self.assertNotEqual(daemon_address(), address)
+        self.assertEqual(daemon_address(), address)
@@ -0,0 +1,84 @@
+import unittest
+from unittest import mock
+
+from rtui2.ros import RosEntity
+from rtui2.ros.dependency_graph import get_dependencies
+from rtui2.ros.graph_snapshot import GraphSnapshot
+from rtui2.ros.interface import RosInterface, TopicEndpoint
+
+TOPIC_PUBLISHERS = {
+    "/x": [
+        TopicEndpoint("/b", "std_msgs/msg/String"),
+        TopicEndpoint("/c", "std_msgs/msg/String"),
+        TopicEndpoint("/c", "std_msgs/msg/Empty"),
+    ],
+    "/y": [TopicEndpoint("/c", "std_msgs/msg/String")],
+    "/z": [],
+    "/parameter_events": [],
+}
+TOPIC_SUBSCRIBERS = {
+    "/x": [
+        TopicEndpoint("/a", "std_msgs/msg/String"),
+        TopicEndpoint("/a", "std_msgs/msg/Empty"),
+    ],
+    "/y": [TopicEndpoint("/b", "std_msgs/msg/String")],
+    "/z": [],
+    "/parameter_events": [TopicEndpoint("/a", None)],
+}
+
+
+def init_graph() -> GraphSnapshot:
+    interface = mock.Mock(spec=RosInterface)
+    interface.list_topics.return_value = list(TOPIC_PUBLISHERS)
+    interface.get_topic_publishers.side_effect = TOPIC_PUBLISHERS.__getitem__
+    interface.get_topic_endpoints.side_effect = lambda names: [
+        (TOPIC_PUBLISHERS[name], TOPIC_SUBSCRIBERS[name]) for name in names
+    ]
+    return GraphSnapshot(interface, ttl=None)
+
+
+class TestDependencyGraph(unittest.TestCase):
+    def setUp(self):
+        self.graph = init_graph()
+
+    def test_dependencies_of_node(self):
+        # ignored topics are skipped, topics of several types listed once
+        self.assertEqual(
+            get_dependencies(self.graph, RosEntity.new_node("/a")),
+            [RosEntity.new_topic("/x")],
+        )
+        self.assertEqual(get_dependencies(self.graph, RosEntity.new_node("/c")), [])
+
+    def test_dependencies_of_topic(self):
+        self.assertEqual(
+            get_dependencies(self.graph, RosEntity.new_topic("/x")),
+            [RosEntity.new_node("/b"), RosEntity.new_node("/c")],
+        )
+        self.assertEqual(get_dependencies(self.graph, RosEntity.new_topic("/z")), [])
+
+    def test_dependencies_queried_per_entity(self):
+        for _ in range(2):
+            for name in TOPIC_PUBLISHERS:
+                get_dependencies(self.graph, RosEntity.new_topic(name))
+
+        interface = self.graph._interface
+        # publishers are resolved per visited topic, once per epoch
+        interface.get_node_publishers.assert_not_called()
+        self.assertEqual(
+            interface.get_topic_publishers.call_count, len(TOPIC_PUBLISHERS)
+        )
+
+    def test_dependencies_of_nodes_from_one_query(self):
+        for name in ("/a", "/b", "/c"):
+            for topic in get_dependencies(self.graph, RosEntity.new_node(name)):
+                get_dependencies(self.graph, topic)
+
+        # the node index also answers the publishers of every topic
+        interface = self.graph._interface
+        interface.get_topic_endpoints.assert_called_once()
+        interface.get_node_subscribers.assert_not_called()
+        interface.get_topic_publishers.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,38 @@
+import unittest
+from unittest import mock
+
+from rtui2.ros.interface import DiscoveryResult, RosInterface
+
+
+def wait_for_discovery(interface: mock.Mock, **kwargs) -> DiscoveryResult:
+    return RosInterface.wait_for_discovery(interface, period=0.001, **kwargs)
+
+
+class TestWaitForDiscovery(unittest.TestCase):
+    def setUp(self):
+        self.interface = mock.Mock(spec=RosInterface)
+
+    def test_settle_after_growth(self):
+        growth = [(1, 0, 0), (3, 2, 1), (5, 4, 2)]
+        self.interface.graph_counts.side_effect = lambda: (
+            growth.pop(0) if growth else (5, 4, 2)
+        )
+        on_progress = mock.Mock()
+
+        result = wait_for_discovery(
+            self.interface, settle=0.05, timeout=5.0, on_progress=on_progress
+        )
+        self.assertTrue(result.settled)
+        self.assertEqual((result.nodes, result.topics, result.services), (5, 4, 2))
+        self.assertEqual(on_progress.call_count, 2)
+        self.assertGreaterEqual(result.elapsed - result.converged, 0.05)
+        self.assertIn("discovered 5 nodes", str(result))
+
+    def test_timeout_while_growing(self):
+        counts = iter(range(1000000))
+        self.interface.graph_counts.side_effect = lambda: (next(counts), 0, 0)
+
+        result = wait_for_discovery(self.interface, settle=0.05, timeout=0.1)
+        self.assertFalse(result.settled)
+        self.assertLess(result.elapsed, 1.0)
+        self.assertIn("not settled", str(result))
@@ -0,0 +1,68 @@
+import io
+import json
+import subprocess
+import sys
+import unittest
+from unittest import mock
+
+from rtui2.dump import dump_entities, yaml_available
+from rtui2.ros import RosClient, RosEntityType
+from rtui2.ros.interface import RosInterface, TopicEndpoint
+
+
+def init_client() -> RosClient:
+    interface = mock.Mock(spec=RosInterface)
+    interface.list_nodes.return_value = ["/a", "/ns/b"]
+    # node endpoints are inverted from the topic ones
+    interface.list_topics.return_value = ["/topic"]
+    interface.get_topic_names_and_types.return_value = [
+        ("/topic", ["std_msgs/msg/String"])
+    ]
+    interface.get_topic_endpoints.return_value = [
+        (
+            [
+                TopicEndpoint("/a", "std_msgs/msg/String"),
+                TopicEndpoint("/ns/b", "std_msgs/msg/String"),
+            ],
+            [],
+        )
+    ]
+    interface.get_node_service_servers.return_value = []
+    interface.get_node_service_clients.return_value = []
+    return RosClient(interface)
+
+
+class TestDump(unittest.TestCase):
+    def test_dump_json_lines(self):
+        out = io.StringIO()
+        dump_entities(init_client(), RosEntityType.Node, "json", out)
+
+        lines = out.getvalue().splitlines()
+        self.assertEqual(len(lines), 2)
+        node = json.loads(lines[1])
+        self.assertEqual(node["name"], "/ns/b")
+        self.assertEqual(
+            node["publishers"], [{"name": "/topic", "type": "std_msgs/msg/String"}]
+        )
+        self.assertIsNone(node["action_clients"])
+
+    @unittest.skipUnless(yaml_available(), "PyYAML is not installed")
+    def test_dump_yaml_documents(self):
+        import yaml
+
+        out = io.StringIO()
+        dump_entities(init_client(), RosEntityType.Node, "yaml", out)
+
+        documents = list(yaml.safe_load_all(out.getvalue()))
+        self.assertEqual([d["name"] for d in documents], ["/a", "/ns/b"])
+
+    def test_dump_unknown_format(self):
+        with self.assertRaises(ValueError):
+            dump_entities(init_client(), RosEntityType.Node, "xml", io.StringIO())
+
+    def test_dump_does_not_import_textual(self):
+        code = "import sys, rtui2.cli, rtui2.dump; print('textual' in sys.modules)"
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        self.assertEqual(result.stdout.strip(), "False")
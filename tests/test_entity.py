@@ -0,0 +1,87 @@
+import unittest
+
+from rtui2.ros.entity import MsgTypeInfo, TopicInfo
+from rtui2.ros.interface import TopicEndpoint
+from rtui2.ros.qos import QoS
+
+RELIABLE = QoS("RELIABLE", "VOLATILE", "KEEP_LAST", 10)
+BEST_EFFORT = QoS("BEST_EFFORT", "VOLATILE", "KEEP_LAST", 5)
+
+
+class TestEntityInfo(unittest.TestCase):
+    def test_topic_info_to_textual(self):
+        info = TopicInfo(
+            "/tf",
+            ["tf2_msgs/msg/TFMessage"],
+            [TopicEndpoint("/a", "tf2_msgs/msg/TFMessage", RELIABLE)],
+            [],
+        )
+        text = info.to_textual()
+        self.assertIn(
+            "\n  [i]QoS: RELIABLE, VOLATILE, KEEP_LAST(10), deadline ∞, "
+            "lifespan ∞, AUTOMATIC liveliness (lease ∞)[/i]"
+            "\n    [@click=node_link('/a')]/a[/]"
+            " \\[[@click=msg_type_link('tf2_msgs/msg/TFMessage')]"
+            "tf2_msgs/msg/TFMessage[/]]",
+            text,
+        )
+        self.assertIn("[b]Subscribers:[/b] None", text)
+        self.assertNotIn("Incompatibilities", text)
+
+    def test_topic_info_groups_qos(self):
+        publishers = [
+            TopicEndpoint(f"/p{i}", "T", RELIABLE if i % 2 else BEST_EFFORT)
+            for i in range(4)
+        ]
+        text = TopicInfo("/t", ["T"], publishers, []).to_textual()
+        self.assertEqual(text.count("QoS: RELIABLE"), 1)
+        self.assertEqual(text.count("QoS: BEST_EFFORT"), 1)
+
+    def test_topic_info_incompatibilities(self):
+        text = TopicInfo(
+            "/t",
+            ["T"],
+            [TopicEndpoint("/pub", "T", BEST_EFFORT)],
+            [
+                TopicEndpoint("/sub", "T", RELIABLE),
+                TopicEndpoint("/ok", "T", BEST_EFFORT),
+            ],
+        ).to_textual()
+        self.assertIn("QoS Incompatibilities:", text)
+        marked = "[/] \\[[@click=msg_type_link('T')]T[/]] [b][red]incompatible QoS"
+        self.assertIn(f"/sub{marked}", text)
+        self.assertNotIn(f"/ok{marked}", text)
+
+    def test_topic_info_incompatible_endpoint(self):
+        # a node with several subscriptions is marked only on the incompatible one
+        text = TopicInfo(
+            "/t",
+            ["T"],
+            [TopicEndpoint("/pub", "T", BEST_EFFORT)],
+            [
+                TopicEndpoint("/sub", "T", RELIABLE),
+                TopicEndpoint("/sub", "T", BEST_EFFORT),
+            ],
+        ).to_textual()
+        subscribers = text[text.index("[b]Subscribers:") : text.index("QoS Incomp")]
+        self.assertEqual(subscribers.count("incompatible QoS"), 1)
+        # RELIABLE is listed first, and only it is marked
+        self.assertLess(
+            subscribers.index("incompatible QoS"), subscribers.index("BEST_EFFORT")
+        )
+
+    def test_topic_info_to_dict(self):
+        info = TopicInfo("/t", ["T"], [TopicEndpoint("/pub", "T", RELIABLE)], [])
+        self.assertEqual(
+            info.to_dict()["publishers"][0]["qos"]["reliability"], "RELIABLE"
+        )
+
+    def test_blank_line_every_five_entities(self):
+        endpoints = [TopicEndpoint(f"/n{i}", None) for i in range(6)]
+        text = TopicInfo("/t", [], endpoints, []).to_textual()
+        self.assertIn("/n4[/]\n\n  [@click=node_link('/n5')]", text)
+
+    def test_equal_info(self):
+        # the info panel skips re-rendering information equal to the shown one
+        self.assertEqual(MsgTypeInfo("t", ["/a"]), MsgTypeInfo("t", ["/a"]))
+        self.assertNotEqual(MsgTypeInfo("t", ["/a"]), TopicInfo("t"))
@@ -0,0 +1,76 @@
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from os import environ
+from time import perf_counter
+from unittest import mock
+
+from rtui2.ros import RosClient, RosEntity, RosEntityType
+from rtui2.ros.interface.fake import FakeGraphConfig, FakeRosInterface
+from rtui2.ros.qos import QoS
+
+
+class TestFakeRosInterface(unittest.TestCase):
+    def test_seeded(self):
+        first = FakeRosInterface(nodes=50, seed=1)
+        self.assertEqual(first.graph, FakeRosInterface(nodes=50, seed=1).graph)
+        self.assertNotEqual(first.graph, FakeRosInterface(nodes=50, seed=2).graph)
+
+    def test_size(self):
+        ros = FakeRosInterface(nodes=100, topics=300, actions=4)
+        self.assertEqual(len(ros.list_nodes()), 100)
+        self.assertEqual(len(ros.list_topics()), 300)
+        self.assertEqual(len(ros.list_services()), 600)
+        self.assertEqual(len(ros.list_actions()), 4)
+
+    def test_endpoints_consistent(self):
+        ros = FakeRosInterface(nodes=30)
+        for topic in ros.list_topics():
+            publishers = ros.get_topic_publishers(topic)
+            self.assertGreaterEqual(len(publishers), 1)
+            for publisher in publishers:
+                self.assertIsInstance(publisher.qos, QoS)
+                self.assertIn(
+                    (topic, publisher.type), ros.get_node_publishers(publisher.node)
+                )
+            for subscriber in ros.get_topic_subscribers(topic):
+                self.assertIn(
+                    (topic, subscriber.type), ros.get_node_subscribers(subscriber.node)
+                )
+
+    def test_latency(self):
+        ros = FakeRosInterface(nodes=10, latency=0.01)
+        start = perf_counter()
+        ros.list_nodes()
+        ros.list_topics()
+        self.assertGreaterEqual(perf_counter() - start, 0.02)
+        self.assertEqual(ros.calls["list_nodes"], 1)
+
+    def test_calls_counted_across_threads(self):
+        ros = FakeRosInterface(nodes=10)
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            for _ in range(8):
+                executor.submit(lambda: [ros.list_nodes() for _ in range(1000)])
+        self.assertEqual(ros.calls["list_nodes"], 8000)
+
+    def test_service_servers_unsupported(self):
+        ros = FakeRosInterface(nodes=10)
+        service = ros.list_services()[0]
+        self.assertIsNone(RosClient(ros).get_service_info(service).servers)
+
+    def test_config_from_spec(self):
+        config = FakeGraphConfig.from_spec("nodes=20, latency=0.5,seed=3")
+        self.assertEqual((config.nodes, config.latency, config.seed), (20, 0.5, 3))
+        with self.assertRaises(ValueError):
+            FakeGraphConfig.from_spec("size=1")
+
+    def test_selected_by_ros_version(self):
+        env = {"ROS_VERSION": "fake", "RTUI2_FAKE_GRAPH": "nodes=5"}
+        with mock.patch.dict(environ, env):
+            ros = RosClient()
+
+        self.assertIsInstance(ros.interface, FakeRosInterface)
+        nodes = ros.list_entities(RosEntityType.Node)
+        self.assertEqual(len(nodes), 5)
+        info = ros.get_entity_info(RosEntity.new_node(nodes[0].full_name))
+        self.assertEqual(info.name, nodes[0].full_name)
+        ros.terminate()
@@ -0,0 +1,47 @@
+import unittest
+
+from rtui2.utility.fuzzy import FuzzyIndex
+
+ITEMS = [
+    "geometry_msgs/msg/Twist",
+    "sensor_msgs/msg/Image",
+    "sensor_msgs/msg/PointCloud2",
+    "std_msgs/msg/String",
+]
+
+
+class TestFuzzyIndex(unittest.TestCase):
+    def setUp(self):
+        self.index = FuzzyIndex(ITEMS)
+
+    def test_fuzzy_empty_query(self):
+        self.assertEqual(self.index.search(""), ITEMS)
+
+    def test_fuzzy_subsequence(self):
+        self.assertEqual(
+            self.index.search("smpc"),
+            ["sensor_msgs/msg/PointCloud2"],
+        )
+
+    def test_fuzzy_case_insensitive(self):
+        self.assertEqual(self.index.search("IMAGE"), ["sensor_msgs/msg/Image"])
+
+    def test_fuzzy_narrow(self):
+        self.assertEqual(len(self.index.search("s")), 4)
+        self.assertEqual(len(self.index.search("sen")), 2)
+        self.assertEqual(self.index.search("sensim"), ["sensor_msgs/msg/Image"])
+
+    def test_fuzzy_widen(self):
+        self.index.search("sensi")
+        self.assertEqual(
+            self.index.search("str"),
+            ["std_msgs/msg/String"],
+        )
+        self.assertEqual(self.index.search(""), ITEMS)
+
+    def test_fuzzy_escape(self):
+        self.assertEqual(self.index.search("msg/p"), ["sensor_msgs/msg/PointCloud2"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+import unittest
+from unittest import mock
+
+from rtui2.ros.graph_snapshot import GraphSnapshot
+from rtui2.ros.interface import RosInterface, TopicEndpoint
+
+
+def init_interface() -> mock.Mock:
+    interface = mock.Mock(spec=RosInterface)
+    interface.list_nodes.return_value = ["/a", "/b"]
+    interface.list_topics.return_value = ["/topic", "/other"]
+    interface.get_topic_endpoints.return_value = [
+        ([TopicEndpoint("/a", "std_msgs/msg/String")], []),
+        ([], [TopicEndpoint("/a", "std_msgs/msg/Int32")]),
+    ]
+    interface.get_topic_names_and_types.return_value = [
+        ("/topic", ["std_msgs/msg/String"]),
+        ("/other", ["std_msgs/msg/Int32"]),
+    ]
+    return interface
+
+
+class TestGraphSnapshot(unittest.TestCase):
+    def setUp(self):
+        self.interface = init_interface()
+        self.graph = GraphSnapshot(self.interface, ttl=None)
+
+    def test_graph_snapshot_query_once_per_epoch(self):
+        for _ in range(3):
+            self.assertEqual(self.graph.list_nodes(), ["/a", "/b"])
+            self.graph.get_topic_types("/topic")
+
+        self.assertEqual(self.interface.list_nodes.call_count, 1)
+        self.assertEqual(self.interface.get_topic_names_and_types.call_count, 1)
+
+    def test_graph_snapshot_node_index(self):
+        self.assertEqual(
+            self.graph.get_node_publishers("/a"), [("/topic", "std_msgs/msg/String")]
+        )
+        self.assertEqual(
+            self.graph.get_node_subscribers("/a"), [("/other", "std_msgs/msg/Int32")]
+        )
+        self.assertEqual(self.graph.get_node_publishers("/b"), [])
+
+        # every node is served from the bulk queries of the epoch
+        self.interface.get_topic_endpoints.assert_called_once_with(["/topic", "/other"])
+        self.interface.get_node_publishers.assert_not_called()
+        self.assertEqual(
+            self.graph.get_topic_publishers("/topic"),
+            [TopicEndpoint("/a", "std_msgs/msg/String")],
+        )
+        self.interface.get_topic_publishers.assert_not_called()
+
+    def test_graph_snapshot_types_from_one_query(self):
+        self.assertEqual(self.graph.get_topic_types("/topic"), ["std_msgs/msg/String"])
+        self.assertEqual(self.graph.get_topic_types("/other"), ["std_msgs/msg/Int32"])
+        self.assertEqual(self.graph.get_topic_types("/unknown"), [])
+
+        self.assertEqual(self.interface.get_topic_names_and_types.call_count, 1)
+
+    def test_graph_snapshot_invalidate(self):
+        epoch = self.graph.epoch
+        self.graph.list_nodes()
+        self.graph.invalidate()
+        self.graph.list_nodes()
+
+        self.assertEqual(self.graph.epoch, epoch + 1)
+        self.assertEqual(self.interface.list_nodes.call_count, 2)
+
+    def test_graph_snapshot_ttl(self):
+        graph = GraphSnapshot(self.interface, ttl=0.0)
+        graph.list_nodes()
+        graph.list_nodes()
+
+        self.assertEqual(self.interface.list_nodes.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
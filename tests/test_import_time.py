@@ -0,0 +1,47 @@
+import re
+import subprocess
+import sys
+import unittest
+from os import environ
+
+# rtui2's own imports for `rtui2 --help` may take this many times as long as
+# importing click in the same process, which scales with the machine; they
+# take about twice as long, eager numpy or Textual imports over five times
+RELATIVE_IMPORT_BUDGET = 4
+DEFERRED_MODULES = ("textual", "rich", "rclpy", "numpy", "asyncio", "yaml")
+
+IMPORT_TIME = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+def import_times(*args: str) -> dict[str, tuple[int, int]]:
+    """Run `rtui2 <args>` under -X importtime; module -> (cumulative us, depth)."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "from rtui2.cli import main; main()"]
+        + list(args),
+        capture_output=True,
+        text=True,
+        env={**environ, "ROS_VERSION": "2"},
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if match := IMPORT_TIME.match(line):
+            _, cumulative, indent, module = match.groups()
+            times[module] = (int(cumulative), len(indent) // 2)
+    return times
+
+
+class TestImportTime(unittest.TestCase):
+    def test_help_defers_heavy_imports(self):
+        for args in (["--help"], ["node", "--help"], ["hz", "--help"]):
+            with self.subTest(args=args):
+                times = import_times(*args)
+                self.assertIn("click", times)
+                for module in DEFERRED_MODULES:
+                    self.assertNotIn(module, times)
+
+    def test_help_import_time_relative_to_click(self):
+        times = import_times("--help")
+        click, _ = times["click"]
+        # imported by rtui2.cli, so part of its cumulative time
+        own = times["rtui2.cli"][0] - click
+        self.assertLess(own, RELATIVE_IMPORT_BUDGET * click)
@@ -0,0 +1,68 @@
+import array
+import unittest
+
+import numpy as np
+
+from rtui2.ros.message import format_message
+
+
+class Message:
+    FIELDS: dict = {}
+
+    def __init__(self, **values):
+        for name, value in values.items():
+            setattr(self, name, value)
+
+    def get_fields_and_field_types(self):
+        return self.FIELDS
+
+
+class Header(Message):
+    FIELDS = {"frame_id": "string"}
+
+
+class Image(Message):
+    FIELDS = {
+        "header": "std_msgs/Header",
+        "height": "uint32",
+        "data": "sequence<uint8>",
+    }
+
+
+class Path(Message):
+    FIELDS = {"poses": "sequence<std_msgs/Header>"}
+
+
+class TestFormatMessage(unittest.TestCase):
+    def test_format_message_nested(self):
+        msg = Image(header=Header(frame_id="camera"), height=2, data=[1, 2])
+        self.assertEqual(
+            format_message(msg),
+            "header:\n  frame_id: 'camera'\nheight: 2\ndata: [1, 2]",
+        )
+
+    def test_format_message_summarizes_large_arrays(self):
+        for data in (
+            array.array("B", range(200)),
+            np.arange(200, dtype=np.uint8),
+            bytes(range(200)),
+        ):
+            text = format_message(
+                Image(header=Header(frame_id=""), height=1, data=data)
+            )
+            self.assertIn(
+                "data: <sequence<uint8>, 200 elements> [0, 1, 2, 3, 4, 5, 6, 7, ...]",
+                text,
+            )
+
+    def test_format_message_sequence_of_messages(self):
+        msg = Path(poses=[Header(frame_id="a"), Header(frame_id="b")])
+        self.assertEqual(
+            format_message(msg),
+            "poses:\n  -\n    frame_id: 'a'\n  -\n    frame_id: 'b'",
+        )
+
+        msg = Path(poses=[Header(frame_id="a")] * 100)
+        self.assertEqual(
+            format_message(msg), "poses: <sequence<std_msgs/Header>, 100 elements>"
+        )
@@ -0,0 +1,91 @@
+import asyncio
+import unittest
+
+from rtui2.ros import RosClient, RosEntity
+from rtui2.ros.interface.fake import FakeRosInterface
+from rtui2.ros.interface.instrumented import instrument
+from rtui2.utility.profiler import (
+    Profiler,
+    disable_profiling,
+    enable_profiling,
+    profiled,
+)
+
+
+@profiled("double")
+def double(x):
+    return 2 * x
+
+
+@profiled("fail")
+async def fail():
+    raise ValueError
+
+
+class TestProfiler(unittest.TestCase):
+    def tearDown(self):
+        disable_profiling()
+
+    def test_histogram(self):
+        profiler = Profiler()
+        for elapsed in (5e-6, 5e-4, 5e-4, 2.0):
+            profiler.record("query", elapsed, size=10)
+
+        stats = profiler.snapshot()["query"]
+        self.assertEqual(stats.calls, 4)
+        self.assertEqual(stats.items, 40)
+        self.assertEqual(stats.max, 2.0)
+        self.assertEqual(stats.histogram, [1, 0, 2, 0, 0, 0, 1])
+        self.assertEqual(
+            profiler.to_dict()["operations"]["query"]["histogram"][">=1s"], 1
+        )
+
+    def test_call_records_errors(self):
+        profiler = Profiler()
+        self.assertEqual(profiler.call("ok", lambda: [1, 2]), [1, 2])
+        with self.assertRaises(KeyError):
+            profiler.call("missing", {}.__getitem__, "key")
+
+        stats = profiler.snapshot()
+        self.assertEqual(stats["ok"].items, 2)
+        self.assertEqual(stats["missing"].errors, 1)
+
+    def test_call_unsized_result(self):
+        class Broken:
+            def __len__(self):
+                raise RuntimeError
+
+        profiler = Profiler()
+        profiler.call("none", lambda: None)
+        profiler.call("broken", Broken)
+
+        stats = profiler.snapshot()
+        self.assertEqual(stats["none"].items, 0)
+        self.assertEqual(stats["broken"].items, 0)
+
+    def test_profiled_only_when_enabled(self):
+        self.assertEqual(double(2), 4)
+        profiler = enable_profiling()
+        self.assertEqual(double(3), 6)
+        with self.assertRaises(ValueError):
+            asyncio.run(fail())
+
+        stats = profiler.snapshot()
+        self.assertEqual(stats["double"].calls, 1)
+        self.assertEqual(stats["fail"].errors, 1)
+
+    def test_instrumented_interface(self):
+        profiler = Profiler()
+        fake = FakeRosInterface(nodes=10)
+        ros = RosClient(instrument(fake, profiler))
+        topic_name = fake.list_topics()[0]
+
+        info = ros.get_entity_info(RosEntity.new_topic(topic_name))
+        self.assertEqual(info.name, topic_name)
+        self.assertEqual(ros.interface.list_topics(type=None), fake.list_topics())
+
+        stats = profiler.snapshot()
+        self.assertEqual(stats["get_topic_publishers"].calls, 1)
+        self.assertEqual(stats["list_topics"].calls, 1)
+        self.assertGreater(stats["get_topic_publishers"].items, 0)
+        self.assertEqual(ros.interface.version(), fake.version())
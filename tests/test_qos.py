@@ -0,0 +1,89 @@
+import pickle
+import unittest
+
+from rtui2.ros.interface import TopicEndpoint
+from rtui2.ros.qos import (
+    QoS,
+    find_incompatibilities,
+    incompatibilities,
+    seconds_from_nanoseconds,
+)
+
+DEFAULT = QoS("RELIABLE", "VOLATILE", "KEEP_LAST", 10)
+
+
+def qos(**kwargs) -> QoS:
+    values = {
+        "reliability": "RELIABLE",
+        "durability": "VOLATILE",
+        "history": "KEEP_LAST",
+        "depth": 10,
+    }
+    values.update(kwargs)
+    return QoS(**values)
+
+
+class TestQoS(unittest.TestCase):
+    def test_seconds_from_nanoseconds(self):
+        self.assertEqual(seconds_from_nanoseconds(1500000000), 1.5)
+        self.assertIsNone(seconds_from_nanoseconds(0))
+        self.assertIsNone(seconds_from_nanoseconds(2**63 - 1))
+
+    def test_compact_and_picklable(self):
+        self.assertFalse(hasattr(DEFAULT, "__dict__"))
+        self.assertEqual(pickle.loads(pickle.dumps(DEFAULT)), DEFAULT)
+        self.assertEqual(hash(qos()), hash(DEFAULT))
+
+    def test_compatible(self):
+        self.assertEqual(incompatibilities(DEFAULT, DEFAULT), [])
+        # a publisher may offer more than requested
+        self.assertEqual(
+            incompatibilities(
+                qos(durability="TRANSIENT_LOCAL"), qos(reliability="BEST_EFFORT")
+            ),
+            [],
+        )
+        self.assertEqual(incompatibilities(qos(deadline=0.1), qos(deadline=0.5)), [])
+
+    def test_incompatible(self):
+        cases = [
+            (qos(reliability="BEST_EFFORT"), qos(), "BEST_EFFORT publisher"),
+            (qos(), qos(durability="TRANSIENT_LOCAL"), "VOLATILE publisher"),
+            (qos(), qos(deadline=0.5), "deadline ∞ > subscription deadline 0.5 s"),
+            (qos(deadline=1.0), qos(deadline=0.5), "deadline 1 s >"),
+            (qos(), qos(liveliness="MANUAL_BY_TOPIC"), "AUTOMATIC publisher"),
+            (
+                qos(liveliness_lease_duration=2.0),
+                qos(liveliness_lease_duration=1.0),
+                "liveliness lease 2 s",
+            ),
+        ]
+        for publisher, subscriber, reason in cases:
+            with self.subTest(reason=reason):
+                reasons = incompatibilities(publisher, subscriber)
+                self.assertEqual(len(reasons), 1)
+                self.assertIn(reason, reasons[0])
+
+    def test_find_incompatibilities(self):
+        best_effort = qos(reliability="BEST_EFFORT")
+        found = find_incompatibilities(
+            [
+                TopicEndpoint("/pub", "T", best_effort),
+                TopicEndpoint("/pub2", "T", DEFAULT),
+                TopicEndpoint("/old", "T"),
+            ],
+            [
+                TopicEndpoint("/sub", "T", DEFAULT),
+                TopicEndpoint("/sub2", "T", best_effort),
+            ],
+        )
+        self.assertEqual(
+            [(f.publisher, f.subscriber) for f in found],
+            [
+                (
+                    TopicEndpoint("/pub", "T", best_effort),
+                    TopicEndpoint("/sub", "T", DEFAULT),
+                )
+            ],
+        )
+        self.assertIn("BEST_EFFORT publisher", found[0].reasons[0])
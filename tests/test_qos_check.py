@@ -0,0 +1,80 @@
+import io
+import json
+import unittest
+from unittest import mock
+
+from rtui2.qos_check import report_incompatibilities, sweep_incompatibilities
+from rtui2.ros import RosClient
+from rtui2.ros.interface import RosInterface, TopicEndpoint
+from rtui2.ros.qos import QoS
+
+RELIABLE = QoS("RELIABLE", "VOLATILE", "KEEP_LAST", 10)
+BEST_EFFORT = QoS("BEST_EFFORT", "VOLATILE", "KEEP_LAST", 10)
+
+
+def endpoints(topic_name: str) -> tuple[list, list]:
+    # every third topic has a BEST_EFFORT publisher and a RELIABLE subscriber
+    i = int(topic_name.rsplit("_", 1)[1])
+    publisher_qos = BEST_EFFORT if i % 3 == 0 else RELIABLE
+    return (
+        [TopicEndpoint(f"/pub_{i}", "T", publisher_qos)],
+        [
+            TopicEndpoint(f"/sub_{i}", "T", RELIABLE),
+            TopicEndpoint(f"/lax_{i}", "T", BEST_EFFORT),
+        ],
+    )
+
+
+def init_client(size: int = 10) -> tuple[RosClient, mock.Mock]:
+    interface = mock.Mock(spec=RosInterface)
+    interface.list_topics.return_value = [f"/topic_{i}" for i in range(size)]
+    interface.get_topic_names_and_types.return_value = [
+        (f"/topic_{i}", ["T"]) for i in range(size)
+    ]
+    interface.get_topic_endpoints.side_effect = lambda names: [
+        endpoints(name) for name in names
+    ]
+    return RosClient(interface), interface
+
+
+class TestQoSCheck(unittest.TestCase):
+    def test_sweep_in_batches(self):
+        ros, interface = init_client(size=250)
+        found = list(
+            sweep_incompatibilities(
+                ros, interface.list_topics(), batch_size=100, max_workers=3
+            )
+        )
+
+        self.assertEqual(interface.get_topic_endpoints.call_count, 3)
+        # in topic order whatever batch finishes first
+        self.assertEqual(
+            [f.topic for f in found], [f"/topic_{i}" for i in range(0, 250, 3)]
+        )
+        self.assertEqual(
+            (found[1].publisher, found[1].subscriber), ("/pub_3", "/sub_3")
+        )
+
+    def test_report_text(self):
+        ros, _ = init_client()
+        out = io.StringIO()
+        self.assertEqual(report_incompatibilities(ros, out=out), (10, 4))
+        self.assertTrue(
+            out.getvalue().startswith(
+                "/topic_0: /pub_0 -> /sub_0\n    BEST_EFFORT publisher"
+            )
+        )
+
+    def test_report_json_with_patterns(self):
+        ros, _ = init_client()
+        out = io.StringIO()
+        topics, found = report_incompatibilities(ros, ("/topic_3",), "json", out)
+        self.assertEqual((topics, found), (1, 1))
+        pair = json.loads(out.getvalue())
+        self.assertEqual(pair["topic"], "/topic_3")
+        self.assertEqual(pair["subscriber"], "/sub_3")
+
+    def test_report_unknown_format(self):
+        ros, _ = init_client()
+        with self.assertRaises(ValueError):
+            report_incompatibilities(ros, format="xml", out=io.StringIO())
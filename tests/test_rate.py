@@ -0,0 +1,98 @@
+import math
+import unittest
+
+from rtui2.utility.rate import RateMonitor, RateTable, format_bytes
+
+
+class TestRateMonitor(unittest.TestCase):
+    def test_rate_too_few_messages(self):
+        monitor = RateMonitor()
+        self.assertIsNone(monitor.stats(now=0.0))
+        monitor.record(10, stamp=0.0)
+        self.assertIsNone(monitor.stats(now=0.0))
+
+    def test_rate_stats(self):
+        monitor = RateMonitor()
+        for i in range(11):
+            monitor.record(100, stamp=i * 0.1)
+
+        stats = monitor.stats(now=1.0)
+        self.assertEqual(stats.count, 11)
+        self.assertAlmostEqual(stats.hz, 10.0)
+        self.assertAlmostEqual(stats.min_period, 0.1)
+        self.assertAlmostEqual(stats.max_period, 0.1)
+        self.assertAlmostEqual(stats.jitter, 0.0)
+        self.assertAlmostEqual(stats.bytes_per_sec, 1000.0)
+        self.assertAlmostEqual(stats.mean_size, 100.0)
+
+    def test_rate_ring_buffer_wraps(self):
+        monitor = RateMonitor(window_size=4)
+        for i in range(10):
+            monitor.record(i, stamp=float(i))
+
+        stats = monitor.stats(now=9.0)
+        self.assertEqual(stats.count, 4)
+        self.assertAlmostEqual(stats.hz, 1.0)
+        self.assertAlmostEqual(stats.mean_size, 7.5)
+
+    def test_rate_sliding_window(self):
+        monitor = RateMonitor(window_sec=1.0)
+        for i in range(10):
+            monitor.record(1, stamp=float(i))
+        monitor.record(1, stamp=9.5)
+
+        self.assertEqual(monitor.stats(now=9.5).count, 2)
+        self.assertIsNone(monitor.stats(now=20.0))
+
+    def test_rate_reset(self):
+        monitor = RateMonitor()
+        monitor.record(1, stamp=0.0)
+        monitor.record(1, stamp=1.0)
+        monitor.reset()
+        self.assertIsNone(monitor.stats(now=1.0))
+
+    def test_format_bytes(self):
+        self.assertEqual(format_bytes(999), "999 B")
+        self.assertEqual(format_bytes(1500), "1.5 KB")
+        self.assertEqual(format_bytes(30e6), "30.0 MB")
+
+
+class TestRateTable(unittest.TestCase):
+    def test_rate_table_rows(self):
+        table = RateTable(window_size=4, capacity=1)
+        rows = [table.add_row() for _ in range(3)]
+        self.assertEqual(rows, [0, 1, 2])
+        self.assertEqual(len(table), 3)
+
+        for i in range(11):
+            table.record(0, 100, stamp=i * 0.1)
+        table.record(1, 5, stamp=0.5)
+        for i in range(10):
+            table.record(2, i, stamp=float(i))
+
+        stats = table.stats(now=9.0)
+        self.assertEqual(stats.count.tolist(), [0, 0, 4])
+        self.assertTrue(math.isnan(stats.hz[0]))
+        self.assertTrue(math.isnan(stats.hz[1]))
+        self.assertAlmostEqual(stats.hz[2], 1.0)
+        self.assertAlmostEqual(stats.max_period[2], 1.0)
+        # sizes 6, 7, 8, 9 over 3 seconds, without the first
+        self.assertAlmostEqual(stats.bytes_per_sec[2], 8.0)
+
+    def test_rate_table_matches_monitor(self):
+        table = RateTable()
+        monitor = RateMonitor()
+        row = table.add_row()
+        for i, period in enumerate([0.1, 0.3, 0.2, 0.1, 0.5]):
+            stamp = i + period
+            table.record(row, 10 * i, stamp=stamp)
+            monitor.record(10 * i, stamp=stamp)
+
+        stats = table.stats(now=5.0)
+        expected = monitor.stats(now=5.0)
+        self.assertAlmostEqual(stats.hz[row], expected.hz)
+        self.assertAlmostEqual(stats.max_period[row], expected.max_period)
+        self.assertAlmostEqual(stats.bytes_per_sec[row], expected.bytes_per_sec)
+
+    def test_rate_table_empty(self):
+        self.assertEqual(len(RateTable().stats().hz), 0)
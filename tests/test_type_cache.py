@@ -0,0 +1,97 @@
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from rtui2.ros.interface.type_cache import INTERFACE_INDEX, MAX_CACHE_FILES, TypeCache
+
+
+class TestTypeCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache_dir = Path(self.tmp.name, "cache")
+        self.prefix = Path(self.tmp.name, "install")
+        self.index = self.prefix / INTERFACE_INDEX
+        self.index.mkdir(parents=True)
+        (self.index / "std_msgs").write_text("msg/String.msg")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def new_cache(self) -> TypeCache:
+        return TypeCache(self.cache_dir, str(self.prefix))
+
+    def test_type_cache_persists_types(self):
+        load = mock.Mock(return_value=["std_msgs/msg/String"])
+
+        self.assertEqual(self.new_cache().get_types("msg", load), load.return_value)
+        self.assertEqual(self.new_cache().get_types("msg", load), load.return_value)
+        self.assertEqual(load.call_count, 1)
+
+    def test_type_cache_persists_definitions(self):
+        load = mock.Mock(return_value="string data")
+
+        self.new_cache().get_definition("std_msgs/msg/String", load)
+        definition = self.new_cache().get_definition("std_msgs/msg/String", load)
+
+        self.assertEqual(definition, "string data")
+        self.assertEqual(load.call_count, 1)
+
+    def test_type_cache_invalidated_by_package_change(self):
+        load = mock.Mock(return_value=["std_msgs/msg/String"])
+        self.new_cache().get_types("msg", load)
+
+        (self.index / "std_msgs").touch()
+        stat = (self.index / "std_msgs").stat()
+        os.utime(self.index / "std_msgs", ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+        self.new_cache().get_types("msg", load)
+
+        self.assertEqual(load.call_count, 2)
+        # the cache of the previous package set is kept for switching back
+        self.assertEqual(len(list(self.cache_dir.glob("types-*.json"))), 2)
+
+    def test_type_cache_saves_in_batches(self):
+        cache = self.new_cache()
+        cache.get_definition("std_msgs/msg/String", lambda: "string data")
+        cache.get_definition("std_msgs/msg/Empty", lambda: "")
+
+        saved = json.loads(cache.path.read_text())["definitions"]
+        self.assertEqual(list(saved), ["std_msgs/msg/String"])
+
+        cache.flush()
+        saved = json.loads(cache.path.read_text())["definitions"]
+        self.assertEqual(list(saved), ["std_msgs/msg/String", "std_msgs/msg/Empty"])
+
+    def test_type_cache_prunes_least_recently_used(self):
+        self.cache_dir.mkdir()
+        for i in range(MAX_CACHE_FILES):
+            stale = self.cache_dir / f"types-{i}.json"
+            stale.write_text("{}")
+            os.utime(stale, (i, i))
+
+        cache = self.new_cache()
+        cache.get_types("msg", lambda: [])
+
+        caches = sorted(path.name for path in self.cache_dir.glob("types-*.json"))
+        self.assertEqual(len(caches), MAX_CACHE_FILES)
+        self.assertNotIn("types-0.json", caches)
+        self.assertIn(cache.path.name, caches)
+
+    def test_type_cache_invalidated_by_prefix_path(self):
+        load = mock.Mock(return_value=[])
+        self.new_cache().get_types("msg", load)
+        TypeCache(self.cache_dir, "/nonexistent").get_types("msg", load)
+
+        self.assertEqual(load.call_count, 2)
+
+    def test_type_cache_unwritable(self):
+        Path(self.cache_dir).write_text("not a directory")
+        load = mock.Mock(return_value=["std_msgs/msg/String"])
+
+        self.assertEqual(self.new_cache().get_types("msg", load), load.return_value)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,180 @@
+import asyncio
+import gc
+import unittest
+import warnings
+from unittest import mock
+
+from textual.app import App
+
+from rtui2.app.hz import HzApp
+from rtui2.app.inspect import InspectApp
+from rtui2.ros import AsyncRosClient, RosClient, RosEntity, RosEntityType
+from rtui2.ros.interface.fake import SUBSCRIBER_QOS, FakeRosInterface
+from rtui2.widgets import RosEntityGraphPanel, RosTypeDefinitionPanel
+
+
+async def wait_until(pilot, done):
+    for _ in range(1000):
+        if done():
+            return
+        await pilot.pause(0.01)
+    raise TimeoutError
+
+
+class TestWidgets(unittest.TestCase):
+    def setUp(self):
+        self.fake = FakeRosInterface(nodes=50)
+        self.ros = RosClient(self.fake)
+        self.warnings = warnings.catch_warnings(record=True)
+        self.caught = self.warnings.__enter__()
+        warnings.simplefilter("always", RuntimeWarning)
+
+    def tearDown(self):
+        self.ros.terminate()
+        # a worker cancelled before it started must not drop a coroutine
+        gc.collect()
+        self.warnings.__exit__(None, None, None)
+        never_awaited = [
+            str(w.message) for w in self.caught if "never awaited" in str(w.message)
+        ]
+        self.assertEqual(never_awaited, [])
+
+    async def select_rapidly(self, entities):
+        app = InspectApp(self.ros, RosEntityType.Node)
+        async with app.run_test() as pilot:
+            for _ in range(2):
+                for entity in entities:
+                    app.show_ros_entity(entity)
+                    # shorter than an update, so panels switch mid-update
+                    await pilot.pause(0.001)
+            # let the last updates finish
+            await pilot.pause(0.2)
+
+            self.assertIsNone(app._exception)
+            self.assertTrue(app.is_running)
+            self.assertEqual(app.screen._entity_name, entities[-1].name)
+
+    def test_rapid_selection(self):
+        entities = [
+            *(RosEntity.new_node(name) for name in self.fake.list_nodes()[:10]),
+            *(RosEntity.new_topic(name) for name in self.fake.list_topics()[:10]),
+            *(RosEntity.new_msg_type(name) for name in self.fake.list_msg_types()[:5]),
+        ]
+        asyncio.run(self.select_rapidly(entities))
+
+    async def refresh_graph(self, node_name, topic_name):
+        ros_async = AsyncRosClient(self.ros)
+        panel = RosEntityGraphPanel(ros_async, max_depth=2)
+        app = App()
+        async with app.run_test() as pilot:
+            await app.mount(panel)
+            panel.set_entity(RosEntity.new_node(node_name))
+            await wait_until(pilot, lambda: panel._tree is not None)
+
+            tree = panel._tree
+            children = list(tree.root.children)
+            children[0].collapse()
+
+            # the node subscribes one more topic
+            graph = self.fake.graph
+            graph.node_subscribers[node_name].append((topic_name, ""))
+            graph.subscribers[topic_name].append((node_name, SUBSCRIBER_QOS[0][0]))
+            self.ros.graph.invalidate()
+            panel.refresh_graph()
+            await wait_until(pilot, lambda: len(tree.root.children) > len(children))
+
+            self.assertIs(panel._tree, tree)
+            self.assertEqual(list(tree.root.children)[: len(children)], children)
+            self.assertEqual(tree.root.children[-1].data.name, topic_name)
+            self.assertFalse(children[0].is_expanded)
+        ros_async.shutdown()
+
+    def test_refresh_graph_keeps_expansion(self):
+        graph = self.fake.graph
+        node_name = next(name for name in graph.nodes if graph.node_subscribers[name])
+        subscribed = {topic for topic, _ in graph.node_subscribers[node_name]}
+        topic_name = next(name for name in graph.topics if name not in subscribed)
+        asyncio.run(self.refresh_graph(node_name, topic_name))
+
+    async def show_shared(self, dependencies, calls):
+        ros_async = AsyncRosClient(self.ros)
+        panel = RosEntityGraphPanel(ros_async, max_depth=3)
+        app = App()
+        async with app.run_test() as pilot:
+            await app.mount(panel)
+            panel.set_entity(RosEntity.new_node("/root"))
+            await wait_until(pilot, lambda: panel._tree is not None)
+
+            topic_a, topic_b = panel._tree.root.children
+            (shared,) = topic_a.children
+            (back_reference,) = topic_b.children
+            self.assertEqual(shared.data, back_reference.data)
+            self.assertTrue(shared.children)
+            self.assertFalse(back_reference.children)
+            self.assertTrue(str(back_reference.label).endswith("↩"))
+            # the shared node is queried once, and the cycle to /root refers back
+            (topic_c,) = shared.children
+            (root,) = topic_c.children
+            self.assertFalse(root.children)
+            self.assertEqual(calls.count(shared.data), 1)
+            self.assertEqual(len(calls), len(set(calls)))
+        ros_async.shutdown()
+
+    def test_graph_shared_subtree(self):
+        root = RosEntity.new_node("/root")
+        shared = RosEntity.new_node("/shared")
+        topic_a, topic_b, topic_c = (
+            RosEntity.new_topic(name) for name in ("/a", "/b", "/c")
+        )
+        dependencies = {
+            root: [topic_a, topic_b],
+            topic_a: [shared],
+            topic_b: [shared],
+            shared: [topic_c],
+            topic_c: [root],
+        }
+        calls = []
+
+        def get_dependencies(graph, entity):
+            calls.append(entity)
+            return dependencies[entity]
+
+        with mock.patch("rtui2.widgets.graph_panel.get_dependencies", get_dependencies):
+            asyncio.run(self.show_shared(dependencies, calls))
+
+    async def quit_while_syncing(self, app):
+        async with app.run_test() as pilot:
+            await wait_until(pilot, lambda: app._rows)
+
+    def test_hz_quit_unsubscribes(self):
+        ros = RosClient(FakeRosInterface(nodes=50, latency=0.002))
+        try:
+            for _ in range(5):
+                app = HzApp(ros)
+                asyncio.run(self.quit_while_syncing(app))
+                # a sync cancelled by quitting subscribes nothing more
+                with app._sync_lock:
+                    self.assertTrue(app._unmounted)
+                    self.assertEqual(ros._raw_subscriptions, {})
+        finally:
+            ros.terminate()
+
+    async def show_definition(self, entity):
+        ros_async = AsyncRosClient(self.ros)
+        panel = RosTypeDefinitionPanel(ros_async, entity)
+        app = App()
+        async with app.run_test() as pilot:
+            await app.mount(panel)
+            await wait_until(pilot, lambda: "Loading" not in str(panel.renderable))
+
+            self.assertIsNone(app._exception)
+            self.assertTrue(app.is_running)
+            self.assertIn("Fail to get definition", str(panel.renderable))
+        ros_async.shutdown()
+
+    def test_definition_error(self):
+        entity = RosEntity.new_msg_type(self.fake.list_msg_types()[0])
+        with mock.patch.object(
+            self.fake, "get_msg_definition", side_effect=LookupError("no package")
+        ):
+            asyncio.run(self.show_definition(entity))
@@ -5,7 +5,7 @@ from textual.containers import ScrollableContainer
 from textual.widgets import Static
 
 from rtui2.event import RosEntitySelected
-from rtui2.ros import RosClient, RosEntity, RosEntityType
+from rtui2.ros import AsyncRosClient, RosClient, RosEntity, RosEntityType
 from rtui2.widgets import RosEntityInfoPanel
 
 
@@ -29,7 +29,7 @@ class ExampleApp(App):
     def compose(self) -> ComposeResult:
         with ScrollableContainer(id="upper"):
             yield RosEntityInfoPanel(
-                self.ros,
+                AsyncRosClient(self.ros),
                 self.entity,
                 5.0,
             )
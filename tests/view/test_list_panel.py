@@ -5,7 +5,7 @@ from textual.containers import ScrollableContainer
 from textual.widgets import Static
 
 from rtui2.event import RosEntitySelected
-from rtui2.ros import RosClient, RosEntityType
+from rtui2.ros import AsyncRosClient, RosClient, RosEntityType
 from rtui2.widgets import RosEntityListPanel
 
 
@@ -29,7 +29,7 @@ class ExampleApp(App):
     def compose(self) -> ComposeResult:
         with ScrollableContainer(id="upper"):
             yield RosEntityListPanel(
-                self.ros,
+                AsyncRosClient(self.ros),
                 self.entity_type,
             )
         yield self.debug